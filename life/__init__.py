@@ -1,3 +1,15 @@
-from .cli import main
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cli import main
 
 __all__ = ["main"]
+
+
+def __getattr__(name: str):
+    # Lazy so `life.client` can start without importing the CLI and database layers.
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,200 @@
+"""Run many `life` commands in one process and one transaction (`life batch`).
+
+Input is read line by line: each line is a shell-quoted command (a leading `life` is
+optional, blank lines and `#` comments are skipped) or a JSON array of argv strings.
+A whole-document JSON array of commands, each a string or argv array, also works.
+
+Every command runs in its own savepoint. By default the first failure rolls the whole
+batch back; with keep_going only the failing command's writes are undone.
+"""
+
+import io
+import json
+import shlex
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from fncli import cli
+
+from . import db
+from .commands import COMMANDS, command_for
+from .lib.errors import echo, exit_error
+
+__all__ = ["BatchResult", "parse_commands", "run_batch"]
+
+# Commands that would escape the batch transaction: they open their own transaction or
+# connection, close the connection pool or block while holding the BEGIN.
+_NOT_BATCHABLE = {
+    "life batch",
+    "life bench",
+    "life db backup",
+    "life db migrate",
+    "life db restore",
+    "life import",
+    "life serve",
+}
+# Modules that write through life.comms' own connections, which a rollback never reaches.
+_NOT_BATCHABLE_MODULES = {"life.accounts", "life.email", "life.signal"}
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    index: int
+    argv: tuple[str, ...]
+    status: str  # ok | failed | rolled back | skipped
+    code: int | None
+    stdout: str = ""
+    stderr: str = ""
+
+
+class _CommandError(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+class _AbortError(Exception):
+    pass
+
+
+def _argv(item: object, where: str) -> list[str]:
+    if isinstance(item, str):
+        try:
+            argv = shlex.split(item, comments=True)
+        except ValueError as e:
+            raise ValueError(f"{where}: {e}") from None
+    elif isinstance(item, list) and all(isinstance(arg, str) for arg in item):
+        argv = list(item)
+    else:
+        raise ValueError(f"{where}: expected a command string or an array of strings")
+    if argv[:1] == ["life"]:
+        argv = argv[1:]
+    _check_batchable(argv, where)
+    return argv
+
+
+def _check_batchable(argv: list[str], where: str) -> None:
+    command = command_for(["life", *argv])
+    if command in _NOT_BATCHABLE or (command and COMMANDS[command][0] in _NOT_BATCHABLE_MODULES):
+        raise ValueError(f"{where}: `{command}` cannot run inside a batch")
+
+
+def parse_commands(text: str) -> list[list[str]]:
+    """Split batch input into argv lists (without the leading `life`)."""
+    stripped = text.strip()
+    if stripped.startswith("["):
+        try:
+            document = json.loads(stripped)
+        except json.JSONDecodeError:
+            document = None
+        if isinstance(document, list) and not all(isinstance(item, str) for item in document):
+            commands = [_argv(item, f"command {i}") for i, item in enumerate(document, start=1)]
+            return [argv for argv in commands if argv]
+
+    commands = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        item: object = line
+        if line.startswith("["):
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"line {lineno}: {e}") from None
+        argv = _argv(item, f"line {lineno}")
+        if argv:
+            commands.append(argv)
+    return commands
+
+
+def _dispatch(argv: list[str]) -> int:
+    from .cli import dispatch
+
+    try:
+        return dispatch(["life", *argv])
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        sys.stderr.write(f"{e.code}\n")
+        return 1
+
+
+def _run(argv: list[str]) -> tuple[int, str, str]:
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with db.get_db(), redirect_stdout(out), redirect_stderr(err):
+            code = _dispatch(argv)
+            if code:
+                raise _CommandError(code)
+    except _CommandError as e:
+        code = e.code
+    except Exception as e:
+        err.write(f"{type(e).__name__}: {e}\n")
+        code = 1
+    return code, out.getvalue(), err.getvalue()
+
+
+def run_batch(commands: list[list[str]], keep_going: bool = False) -> list[BatchResult]:
+    """Dispatch each argv in-process against one connection and one transaction.
+
+    Without keep_going the first failure stops the batch: earlier commands come back
+    'rolled back' and later ones 'skipped'. With it, failed commands are undone and
+    the rest commit together at the end. Commands that would escape the transaction
+    are rejected with ValueError before any runs.
+    """
+    for index, argv in enumerate(commands, start=1):
+        _check_batchable(argv, f"command {index}")
+    results: list[BatchResult] = []
+    try:
+        with db.get_db() as conn:
+            if conn.in_transaction:
+                raise ValueError("batch must run outside an open transaction")
+            conn.execute("BEGIN")
+            for index, argv in enumerate(commands, start=1):
+                code, out, err = _run(argv)
+                status = "failed" if code else "ok"
+                results.append(BatchResult(index, tuple(argv), status, code, out, err))
+                if code and not keep_going:
+                    raise _AbortError
+    except _AbortError:
+        results = [replace(r, status="rolled back") if r.status == "ok" else r for r in results]
+        results += [
+            BatchResult(index, tuple(argv), "skipped", None)
+            for index, argv in enumerate(commands[len(results) :], start=len(results) + 1)
+        ]
+    return results
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+
+
+@cli("life")
+def batch(from_: str | None = None, keep_going: bool = False, json_: bool = False) -> None:
+    """Run commands from stdin or --from FILE in one transaction (--keep-going, --json)"""
+    try:
+        if from_ and from_ != "-":
+            text = Path(from_).expanduser().read_text(encoding="utf-8")
+        else:
+            text = sys.stdin.read()
+        results = run_batch(parse_commands(text), keep_going=keep_going)
+    except (OSError, ValueError) as e:
+        exit_error(f"batch failed: {e}")
+
+    for r in results:
+        if json_:
+            echo(json.dumps(asdict(r), ensure_ascii=False))
+            continue
+        echo(f"[{r.index}] {r.status:<11} life {shlex.join(r.argv)}")
+        for line in (r.stdout + r.stderr).splitlines():
+            echo(f"    {line}")
+
+    failed = sum(r.status == "failed" for r in results)
+    committed = sum(r.status == "ok" for r in results)
+    skipped = len(results) - committed - failed
+    if not json_:
+        echo(f"{committed} committed, {failed} failed, {skipped} not applied")
+    if failed:
+        sys.exit(1)
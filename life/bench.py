@@ -0,0 +1,447 @@
+"""Synthetic large-database generator and latency/memory benchmarks (`life bench`).
+
+generate() seeds a database with years of history; the same seed, scale and anchor
+always produce the same rows. run_bench() times the hot commands against it and
+records p50/p95 latency and peak traced memory per scenario.
+"""
+
+import contextlib
+import functools
+import io
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from fncli import cli
+
+from . import config, db
+from .lib import clock
+from .lib.errors import echo, exit_error
+from .models import DashboardSnapshot, Task
+
+__all__ = [
+    "FULL_SCALE",
+    "RENDER_PENDING",
+    "SCENARIOS",
+    "compare",
+    "generate",
+    "render_snapshot",
+    "run_bench",
+]
+
+# Row targets at scale 1.0.
+FULL_SCALE = {
+    "tasks": 100_000,
+    "habits": 500,
+    "years": 5,
+    "tags_per_task": 10,
+    "audit_log": 200_000,
+    "signal_messages": 100_000,
+}
+
+# Pending tasks on the synthetic dashboard the render scenario draws.
+RENDER_PENDING = 5_000
+
+# fmt: off
+_VERBS = ["call", "email", "book", "pay", "review", "plan", "draft", "fix", "water", "clean",
+          "buy", "order", "file", "renew"]
+_NOUNS = ["dentist", "invoice", "garden", "taxes", "passport", "insurance", "car", "landlord",
+          "bank", "report", "mum", "gym", "groceries", "laptop", "flight", "visa", "lease",
+          "doctor", "plumber", "accountant"]
+_TAGS = ["finance", "legal", "janice", "health", "home", "work", "admin", "errands", "social",
+         "travel", *(f"area-{i}" for i in range(190))]
+# fmt: on
+_ACTIONS = ("archive", "delete", "flag", "reply")
+
+# (id, content, focus, scheduled_date, created, completed_at, parent_id, blocked_by)
+_TaskRow = tuple[str, str, int, str | None, str, str | None, str | None, str | None]
+# (id, content, created, archived_at, parent_id)
+_HabitRow = tuple[str, str, str, str | None, str | None]
+
+
+def _rng(seed: int, section: str) -> random.Random:
+    return random.Random(f"{seed}:{section}")  # noqa: S311
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _stamp(day: date, rng: random.Random) -> str:
+    return f"{day.isoformat()}T{rng.randint(6, 22):02d}:{rng.randint(0, 59):02d}:00"
+
+
+def _tasks(seed: int, n: int, anchor: date, days: int) -> list[_TaskRow]:
+    rng = _rng(seed, "tasks")
+    rows: list[_TaskRow] = []
+    roots: list[str] = []
+    pending: list[str] = []
+    for i in range(n):
+        task_id = _uuid(rng)
+        created = anchor - timedelta(days=rng.randint(0, days))
+        done = created + timedelta(days=rng.randint(0, 30))
+        completed_at = _stamp(done, rng) if rng.random() < 0.85 and done <= anchor else None
+        parent_id = rng.choice(roots) if roots and rng.random() < 0.2 else None
+        blocked_by = (
+            rng.choice(pending) if pending and not completed_at and rng.random() < 0.05 else None
+        )
+        scheduled = (
+            (anchor + timedelta(days=rng.randint(-14, 30))).isoformat()
+            if not completed_at and rng.random() < 0.3
+            else None
+        )
+        content = f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} {rng.choice(_NOUNS)} {i}"
+        rows.append(
+            (task_id, content, int(rng.random() < 0.01), scheduled, _stamp(created, rng),
+             completed_at, parent_id, blocked_by)
+        )  # fmt: skip
+        if parent_id is None:
+            roots.append(task_id)
+        if completed_at is None:
+            pending.append(task_id)
+    return rows
+
+
+def _task_tags(seed: int, task_ids: list[str], per_task: int) -> Iterator[tuple[str, str]]:
+    rng = _rng(seed, "tags")
+    for task_id in task_ids:
+        for tag in rng.sample(_TAGS, rng.randint(max(1, per_task // 2), per_task * 3 // 2)):
+            yield task_id, tag
+
+
+def _mutations(
+    seed: int, tasks: list[_TaskRow], anchor: date
+) -> Iterator[tuple[str, str, None, str, str | None, str]]:
+    rng = _rng(seed, "mutations")
+    for row in tasks:
+        created = date.fromisoformat(row[4][:10])
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 3))):
+            day = min(anchor, created + timedelta(days=rng.randint(0, 60)))
+            reason = rng.choice(("overdue_reset", "defer", None))
+            yield row[0], "scheduled_date", None, day.isoformat(), reason, _stamp(day, rng)
+
+
+def _habits(seed: int, n: int, anchor: date, days: int) -> list[_HabitRow]:
+    rng = _rng(seed, "habits")
+    rows: list[_HabitRow] = []
+    for i in range(n):
+        habit_id = _uuid(rng)
+        parent_id = rows[rng.randrange(len(rows))][0] if rows and rng.random() < 0.1 else None
+        created = anchor - timedelta(days=days - rng.randint(0, 90))
+        archived = _stamp(anchor, rng) if rng.random() < 0.1 else None
+        content = f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} daily {i}"
+        rows.append((habit_id, content, _stamp(created, rng), archived, parent_id))
+    return rows
+
+
+def _checks(seed: int, habits: list[_HabitRow], anchor: date) -> Iterator[tuple[str, str, str]]:
+    rng = _rng(seed, "checks")
+    for habit_id, _, created, _, _ in habits:
+        rate = rng.uniform(0.3, 0.95)
+        day = date.fromisoformat(created[:10])
+        while day <= anchor:
+            if rng.random() < rate:
+                yield habit_id, day.isoformat(), _stamp(day, rng)
+            day += timedelta(days=1)
+
+
+def _audit(seed: int, n: int, anchor: date, days: int) -> Iterator[tuple[str, str, str, str]]:
+    rng = _rng(seed, "audit")
+    for _ in range(n):
+        day = anchor - timedelta(days=rng.randint(0, days))
+        stamp = f"{day.isoformat()} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+        yield rng.choice(_ACTIONS), "thread", f"thread-{rng.getrandbits(40):x}", stamp
+
+
+def _signal(seed: int, n: int, anchor: date, days: int) -> Iterator[tuple[object, ...]]:
+    rng = _rng(seed, "signal")
+    senders = [f"+6140000{i:04d}" for i in range(200)]
+    for i in range(n):
+        day = anchor - timedelta(days=rng.randint(0, days))
+        sent = datetime.combine(day, datetime.min.time()) + timedelta(seconds=rng.randint(0, 86399))
+        words = " ".join(rng.choices(_VERBS + _NOUNS, k=rng.randint(3, 12)))
+        yield (
+            f"sig-{i}", "+61400000000", rng.choice(senders), None, words,
+            int(sent.timestamp() * 1000), None, sent.isoformat(), sent.isoformat() if rng.random() < 0.9 else None,
+        )  # fmt: skip
+
+
+def generate(
+    db_path: Path, scale: float = 1.0, seed: int = 0, anchor: date | None = None
+) -> dict[str, int]:
+    """Seed a fresh database at db_path; returns row counts per table."""
+    anchor = anchor or clock.today()
+    days = FULL_SCALE["years"] * 365
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db.init(db_path)
+
+    tasks = _tasks(seed, max(1, int(FULL_SCALE["tasks"] * scale)), anchor, days)
+    habits = _habits(seed, max(1, int(FULL_SCALE["habits"] * scale)), anchor, days)
+    with db.get_db(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO tasks (id, content, focus, scheduled_date, created, completed_at, parent_id, blocked_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            tasks,
+        )
+        # Per-row tag triggers rewrite FTS docs one tag at a time; index the tags once instead.
+        with db.without_triggers(conn, "tags_fts_insert", "search_fts_tag_insert"):
+            conn.executemany(
+                "INSERT INTO tags (task_id, tag) VALUES (?, ?)",
+                _task_tags(seed, [row[0] for row in tasks], FULL_SCALE["tags_per_task"]),
+            )
+            conn.execute("INSERT INTO tags_fts(tags_fts) VALUES ('rebuild')")
+            conn.execute(
+                "UPDATE search_fts SET tags = COALESCE((SELECT group_concat(tag, ' ') FROM tags WHERE task_id = search_fts.ref_id), '') WHERE kind = 'task'"
+            )
+        conn.executemany(
+            "INSERT INTO task_mutations (task_id, field, old_value, new_value, reason, mutated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            _mutations(seed, tasks, anchor),
+        )
+        conn.executemany(
+            "INSERT INTO habits (id, content, created, archived_at, parent_id) VALUES (?, ?, ?, ?, ?)",
+            habits,
+        )
+        conn.executemany(
+            "INSERT INTO tags (habit_id, tag) VALUES (?, ?)",
+            ((row[0], _TAGS[i % 10]) for i, row in enumerate(habits)),
+        )
+        conn.executemany(
+            "INSERT INTO checks (habit_id, check_date, completed_at) VALUES (?, ?, ?)",
+            _checks(seed, habits, anchor),
+        )
+        conn.executemany(
+            "INSERT INTO audit_log (action, entity_type, entity_id, timestamp) VALUES (?, ?, ?, ?)",
+            _audit(seed, int(FULL_SCALE["audit_log"] * scale), anchor, days),
+        )
+        conn.executemany(
+            "INSERT INTO signal_messages (id, account_phone, sender_phone, sender_name, body, timestamp, group_id, received_at, read_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _signal(seed, int(FULL_SCALE["signal_messages"] * scale), anchor, days),
+        )
+        tables = (
+            "tasks",
+            "tags",
+            "task_mutations",
+            "habits",
+            "checks",
+            "audit_log",
+            "signal_messages",
+        )
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+            for table in tables
+        }
+    db.close_all()
+    return counts
+
+
+def _dispatch(*argv: str) -> Callable[[], object]:
+    def run() -> object:
+        from .cli import dispatch
+
+        return dispatch(["life", *argv])
+
+    return run
+
+
+def _resolve() -> None:
+    """UUID prefix, exact content and a substring ref for the newest pending task."""
+    from .tasks import find_task
+
+    with db.get_db() as conn:
+        task_id, content = conn.execute(
+            "SELECT id, content FROM tasks WHERE completed_at IS NULL ORDER BY rowid DESC LIMIT 1"
+        ).fetchone()
+    for ref in (task_id[:8], content, content[1:]):
+        find_task(ref)
+
+
+@functools.cache
+def render_snapshot(n: int, seed: int, anchor: date) -> DashboardSnapshot:
+    """n pending tasks shaped like _tasks(): a fifth subtasks, some blocked, a third scheduled."""
+    rng = _rng(seed, "render")
+    pending: list[Task] = []
+    roots: list[str] = []
+    for i in range(n):
+        task_id = _uuid(rng)
+        parent_id = rng.choice(roots) if roots and rng.random() < 0.2 else None
+        scheduled = anchor + timedelta(days=rng.randint(-14, 30)) if rng.random() < 0.3 else None
+        pending.append(
+            Task(
+                id=task_id,
+                content=f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} {rng.choice(_NOUNS)} {i}",
+                focus=rng.random() < 0.01,
+                scheduled_date=scheduled,
+                created=datetime.fromisoformat(
+                    _stamp(anchor - timedelta(days=rng.randint(0, 365)), rng)
+                ),
+                completed_at=None,
+                parent_id=parent_id,
+                blocked_by=rng.choice(pending).id if pending and rng.random() < 0.05 else None,
+                tags=rng.sample(_TAGS[:20], rng.randint(0, 3)),
+            )
+        )
+        if parent_id is None:
+            roots.append(task_id)
+    return DashboardSnapshot(pending=pending, habits=[], completed_today=[])
+
+
+def _render() -> None:
+    """Dashboard rendering alone, on RENDER_PENDING in-memory tasks."""
+    from .lib.render import render_dashboard
+
+    render_dashboard(render_snapshot(RENDER_PENDING, 0, clock.today()))
+
+
+SCENARIOS: dict[str, Callable[[], object]] = {
+    "dashboard": _dispatch("dashboard"),
+    "status": _dispatch("status"),
+    "habits": _dispatch("habits"),
+    "search": _dispatch("search", "dentist", "invoice"),
+    "resolve": _resolve,
+    "momentum": _dispatch("momentum"),
+    "render": _render,
+}
+
+
+def _measure(fn: Callable[[], object], runs: int) -> dict[str, float]:
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        fn()
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+            sink.seek(0)
+            sink.truncate()
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    cuts = (
+        statistics.quantiles(samples, n=20, method="inclusive")
+        if len(samples) > 1
+        else samples * 19
+    )
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(cuts[18], 3),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_bench(db_path: Path, runs: int = 20, scenarios: list[str] | None = None) -> dict[str, Any]:
+    """Time each scenario against db_path; returns {"meta": ..., "scenarios": {name: stats}}."""
+    names = scenarios or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    saved = config.DB_PATH
+    config.DB_PATH = db_path
+    try:
+        db.init(db_path)
+        results = {}
+        for name in names:
+            try:
+                results[name] = _measure(SCENARIOS[name], runs)
+            except SystemExit as e:
+                raise ValueError(f"scenario {name} exited with {e.code}") from e
+    finally:
+        db.close_all()
+        config.DB_PATH = saved
+    return {
+        "meta": {
+            "db": str(db_path),
+            "runs": runs,
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.25
+) -> list[tuple[str, str, float, float, bool]]:
+    """(scenario, metric, baseline, current, regressed) for every metric both runs share."""
+    rows = []
+    for name, stats in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric, value in stats.items():
+            if metric in base:
+                rows.append(
+                    (name, metric, base[metric], value, value > base[metric] * (1 + tolerance))
+                )
+    return rows
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+
+
+@cli("life")
+def bench(
+    runs: int = 20,
+    scale: float = 1.0,
+    seed: int = 0,
+    only: str | None = None,
+    regen: bool = False,
+    save_baseline: bool = False,
+    tolerance: float = 0.25,
+) -> None:
+    """Benchmark hot commands on a synthetic DB: p50/p95 and peak memory vs. baseline"""
+    bench_dir = config.LIFE_DIR / "bench"
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    db_path = bench_dir / f"seed{seed}-x{scale:g}.db"
+    if regen or not db_path.exists():
+        echo(f"generating {db_path.name} ...")
+        counts = generate(db_path, scale=scale, seed=seed)
+        echo("  " + ", ".join(f"{table} {n}" for table, n in counts.items()))
+
+    try:
+        result = run_bench(db_path, runs=runs, scenarios=only.split(",") if only else None)
+    except ValueError as e:
+        exit_error(str(e))
+    result["meta"].update(scale=scale, seed=seed)
+
+    out = bench_dir / f"{datetime.now():%Y%m%dT%H%M%S}-x{scale:g}.json"
+    out.write_text(json.dumps(result, indent=2) + "\n")
+    baseline_path = bench_dir / f"baseline-x{scale:g}.json"
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+
+    deltas = (
+        {(n, m): (b, r) for n, m, b, _, r in compare(result, baseline, tolerance)}
+        if baseline
+        else {}
+    )
+    for name, stats in result["scenarios"].items():
+        cells = []
+        for metric, value in stats.items():
+            cell = f"{metric} {value:g}"
+            if (name, metric) in deltas:
+                base, regressed = deltas[(name, metric)]
+                change = (value / base - 1) * 100 if base else 0.0
+                cell += f" ({change:+.0f}%{' !' if regressed else ''})"
+            cells.append(cell)
+        echo(f"{name:<10} " + "  ".join(cells))
+    echo(str(out))
+
+    if save_baseline:
+        baseline_path.write_text(json.dumps(result, indent=2) + "\n")
+        echo(f"baseline → {baseline_path}")
+    elif any(regressed for _, regressed in deltas.values()):
+        exit_error(f"regressed beyond {tolerance:.0%} of {baseline_path.name}")
@@ -1,39 +1,90 @@
+import os
 import sys
 
-from . import db
-from . import accounts as _accounts
-from . import dash as _dash
-from . import dates as _dates
-from . import email as _email
-from . import interventions as _interventions
-from . import items as _items
-from . import mood as _mood
-from . import patterns as _patterns
-from . import signal as _signal
-from . import tasks as _tasks
-from . import habits as _habits
-from . import tags as _tags
-from . import steward as _steward
-
-_ = (
-    _steward,
-    _accounts, _dash, _dates, _email, _interventions, _items, _mood, _patterns, _signal, _tasks, _habits, _tags,
-)
 
+def load_commands(argv: list[str]) -> None:
+    """Import only the command modules argv can dispatch to."""
+    from importlib import import_module
 
-def main():
-    db.init()
-    from fncli import dispatch
+    from .commands import modules_for
+
+    for module in sorted(modules_for(argv)):
+        import_module(module)
+
+
+def dispatch(argv: list[str]) -> int:
+    from fncli import dispatch as _dispatch
+
+    from . import db
+
+    load_commands(argv)
+    with db.read_scope():
+        return _dispatch(argv)
 
-    user_args = sys.argv[1:]
+
+def _report_db_stats() -> None:
+    from . import db
+
+    stats = db.connection_stats()
+    reads = db.read_cache_stats()
+    sys.stderr.write(
+        f"db: {stats['opened']} opened, {stats['acquired']} acquired, "
+        f"reads: {reads['hits']} cached, {reads['misses']} queried\n"
+    )
+
+
+def run(user_args: list[str]) -> int:
+    """Run one invocation's arguments (bare or -v shows the dashboard); exit code."""
     if not user_args or user_args == ["-v"] or user_args == ["--verbose"]:
+        from . import db
         from .dash import dashboard
 
-        dashboard(verbose="--verbose" in user_args or "-v" in user_args)
+        with db.read_scope():
+            dashboard(verbose="--verbose" in user_args or "-v" in user_args)
+        return 0
+    return dispatch(["life", *user_args])
+
+
+def _render_cached(verbose: bool) -> None:
+    """Draw the dashboard and keep it for the next invocation with nothing changed."""
+    from . import dashcache, db
+    from .dash import render
+
+    # Keyed before loading, so a commit landing mid-render can only cause a miss.
+    key = dashcache.cache_key(verbose)
+    with db.read_scope():
+        output = render(verbose)
+    if key:
+        dashcache.store(key, output)
+    sys.stdout.write(output)
+
+
+def main():
+    argv = sys.argv[1:]
+    # A cached dashboard is served before SQLite or any domain module is imported.
+    from . import dashcache
+
+    cached = dashcache.lookup(argv)
+    if cached is not None:
+        sys.stdout.write(cached)
+        return
+
+    from . import db
+
+    db.init()
+
+    if os.environ.get("LIFE_DEBUG"):
+        import atexit
+
+        atexit.register(_report_db_stats)
+
+    verbose = dashcache.dashboard_verbose(argv)
+    if verbose is not None:
+        _render_cached(verbose)
         return
-    argv = ["life", *user_args]
-    code = dispatch(argv)
-    sys.exit(code)
+    code = run(argv)
+    if code:
+        sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""Thin client for `life serve`; runs the command in-process when no server is up.
+
+Stdlib only, so forwarding costs interpreter start-up and nothing more. The wire
+protocol is newline-delimited JSON over the Unix socket at config.SOCKET_PATH:
+
+    client → {"argv": [...], "cwd": "...", "env": {...}, "tty": [stdin, stdout, stderr]}
+    server → {"out": "..."} | {"err": "..."}    output, streamed as written
+    server → {"stdin": "read" | "line"}         the command is reading stdin
+    client → {"data": "..."}                    all of stdin, or its next line
+    server → {"exit": 0}                        last frame
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import IO, Any
+
+from .config import SOCKET_PATH
+from .dashcache import lookup
+
+__all__ = ["forward", "main", "recv", "send"]
+
+
+def send(stream: IO[bytes], frame: dict[str, Any]) -> None:
+    stream.write(json.dumps(frame, ensure_ascii=False).encode() + b"\n")
+    stream.flush()
+
+
+def recv(stream: IO[bytes]) -> dict[str, Any] | None:
+    line = stream.readline()
+    return json.loads(line) if line else None
+
+
+def forward(argv: list[str], socket_path: Path = SOCKET_PATH) -> int | None:
+    """Run argv on the server, relaying output and stdin; None if no server answers."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    with sock, sock.makefile("rb") as reader, sock.makefile("wb") as writer:
+        send(
+            writer,
+            {
+                "argv": argv,
+                "cwd": str(Path.cwd()),
+                "env": dict(os.environ),
+                "tty": [sys.stdin.isatty(), sys.stdout.isatty(), sys.stderr.isatty()],
+            },
+        )
+        while (frame := recv(reader)) is not None:
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+                sys.stdout.flush()
+            elif "err" in frame:
+                sys.stderr.write(frame["err"])
+                sys.stderr.flush()
+            elif "stdin" in frame:
+                data = sys.stdin.read() if frame["stdin"] == "read" else sys.stdin.readline()
+                send(writer, {"data": data})
+            elif "exit" in frame:
+                return frame["exit"]
+    sys.stderr.write("life serve: connection closed before the command finished\n")
+    return 1
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    cached = lookup(argv)
+    if cached is not None:
+        sys.stdout.write(cached)
+        return
+    if argv[:1] != ["serve"]:
+        code = forward(argv)
+        if code is not None:
+            sys.exit(code)
+
+    from .cli import main as run_in_process
+
+    run_in_process()
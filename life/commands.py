@@ -0,0 +1,159 @@
+"""Command manifest: fncli key → (module, function).
+
+Lets `life.cli` import only the module behind the invoked command.
+Regenerate with `python -m life.commands` after adding, moving or renaming
+an @cli command.
+"""
+
+from pathlib import Path
+
+__all__ = ["COMMANDS", "build_manifest", "command_for", "modules_for"]
+
+# fmt: off
+COMMANDS: dict[str, tuple[str, str]] = {
+    "life accounts link": ("life.accounts", "link"),
+    "life accounts list": ("life.accounts", "accounts_list"),
+    "life accounts unlink": ("life.accounts", "unlink"),
+    "life add": ("life.items", "add"),
+    "life archive": ("life.habits", "archive"),
+    "life auto": ("life.steward.auto", "auto"),
+    "life batch": ("life.batch", "batch"),
+    "life bench": ("life.bench", "bench"),
+    "life block": ("life.tasks", "block"),
+    "life cancel": ("life.tasks", "cancel"),
+    "life check": ("life.items", "check"),
+    "life dashboard": ("life.dash", "dashboard"),
+    "life dates add": ("life.dates", "add"),
+    "life dates list": ("life.dates", "ls"),
+    "life dates rm": ("life.dates", "rm"),
+    "life db backup": ("life.db", "db_backup"),
+    "life db health": ("life.db", "db_health"),
+    "life db migrate": ("life.db", "db_migrate"),
+    "life db restore": ("life.db", "db_restore"),
+    "life defer": ("life.tasks", "defer"),
+    "life done": ("life.items", "done"),
+    "life due": ("life.tasks", "due"),
+    "life email approve": ("life.email", "approve_draft"),
+    "life email approve-proposal": ("life.email", "approve_proposal"),
+    "life email archive": ("life.email", "archive"),
+    "life email clear": ("life.email", "clear"),
+    "life email compose": ("life.email", "compose"),
+    "life email contacts": ("life.email", "contacts"),
+    "life email delete": ("life.email", "delete"),
+    "life email digest": ("life.email", "digest"),
+    "life email draft": ("life.email", "draft_show"),
+    "life email draft-reply": ("life.email", "draft_reply"),
+    "life email drafts": ("life.email", "drafts_list"),
+    "life email flag": ("life.email", "flag"),
+    "life email inbox": ("life.email", "inbox"),
+    "life email reply": ("life.email", "reply"),
+    "life email resolve": ("life.email", "resolve"),
+    "life email review": ("life.email", "review"),
+    "life email rules": ("life.email", "rules"),
+    "life email send": ("life.email", "send_draft"),
+    "life email senders": ("life.email", "senders"),
+    "life email snooze": ("life.email", "snooze"),
+    "life email stats": ("life.email", "stats"),
+    "life email summarize": ("life.email", "summarize"),
+    "life email thread": ("life.email", "thread"),
+    "life email threads": ("life.email", "threads"),
+    "life email triage": ("life.email", "triage"),
+    "life export": ("life.export", "export"),
+    "life focus": ("life.tasks", "focus"),
+    "life habits": ("life.habits", "habits"),
+    "life import": ("life.export", "import_"),
+    "life momentum": ("life.dash", "momentum"),
+    "life mood log": ("life.mood", "log"),
+    "life mood rm": ("life.mood", "rm"),
+    "life mood show": ("life.mood", "show"),
+    "life now": ("life.tasks", "now"),
+    "life pattern add": ("life.patterns", "add"),
+    "life pattern log": ("life.patterns", "log"),
+    "life pattern rm": ("life.patterns", "rm"),
+    "life rename": ("life.items", "rename"),
+    "life rm": ("life.items", "rm"),
+    "life schedule": ("life.tasks", "schedule"),
+    "life search": ("life.search", "search"),
+    "life serve": ("life.serve", "serve"),
+    "life set": ("life.tasks", "set_cmd"),
+    "life show": ("life.tasks", "show"),
+    "life signal check": ("life.signal", "check"),
+    "life signal contacts": ("life.signal", "contacts_cmd"),
+    "life signal groups": ("life.signal", "groups_cmd"),
+    "life signal history": ("life.signal", "signal_history"),
+    "life signal inbox": ("life.signal", "signal_inbox"),
+    "life signal receive": ("life.signal", "receive_cmd"),
+    "life signal reply": ("life.signal", "reply_cmd"),
+    "life signal send": ("life.signal", "send_cmd"),
+    "life signal status": ("life.signal", "status"),
+    "life stats": ("life.dash", "stats"),
+    "life status": ("life.dash", "status"),
+    "life steward boot": ("life.steward.boot", "boot"),
+    "life steward close": ("life.steward.close", "close"),
+    "life steward dash": ("life.steward.dash", "dash"),
+    "life steward improve": ("life.steward.improve", "improve"),
+    "life steward log": ("life.steward.log", "log"),
+    "life steward observe": ("life.steward.close", "observe"),
+    "life steward rm": ("life.steward.close", "rm"),
+    "life steward run": ("life.steward.auto", "steward_run"),
+    "life tag": ("life.tags", "tag"),
+    "life today": ("life.tasks", "today"),
+    "life tomorrow": ("life.tasks", "tomorrow"),
+    "life track deferred": ("life.interventions", "deferred"),
+    "life track log": ("life.interventions", "log"),
+    "life track lost": ("life.interventions", "lost"),
+    "life track stats": ("life.interventions", "stats"),
+    "life track won": ("life.interventions", "won"),
+    "life unblock": ("life.tasks", "unblock"),
+    "life uncheck": ("life.items", "uncheck"),
+    "life unfocus": ("life.tasks", "unfocus"),
+    "life untag": ("life.tags", "untag"),
+}
+# fmt: on
+
+
+def build_manifest() -> dict[str, tuple[str, str]]:
+    """Import every command module and read the resulting fncli registry."""
+    from fncli import autodiscover, entries
+
+    autodiscover(Path(__file__).parent, "life")
+    return {key: (fn.__module__, fn.__name__) for key, fn, _ in sorted(entries())}
+
+
+def command_for(argv: list[str]) -> str | None:
+    """The command key argv dispatches to, mirroring fncli's longest-match lookup."""
+    words = [a for a in argv if not a.startswith("-")]
+    for depth in range(len(words), 1, -1):
+        key = " ".join(words[:depth])
+        if key in COMMANDS:
+            return key
+    return None
+
+
+def modules_for(argv: list[str]) -> set[str]:
+    """Modules needed to dispatch argv.
+
+    Falls back to every command module when argv names a namespace, asks for
+    help, or matches nothing — those paths list commands.
+    """
+    key = command_for(argv)
+    if key is not None:
+        return {COMMANDS[key][0]}
+    words = [a for a in argv if not a.startswith("-")]
+    namespace = " ".join(words[:2]) + " "
+    modules = {module for key, (module, _) in COMMANDS.items() if key.startswith(namespace)}
+    return modules or {module for module, _ in COMMANDS.values()}
+
+
+def _render(manifest: dict[str, tuple[str, str]]) -> str:
+    source = Path(__file__).read_text()
+    head, _, rest = source.partition("COMMANDS: dict[str, tuple[str, str]] = {\n")
+    _, _, tail = rest.partition("}\n# fmt: on\n")
+    body = "".join(
+        f'    "{key}": ("{module}", "{fn}"),\n' for key, (module, fn) in manifest.items()
+    )
+    return f"{head}COMMANDS: dict[str, tuple[str, str]] = {{\n{body}}}\n# fmt: on\n{tail}"
+
+
+if __name__ == "__main__":
+    Path(__file__).write_text(_render(build_manifest()))
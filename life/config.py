@@ -1,50 +1,59 @@
 from pathlib import Path
 
-import yaml
-
 LIFE_DIR = Path.home() / ".life"
 DB_PATH = LIFE_DIR / "life.db"
 CONFIG_PATH = LIFE_DIR / "config.yaml"
+SOCKET_PATH = LIFE_DIR / "serve.sock"
 BACKUP_DIR = Path.home() / ".life_backups"
 
 
 class Config:
-    """Single-instance config manager. Load once, cache in memory."""
+    """Single-instance config manager. Load on first access, cache in memory."""
 
     _instance: "Config | None" = None
-    _data: dict[str, object]
+    _data: dict[str, object] | None
 
     def __new__(cls) -> "Config":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._data = {}
-            cls._instance._load()
+            cls._instance._data = None
         return cls._instance
 
-    def _load(self) -> None:
+    def _load(self) -> dict[str, object]:
         """Load config from disk."""
-        if not CONFIG_PATH.exists():
-            self._data = {}
-            return
-        try:
-            with CONFIG_PATH.open() as f:
-                self._data = yaml.safe_load(f) or {}
-        except Exception:
-            self._data = {}
+        if self._data is not None:
+            return self._data
+        data: dict[str, object] = {}
+        if CONFIG_PATH.exists():
+            import yaml
+
+            try:
+                with CONFIG_PATH.open() as f:
+                    data = yaml.safe_load(f) or {}
+            except Exception:
+                data = {}
+        self._data = data
+        return data
 
     def _save(self) -> None:
         """Persist config to disk."""
+        import yaml
+
         LIFE_DIR.mkdir(exist_ok=True)
         with CONFIG_PATH.open("w") as f:
-            yaml.dump(self._data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(self._load(), f, default_flow_style=False, allow_unicode=True)
+
+    def reload(self) -> None:
+        """Forget the cached config so the next access re-reads disk."""
+        self._data = None
 
     def get(self, key: str, default: object = None) -> object:
         """Get config value."""
-        return self._data.get(key, default)
+        return self._load().get(key, default)
 
     def set(self, key: str, value: object) -> None:
         """Set config value and persist."""
-        self._data[key] = value
+        self._load()[key] = value
         self._save()
 
 
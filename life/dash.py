@@ -1,32 +1,37 @@
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 
 from fncli import cli
 
 from .config import get_profile, set_profile
-from .dashboard import get_pending_items, get_today_breakdown, get_today_completed
+from .dashboard import load_dashboard_snapshot
 from .habits import get_habits
 from .lib.clock import now, today
 from .lib.errors import echo, exit_error
-from .lib.render import render_dashboard, render_momentum
+from .lib.render import render_dashboard, render_momentum, render_momentum_history
 from .metrics import build_feedback_snapshot, render_feedback_snapshot
+from .momentum import momentum as momentum_range
 from .momentum import weekly_momentum
-from .tasks import get_all_tasks, get_tasks, last_completion
+from .tasks import get_tasks, last_completion
 
 __all__ = [
     "dashboard",
     "momentum",
+    "render",
     "stats",
     "status",
 ]
 
 
+def render(verbose: bool = False) -> str:
+    """The dashboard as printed, trailing newline included."""
+    return render_dashboard(load_dashboard_snapshot(), verbose=verbose) + "\n"
+
+
 @cli("life")
 def dashboard(verbose: bool = False) -> None:
     """Life dashboard"""
-    items = get_pending_items() + get_habits()
-    today_items = get_today_completed()
-    today_breakdown = get_today_breakdown()
-    echo(render_dashboard(items, today_breakdown, None, None, today_items, verbose=verbose))
+    sys.stdout.write(render(verbose))
 
 
 def _format_elapsed(dt) -> str:
@@ -48,16 +53,15 @@ def _format_elapsed(dt) -> str:
 def status() -> None:
     """Health check — untagged tasks, overdue, habit streaks, janice signal"""
     tasks = get_tasks()
-    all_tasks = get_all_tasks()
-    habits = get_habits()
     today_date = today()
+    habits = get_habits(since=today_date)
 
     untagged = [t for t in tasks if not t.tags]
     overdue = [t for t in tasks if t.scheduled_date and t.scheduled_date < today_date]
     janice = [t for t in tasks if "janice" in (t.tags or [])]
     focused = [t for t in tasks if t.focus]
 
-    snapshot = build_feedback_snapshot(all_tasks=all_tasks, pending_tasks=tasks, today=today_date)
+    snapshot = build_feedback_snapshot(today=today_date)
 
     lc = last_completion()
     last_check_str = _format_elapsed(lc) if lc else "never"
@@ -89,17 +93,22 @@ def status() -> None:
 @cli("life")
 def stats() -> None:
     """Feedback-loop metrics and escalation signals"""
-    tasks = get_tasks()
-    all_tasks = get_all_tasks()
-    today_date = today()
-    snapshot = build_feedback_snapshot(all_tasks=all_tasks, pending_tasks=tasks, today=today_date)
+    snapshot = build_feedback_snapshot(today=today())
     echo("\n".join(render_feedback_snapshot(snapshot)))
 
 
 @cli("life")
-def momentum() -> None:
-    """Show momentum and weekly trends"""
-    echo(render_momentum(weekly_momentum()))
+def momentum(weeks: int = 0, by: str = "week") -> None:
+    """Show momentum and weekly trends, or --weeks N of history bucketed --by day/week/month"""
+    if not weeks:
+        echo(render_momentum(weekly_momentum()))
+        return
+    end = today()
+    try:
+        buckets = momentum_range(end - timedelta(days=weeks * 7 - 1), end, by)
+    except ValueError as e:
+        exit_error(f"Error: {e}")
+    echo(render_momentum_history(buckets))
 
 
 
@@ -1,17 +1,25 @@
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta
+
 from . import db
 from .habits import get_habit
 from .lib import clock
-from .lib.converters import row_to_task
-from .models import Habit, Task
-from .tags import hydrate_tags, load_tags_for_tasks
+from .lib.converters import row_to_habit, row_to_task
+from .models import DashboardSnapshot, Habit, Task
 from .tasks import _task_sort_key, get_tasks
 
 __all__ = [
     "get_pending_items",
     "get_today_breakdown",
     "get_today_completed",
+    "load_dashboard_snapshot",
 ]
 
+# Days of check history the dashboard renders: this week vs. last week trend.
+HABIT_WINDOW_DAYS = 14
+
 
 def _get_checked_today() -> list[Habit]:
     """Internal: SELECT habits with checks WHERE check_date = today."""
@@ -22,7 +30,7 @@ def _get_checked_today() -> list[Habit]:
             SELECT DISTINCT h.id, h.content, h.created
             FROM habits h
             INNER JOIN checks c ON h.id = c.habit_id
-            WHERE DATE(c.check_date) = DATE(?)
+            WHERE c.check_date = ?
             ORDER BY h.created DESC
             """,
             (today_str,),
@@ -41,13 +49,12 @@ def _get_completed_today() -> list[Task]:
     today_str = clock.today().isoformat()
     with db.get_db() as conn:
         cursor = conn.execute(
-            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE date(completed_at) = ? AND completed_at IS NOT NULL",
+            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE completed_day = ?",
             (today_str,),
         )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        return hydrate_tags(tasks, tags_map)
+        rows = cursor.fetchall()
+        tags_map = _load_tags(conn, "task_id", [row[0] for row in rows])
+        return [row_to_task(row, tags_map.get(row[0], [])) for row in rows]
 
 
 def get_pending_items(asc: bool = True, include_steward: bool = False) -> list[Task]:
@@ -68,25 +75,25 @@ def get_today_breakdown():
     today_str = clock.today().isoformat()
     with db.get_db() as conn:
         cursor = conn.execute(
-            "SELECT COUNT(DISTINCT habit_id) FROM checks WHERE DATE(check_date) = DATE(?)",
+            "SELECT COUNT(DISTINCT habit_id) FROM checks WHERE check_date = ?",
             (today_str,),
         )
         habits_today = cursor.fetchone()[0]
 
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM tasks WHERE DATE(created) = DATE(?)",
+            "SELECT COUNT(*) FROM tasks WHERE created_day = ?",
             (today_str,),
         )
         tasks_added = cursor.fetchone()[0]
 
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM habits WHERE DATE(created) = DATE(?)",
+            "SELECT COUNT(*) FROM habits WHERE created_day = ?",
             (today_str,),
         )
         habits_added = cursor.fetchone()[0]
 
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM deleted_tasks WHERE DATE(deleted_at) = DATE(?)",
+            "SELECT COUNT(*) FROM deleted_tasks WHERE deleted_day = ?",
             (today_str,),
         )
         tasks_deleted = cursor.fetchone()[0]
@@ -94,3 +101,86 @@ def get_today_breakdown():
     tasks_today = len(_get_completed_today())
     added_today = tasks_added + habits_added
     return habits_today, tasks_today, added_today, tasks_deleted
+
+
+def _load_tags(conn: sqlite3.Connection, column: str, ids: list[str]) -> dict[str, list[str]]:
+    """Tags for many ids in one query; ids travel as a single JSON parameter."""
+    tags_map: defaultdict[str, list[str]] = defaultdict(list)
+    if not ids:
+        return tags_map
+    cursor = conn.execute(
+        f"SELECT {column}, tag FROM tags WHERE {column} IN (SELECT value FROM json_each(?)) ORDER BY tag",  # noqa: S608
+        (json.dumps(ids),),
+    )
+    for item_id, tag in cursor:
+        tags_map[item_id].append(tag)
+    return tags_map
+
+
+def load_dashboard_snapshot(include_steward: bool = False) -> DashboardSnapshot:
+    """Everything the dashboard renders, in a fixed number of queries on one connection."""
+    today = clock.today()
+    today_str = today.isoformat()
+    window_start = (today - timedelta(days=HABIT_WINDOW_DAYS - 1)).isoformat()
+    steward_filter = "" if include_steward else " AND steward = 0"
+
+    with db.get_db() as conn:
+        task_rows = conn.execute(
+            f"""
+            SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline
+            FROM tasks
+            WHERE (completed_at IS NULL{steward_filter})
+               OR completed_day = ?
+            """,  # noqa: S608
+            (today_str,),
+        ).fetchall()
+        task_tags = _load_tags(conn, "task_id", [row[0] for row in task_rows])
+
+        habit_rows = conn.execute(
+            """
+            SELECT id, content, created, archived_at, parent_id, private
+            FROM habits
+            WHERE archived_at IS NULL
+               OR id IN (SELECT habit_id FROM checks WHERE check_date = ?)
+            ORDER BY created DESC
+            """,
+            (today_str,),
+        ).fetchall()
+        habit_tags = _load_tags(conn, "habit_id", [row[0] for row in habit_rows])
+
+        checks_map: defaultdict[str, list[datetime]] = defaultdict(list)
+        checked_today: set[str] = set()
+        for habit_id, check_date, completed_at in conn.execute(
+            "SELECT habit_id, check_date, completed_at FROM checks WHERE check_date >= ? ORDER BY completed_at",
+            (window_start,),
+        ):
+            checks_map[habit_id].append(datetime.fromisoformat(completed_at))
+            if check_date == today_str:
+                checked_today.add(habit_id)
+
+        habits_today, added_today, deleted_today = conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(DISTINCT habit_id) FROM checks WHERE check_date = ?),
+                (SELECT COUNT(*) FROM tasks WHERE created_day = ?)
+                    + (SELECT COUNT(*) FROM habits WHERE created_day = ?),
+                (SELECT COUNT(*) FROM deleted_tasks WHERE deleted_day = ?)
+            """,
+            (today_str,) * 4,
+        ).fetchone()
+
+    tasks = [row_to_task(row, task_tags.get(row[0], [])) for row in task_rows]
+    habits = [
+        row_to_habit(row, checks_map.get(row[0], []), habit_tags.get(row[0], []))
+        for row in habit_rows
+    ]
+    completed_tasks = [t for t in tasks if t.completed_at]
+    return DashboardSnapshot(
+        pending=sorted((t for t in tasks if not t.completed_at), key=_task_sort_key),
+        habits=[h for h in habits if h.archived_at is None],
+        completed_today=[*completed_tasks, *(h for h in habits if h.id in checked_today)],
+        habits_today=habits_today,
+        tasks_today=len(completed_tasks),
+        added_today=added_today,
+        deleted_today=deleted_today,
+    )
@@ -0,0 +1,97 @@
+"""Rendered-dashboard cache, so `life` repeated with nothing changed skips the database.
+
+Stdlib only: a hit costs a few stats and two small reads, with no SQLite, fncli or
+domain import. The key is the database's change state as seen from outside any
+connection (PRAGMA data_version only compares within one connection):
+
+    db file   size, mtime and header change counter; checkpoints and rollback-mode commits
+    WAL       size plus the wal-index header from -shm, whose change counter and frame
+              count move on every commit while the WAL still holds frames
+
+plus the database path, the date, the minute (the header shows the time) and the
+verbose flag. One entry lives at ~/.life/dashboard.cache: the key on the first line,
+then the output. Only the process entry points read it and only cli.main writes it;
+`life dashboard` itself always renders, so bench, batch and serve never touch it.
+"""
+
+import os
+from pathlib import Path
+
+from . import config
+from .lib import clock
+
+__all__ = ["cache_key", "dashboard_verbose", "load", "lookup", "store"]
+
+# argv that draws the dashboard → its verbose flag.
+_DASHBOARD_ARGV: dict[tuple[str, ...], bool] = {
+    (): False,
+    ("-v",): True,
+    ("--verbose",): True,
+    ("dashboard",): False,
+    ("dashboard", "--verbose"): True,
+}
+
+# Bytes of the -shm file holding the wal-index header.
+_WAL_INDEX_HEADER = 48
+
+
+def _cache_path() -> Path:
+    return config.LIFE_DIR / "dashboard.cache"
+
+
+def cache_key(verbose: bool, db_path: Path | None = None) -> str | None:
+    """Key for the dashboard as of now; None when the database can't be read."""
+    db_path = db_path or config.DB_PATH
+    try:
+        st = db_path.stat()
+        with db_path.open("rb") as f:
+            counter = int.from_bytes(f.read(28)[24:], "big")
+        try:
+            wal_size = Path(f"{db_path}-wal").stat().st_size
+        except FileNotFoundError:
+            wal_size = 0
+        wal = ""
+        if wal_size:  # an empty WAL adds nothing to the db file
+            with Path(f"{db_path}-shm").open("rb") as f:
+                wal = f"{wal_size}:{f.read(_WAL_INDEX_HEADER).hex()}"
+    except OSError:
+        return None
+    when = f"{clock.today().isoformat()} {clock.now():%H:%M}"
+    return f"{db_path} {when} v{int(verbose)} {st.st_size}:{st.st_mtime_ns}:{counter} {wal}"
+
+
+def load(key: str) -> str | None:
+    """Cached output stored under key, or None."""
+    try:
+        text = _cache_path().read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+    stored, sep, output = text.partition("\n")
+    return output if sep and stored == key else None
+
+
+def store(key: str, output: str) -> None:
+    """Replace the cached entry; best effort, a failed write only costs the next hit."""
+    path = _cache_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{key}\n{output}")
+        tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def dashboard_verbose(argv: list[str]) -> bool | None:
+    """The verbose flag if argv draws the dashboard, else None."""
+    return _DASHBOARD_ARGV.get(tuple(argv))
+
+
+def lookup(argv: list[str]) -> str | None:
+    """The cached dashboard if argv draws it and nothing changed since it was stored."""
+    verbose = dashboard_verbose(argv)
+    if verbose is None:
+        return None
+    key = cache_key(verbose)
+    return load(key) if key else None
@@ -1,39 +1,264 @@
 # life/db.py
+import atexit
+import functools
 import inspect
+import json
 import shutil
 import sqlite3
-from collections.abc import Callable
+import threading
+import zlib
+from collections.abc import Callable, Generator, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from importlib import import_module
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from fncli import cli
 
 from . import config
-from .lib.errors import echo
+from .lib.errors import echo, exit_error
 
 MIGRATIONS_TABLE = "_migrations"
 
+# Fingerprint of the migration names shipped in this package, stamped into
+# PRAGMA user_version once they are all applied. Regenerate with
+# migrations_fingerprint(load_migrations()) whenever a migration is added.
+MIGRATIONS_FINGERPRINT = 0x18CD5191
+
 MigrationFn = Callable[[sqlite3.Connection], None]
 Migration = tuple[str, str | MigrationFn]
 
 
-@contextmanager
-def get_db(db_path: Path | None = None):
-    db_path = db_path if db_path else config.DB_PATH
+class _Pool(threading.local):
+    """Per-thread cache of open connections, keyed by database path."""
+
+    def __init__(self) -> None:
+        self.conns: dict[str, sqlite3.Connection] = {}
+        self.depth: dict[str, int] = {}
+
+
+_pool = _Pool()
+_stats = {"opened": 0, "acquired": 0}
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys = ON;")
+    _stats["opened"] += 1
+    return conn
+
+
+def _acquire(db_path: Path) -> sqlite3.Connection:
+    key = str(db_path)
+    conn = _pool.conns.get(key)
+    if conn is None:
+        conn = _pool.conns[key] = _connect(db_path)
+    _stats["acquired"] += 1
+    return conn
+
+
+def _release(db_path: Path) -> None:
+    conn = _pool.conns.pop(str(db_path), None)
+    _pool.depth.pop(str(db_path), None)
+    _reads.entries.clear()
+    if conn is not None:
+        conn.close()
+
+
+def close_all() -> None:
+    """Close every pooled connection held by the current thread."""
+    for key in list(_pool.conns):
+        _release(Path(key))
+
+
+def connection_stats() -> dict[str, int]:
+    """Connections opened vs. handed out by get_db() since process start."""
+    return dict(_stats)
+
+
+atexit.register(close_all)
+
+
+@contextmanager
+def get_db(db_path: Path | None = None) -> Generator[sqlite3.Connection, None, None]:
+    """Yield the pooled connection for db_path as one unit of work.
+
+    The outermost block commits or rolls back. Nested blocks join the outer
+    transaction through a savepoint, so a failing inner block only undoes its
+    own writes. SystemExit (exit_error) counts as failure.
+    """
+    db_path = db_path if db_path else config.DB_PATH
+    key = str(db_path)
+    conn = _acquire(db_path)
+    depth = _pool.depth.get(key, 0)
+    _pool.depth[key] = depth + 1
     try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
+        if depth == 0:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                _reads.entries.clear()
+                raise
+        else:
+            savepoint = f"get_db_{depth}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield conn
+                conn.execute(f"RELEASE {savepoint}")
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+                _reads.entries.clear()
+                raise
     finally:
-        conn.close()
+        if key in _pool.depth:
+            _pool.depth[key] = depth
+
+
+# ── read cache ───────────────────────────────────────────────────────────────
+
+class _ReadCache(threading.local):
+    """Per-thread memo of @cached_read results; live only inside read_scope()."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.entries: dict[tuple[object, ...], tuple[int, object]] = {}
+
+
+_reads = _ReadCache()
+_read_stats = {"hits": 0, "misses": 0}
+
+
+def _freeze(value):
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
+def _copy(value):
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _changes(key: str) -> int:
+    conn = _pool.conns.get(key)
+    return conn.total_changes if conn is not None else -1
+
+
+@contextmanager
+def read_scope() -> Generator[None, None, None]:
+    """Memoize @cached_read calls for the duration of one command.
+
+    An entry is stamped with the pooled connection's total_changes, so any write
+    through get_db() (insert, update or delete, triggers included) invalidates it;
+    a rollback clears the cache outright. Outside a scope reads go straight through.
+    """
+    _reads.depth += 1
+    try:
+        yield
+    finally:
+        _reads.depth -= 1
+        if _reads.depth == 0:
+            _reads.entries.clear()
+
+
+def clear_read_cache() -> None:
+    """Drop every @cached_read entry, e.g. once another process has committed."""
+    _reads.entries.clear()
+
+
+def cached_read[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+    """Serve repeat calls with equal arguments from the active read_scope().
+
+    Lists and dicts are returned as shallow copies so callers may sort or filter them.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not _reads.depth:
+            return fn(*args, **kwargs)
+        path = str(config.DB_PATH)
+        try:
+            key = (fn.__module__, fn.__qualname__, path, _freeze(args), _freeze(kwargs))
+        except TypeError:
+            return fn(*args, **kwargs)
+        entry = _reads.entries.get(key)
+        if entry is not None and entry[0] == _changes(path):
+            _read_stats["hits"] += 1
+            value = entry[1]
+        else:
+            _read_stats["misses"] += 1
+            value = fn(*args, **kwargs)
+            _reads.entries[key] = (_changes(path), value)
+        return cast(R, _copy(value))
+
+    return wrapper
+
+
+def read_cache_stats() -> dict[str, int]:
+    """@cached_read hits and misses since process start."""
+    return dict(_read_stats)
+
+
+@contextmanager
+def without_triggers(conn: sqlite3.Connection, *names: str) -> Generator[None, None, None]:
+    """Drop the named triggers for the block, then recreate them from their saved SQL.
+
+    For bulk loads that rebuild what the triggers maintain once, afterwards.
+    """
+    saved = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN (SELECT value FROM json_each(?))",
+        (json.dumps(names),),
+    ).fetchall()
+    for name in names:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    try:
+        yield
+    finally:
+        for (sql,) in saved:
+            conn.execute(sql)
+
+
+@contextmanager
+def without_indexes(conn: sqlite3.Connection, *tables: str) -> Generator[None, None, None]:
+    """Drop the tables' secondary indexes for the block, then recreate them.
+
+    Building an index once over loaded rows beats maintaining it per insert. Implicit
+    (PRIMARY KEY / UNIQUE constraint) indexes stay; a recreated UNIQUE index still
+    rejects duplicates, just at the end of the block. If the block raises, the indexes
+    are left to the caller's rollback rather than rebuilt over half-loaded rows.
+    """
+    saved = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        " AND tbl_name IN (SELECT value FROM json_each(?))",
+        (json.dumps(tables),),
+    ).fetchall()
+    for name, _ in saved:
+        conn.execute(f"DROP INDEX {name}")
+    yield
+    for _, sql in saved:
+        conn.execute(sql)
+
+
+FETCH_BATCH = 500
+
+
+def fetch_batches(cursor: sqlite3.Cursor, batch_size: int = FETCH_BATCH) -> Iterator[list[Any]]:
+    """cursor's rows, batch_size at a time, so only one batch is resident."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    while batch := cursor.fetchmany(batch_size):
+        yield batch
 
 
 def _create_backup(db_path: Path) -> Path:
@@ -101,6 +326,20 @@ def load_migrations() -> list[Migration]:
     return sorted(migrations, key=lambda x: x[0])
 
 
+def migrations_fingerprint(migrations: list[Migration]) -> int:
+    names = "\n".join(name for name, _ in migrations)
+    return zlib.crc32(names.encode()) & 0x7FFFFFFF or 1
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _stamp_schema_version(conn: sqlite3.Connection, fingerprint: int) -> None:
+    conn.execute(f"PRAGMA user_version = {int(fingerprint)}")
+    conn.commit()
+
+
 def _apply_migrations(conn: sqlite3.Connection, db_path: Path) -> None:
     conn.execute(
         f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} "
@@ -109,9 +348,11 @@ def _apply_migrations(conn: sqlite3.Connection, db_path: Path) -> None:
     conn.commit()
 
     applied = {row[0] for row in conn.execute(f"SELECT name FROM {MIGRATIONS_TABLE}").fetchall()}  # noqa: S608
-    pending = [(n, m) for n, m in load_migrations() if n not in applied]
+    migrations = load_migrations()
+    pending = [(n, m) for n, m in migrations if n not in applied]
 
     if not pending:
+        _stamp_schema_version(conn, migrations_fingerprint(migrations))
         return
 
     backup_path: Path | None = None
@@ -149,17 +390,20 @@ def _apply_migrations(conn: sqlite3.Connection, db_path: Path) -> None:
     if backup_path and backup_path.exists():
         backup_path.unlink()
 
+    _stamp_schema_version(conn, migrations_fingerprint(migrations))
+
 
 def init(db_path: Path | None = None) -> None:
     db_path = db_path if db_path else config.DB_PATH
     db_path.parent.mkdir(exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys = ON;")
+    conn = _acquire(db_path)
+    if _schema_version(conn) == MIGRATIONS_FINGERPRINT:
+        return
     try:
         _apply_migrations(conn, db_path)
-    finally:
-        conn.close()
+    except Exception:
+        _release(db_path)
+        raise
 
 
 def migrate(db_path: Path | None = None) -> None:
@@ -194,6 +438,31 @@ def db_backup():
     for tbl, delta in sorted(delta_by_table.items(), key=lambda x: abs(x[1]), reverse=True):
         sign = "+" if delta > 0 else ""
         echo(f"    {tbl} {sign}{delta}")
+    echo(
+        f"  {result['new_chunks']}/{result['chunks']} chunks new"
+        f" ({result['bytes_written'] / 1024:.0f} KB written)"
+    )
+    if result["pruned"]:
+        echo(f"  pruned {result['pruned']} old snapshots")
+
+
+@cli("life db", name="restore")
+def db_restore(snapshot: str):
+    """Restore the database from a backup snapshot (name, prefix or 'latest')"""
+    from .lib.backup import restore as _restore
+
+    # restore writes through its own connection, which no rollback here could undo.
+    pooled = _pool.conns.get(str(config.DB_PATH))
+    if pooled is not None and pooled.in_transaction:
+        exit_error("restore must run outside an open transaction")
+    try:
+        result = _restore(snapshot)
+    except (ValueError, sqlite3.Error) as e:
+        exit_error(f"restore failed: {e}")
+    clear_read_cache()
+    echo(f"restored {result['path'].name} ({result['rows']} rows)")
+    if result["safety"]:
+        echo(f"  previous state saved as {result['safety'].name}")
 
 
 @cli("life db", name="health")
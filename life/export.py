@@ -0,0 +1,203 @@
+"""NDJSON export and import of every core table (`life export` / `life import`).
+
+The stream opens with a header object, then for each table one object naming the
+table and its columns, followed by one JSON array per row in column order:
+
+    {"format": "life-ndjson", "version": 1, "schema": "0x18CD5191"}
+    {"table": "tasks", "columns": ["id", "content", ...]}
+    ["2a7…", "file taxes", ...]
+
+Export reads one snapshot a batch at a time; import loads everything in one
+transaction with the FTS triggers suspended, then rebuilds the indexes once.
+"""
+
+import json
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from fncli import cli
+
+from . import db
+from .lib.errors import echo, exit_error
+from .search import fts_triggers, rebuild_indexes
+
+__all__ = ["FORMAT", "VERSION", "core_tables", "export_rows", "import_rows"]
+
+FORMAT = "life-ndjson"
+VERSION = 1
+
+# Rows per executemany() call on import.
+_IMPORT_BATCH = 5000
+
+_SKIP_TABLES = {"_migrations", "sqlite_sequence"}
+
+
+def core_tables(conn: sqlite3.Connection) -> dict[str, list[str]]:
+    """Ordinary tables -> stored columns; FTS tables and their shadows are derived, so skipped.
+
+    Generated columns are omitted: PRAGMA table_info hides them and they recompute on insert.
+    """
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    ).fetchall()
+    virtual = [name for name, sql in rows if sql.startswith("CREATE VIRTUAL TABLE")]
+    return {
+        name: [col[1] for col in conn.execute(f"PRAGMA table_info({name})")]
+        for name, _ in rows
+        if name not in _SKIP_TABLES
+        and name not in virtual
+        and not any(name.startswith(f"{v}_") for v in virtual)
+    }
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def export_rows(out: TextIO, batch_size: int = db.FETCH_BATCH) -> dict[str, int]:
+    """Write every core table to out as NDJSON from one read snapshot; rows per table."""
+    counts: dict[str, int] = {}
+    with db.get_db() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        header = {
+            "format": FORMAT,
+            "version": VERSION,
+            "schema": f"0x{db.MIGRATIONS_FINGERPRINT:08X}",
+        }
+        out.write(_dumps(header) + "\n")
+        for table, columns in core_tables(conn).items():
+            out.write(_dumps({"table": table, "columns": columns}) + "\n")
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid")  # noqa: S608
+            n = 0
+            for batch in db.fetch_batches(cursor, batch_size):
+                out.write("".join(_dumps(row) + "\n" for row in batch))
+                n += len(batch)
+            counts[table] = n
+    return counts
+
+
+def _insert(
+    conn: sqlite3.Connection, table: str, columns: list[str], rows: list[list[Any]]
+) -> None:
+    marks = ", ".join("?" * len(columns))
+    conn.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({marks})", rows)  # noqa: S608
+
+
+def _load(
+    conn: sqlite3.Connection, lines: Iterator[str], tables: dict[str, list[str]]
+) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    table: str | None = None
+    columns: list[str] = []
+    pending: list[str] = []
+
+    def flush() -> None:
+        # One json.loads per batch: decoding "[row,row,...]" beats a call per line.
+        # Rows are only queued once a table header has set table.
+        if pending and table is not None:
+            rows = json.loads("[" + ",".join(pending) + "]")
+            _insert(conn, table, columns, rows)
+            counts[table] += len(rows)
+            pending.clear()
+
+    for lineno, line in enumerate(lines, start=2):
+        if line.startswith("["):
+            if table is None:
+                raise ValueError(f"line {lineno}: row before any table header")
+            pending.append(line)
+            if len(pending) >= _IMPORT_BATCH:
+                flush()
+            continue
+        if not line.strip():
+            continue
+        flush()
+        record = json.loads(line)
+        table, columns = record.get("table"), record.get("columns", [])
+        if table not in tables:
+            raise ValueError(f"line {lineno}: unknown table {table!r}")
+        unknown = set(columns) - set(tables[table])
+        if unknown:
+            raise ValueError(f"line {lineno}: {table} has no column {', '.join(sorted(unknown))}")
+        if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():  # noqa: S608
+            raise ValueError(f"{table} is not empty; pass --replace to overwrite")
+        counts[table] = 0
+    flush()
+    return counts
+
+
+def import_rows(lines: Iterable[str], replace: bool = False) -> dict[str, int]:
+    """Load an export in one transaction; rows per table.
+
+    Tables in the stream must be empty unless replace, which first clears every core
+    table. The load runs with foreign keys off, secondary indexes and FTS triggers
+    dropped; afterwards the indexes are rebuilt, PRAGMA foreign_key_check must come
+    back clean, and the FTS tables are rebuilt once. Any error rolls everything back.
+    """
+    it = iter(lines)
+    header = json.loads(next(it, "null"))
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        raise ValueError(f"not a {FORMAT} stream")
+    if header.get("version") != VERSION:
+        raise ValueError(f"unsupported {FORMAT} version {header.get('version')}")
+
+    with db.get_db() as conn:
+        if conn.in_transaction:
+            raise ValueError("import must run outside an open transaction")
+        # foreign_keys is a no-op inside a transaction, so switch it before BEGIN.
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            conn.execute("BEGIN")
+            tables = core_tables(conn)
+            with db.without_triggers(conn, *fts_triggers(conn)):
+                with db.without_indexes(conn, *tables):
+                    if replace:
+                        for table in tables:
+                            conn.execute(f"DELETE FROM {table}")  # noqa: S608
+                    counts = _load(conn, it, tables)
+                orphan = conn.execute("PRAGMA foreign_key_check").fetchone()
+                if orphan:
+                    raise ValueError(
+                        f"{orphan[0]} row {orphan[1]} references a missing {orphan[2]} row"
+                    )
+                rebuild_indexes(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+    return counts
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+
+
+@cli("life")
+def export(out: str | None = None) -> None:
+    """Stream every core table as NDJSON to stdout or --out FILE"""
+    if out:
+        with Path(out).expanduser().open("w", encoding="utf-8") as f:
+            counts = export_rows(f)
+    else:
+        counts = export_rows(sys.stdout)
+        sys.stdout.flush()
+    echo(f"exported {sum(counts.values())} rows from {len(counts)} tables", err=True)
+
+
+@cli("life", name="import")
+def import_(path: str, replace: bool = False) -> None:
+    """Load a `life export` NDJSON file in one transaction ('-' reads stdin)"""
+    try:
+        if path == "-":
+            counts = import_rows(sys.stdin, replace=replace)
+        else:
+            with Path(path).expanduser().open(encoding="utf-8") as f:
+                counts = import_rows(f, replace=replace)
+    except (OSError, ValueError, sqlite3.IntegrityError) as e:
+        exit_error(f"import failed: {e}")
+    loaded = ", ".join(f"{table} {n}" for table, n in counts.items() if n)
+    echo(f"imported {sum(counts.values())} rows" + (f": {loaded}" if loaded else ""))
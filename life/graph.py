@@ -0,0 +1,225 @@
+"""Task tree (parent_id) and blocker graph (blocked_by), each walk one recursive CTE.
+
+Every walk recurses with UNION rather than UNION ALL, so a cycle that slipped in
+through an import or hand-edited SQL ends the walk instead of looping forever;
+find_cycles() reports them and `life block` refuses to create one.
+"""
+
+import json
+import sqlite3
+
+from . import db
+from .models import Task
+from .tasks import _select_tasks, _task_sort_key
+
+__all__ = [
+    "blockers",
+    "complete_cascade",
+    "find_cycles",
+    "reopen_cascade",
+    "subtree",
+    "unblocked_leaves",
+    "would_cycle",
+]
+
+_EDGES = ("blocked_by", "parent_id")
+
+# Ids of the root and every descendant through parent_id.
+_SUBTREE_IDS = """
+    WITH RECURSIVE subtree(id) AS (
+        SELECT id FROM tasks WHERE id = ?
+        UNION
+        SELECT t.id FROM tasks t JOIN subtree s ON t.parent_id = s.id
+    )
+    SELECT id FROM subtree"""
+
+# Ids of every task reachable from the root by following blocked_by.
+_BLOCKER_IDS = """
+    WITH RECURSIVE chain(id) AS (
+        SELECT blocked_by FROM tasks WHERE id = ? AND blocked_by IS NOT NULL
+        UNION
+        SELECT t.blocked_by FROM tasks t JOIN chain c ON t.id = c.id
+        WHERE t.blocked_by IS NOT NULL
+    )
+    SELECT id FROM chain"""
+
+# The root and its ancestors, then each ancestor's descendants off that path.
+# CROSS JOIN keeps the path driving the loop so tasks is probed, never scanned.
+_LINEAGE = """
+    WITH RECURSIVE path(id) AS (
+        SELECT id FROM tasks WHERE id = ?
+        UNION
+        SELECT t.parent_id FROM tasks t JOIN path p ON t.id = p.id
+        WHERE t.parent_id IS NOT NULL
+    ),
+    below(ancestor, id) AS (
+        SELECT p.id, t.id FROM path p CROSS JOIN tasks t ON t.parent_id = p.id
+        UNION
+        SELECT b.ancestor, t.id FROM below b CROSS JOIN tasks t ON t.parent_id = b.id
+    )"""
+
+
+def _order_chain(start: str | None, links: dict[str, str | None]) -> list[str]:
+    """Follow links from start while the ids stay in links; each id once."""
+    ordered: list[str] = []
+    while start in links and start not in ordered:
+        ordered.append(start)
+        start = links[start]
+    return ordered
+
+
+def subtree(task_id: str) -> list[Task]:
+    """The task and all its descendants: root first, the rest in dashboard order."""
+    with db.get_db() as conn:
+        tasks = _select_tasks(conn, f"id IN ({_SUBTREE_IDS})", (task_id,))
+    root = [t for t in tasks if t.id == task_id]
+    return root + sorted((t for t in tasks if t.id != task_id), key=_task_sort_key)
+
+
+def blockers(task_id: str) -> list[Task]:
+    """Transitive blocked_by chain of task_id, nearest blocker first."""
+    with db.get_db() as conn:
+        tasks = _select_tasks(conn, f"id IN ({_BLOCKER_IDS})", (task_id,))
+        first = conn.execute("SELECT blocked_by FROM tasks WHERE id = ?", (task_id,)).fetchone()
+    by_id = {t.id: t for t in tasks}
+    chain = _order_chain(first[0] if first else None, {t.id: t.blocked_by for t in tasks})
+    return [by_id[i] for i in chain if i != task_id]
+
+
+def would_cycle(task_id: str, blocker_id: str) -> bool:
+    """Whether making blocker_id block task_id closes a blocked_by loop."""
+    if task_id == blocker_id:
+        return True
+    with db.get_db() as conn:
+        row = conn.execute(
+            f"SELECT 1 FROM ({_BLOCKER_IDS}) WHERE id = ?",  # noqa: S608
+            (blocker_id, task_id),
+        ).fetchone()
+    return row is not None
+
+
+def unblocked_leaves(root_id: str | None = None, include_steward: bool = False) -> list[Task]:
+    """Pending tasks with no pending subtask and no pending blocker, in dashboard order.
+
+    root_id limits the search to that task's subtree.
+    """
+    where = """
+        t.completed_at IS NULL
+        AND NOT EXISTS (SELECT 1 FROM tasks c WHERE c.parent_id = t.id AND c.completed_at IS NULL)
+        AND NOT EXISTS (SELECT 1 FROM tasks b WHERE b.id = t.blocked_by AND b.completed_at IS NULL)
+    """
+    params: tuple[object, ...] = ()
+    if not include_steward:
+        where += " AND t.steward = 0"
+    if root_id is not None:
+        where += f" AND t.id IN ({_SUBTREE_IDS})"
+        params = (root_id,)
+    with db.get_db() as conn:
+        tasks = _select_tasks(conn, f"id IN (SELECT t.id FROM tasks t WHERE {where})", params)  # noqa: S608
+    return sorted(tasks, key=_task_sort_key)
+
+
+def find_cycles(
+    edge: str = "blocked_by", conn: sqlite3.Connection | None = None
+) -> list[list[str]]:
+    """Loops along edge ('blocked_by' or 'parent_id'), each as ids in walk order.
+
+    One query finds every task that can walk back to itself; the loops are then
+    split apart in Python, touching only the tasks on them.
+    """
+    if edge not in _EDGES:
+        raise ValueError(f"edge must be one of {', '.join(_EDGES)}")
+    sql = f"""
+        WITH RECURSIVE walk(start, id) AS (
+            SELECT id, {edge} FROM tasks WHERE {edge} IS NOT NULL
+            UNION
+            SELECT w.start, t.{edge} FROM walk w JOIN tasks t ON t.id = w.id
+            WHERE t.{edge} IS NOT NULL AND w.id != w.start
+        )
+        SELECT t.id, t.{edge} FROM walk w JOIN tasks t ON t.id = w.start
+        WHERE w.id = w.start
+    """  # noqa: S608
+    if conn is None:
+        with db.get_db() as own:
+            rows = own.execute(sql).fetchall()
+    else:
+        rows = conn.execute(sql).fetchall()
+    links = dict(rows)
+    cycles: list[list[str]] = []
+    seen: set[str] = set()
+    for start in sorted(links):
+        if start in seen:
+            continue
+        cycle = _order_chain(start, links)
+        seen.update(cycle)
+        cycles.append(cycle)
+    return cycles
+
+
+def _path(
+    conn: sqlite3.Connection, task_id: str, flag: str, params: tuple[object, ...] = ()
+) -> list[str]:
+    """task_id then its ancestors nearest first, keeping those where flag holds."""
+    rows = conn.execute(
+        f"""{_LINEAGE}
+        SELECT t.id, t.parent_id, {flag} FROM path p JOIN tasks t ON t.id = p.id""",  # noqa: S608
+        (task_id, *params),
+    ).fetchall()
+    keep = {row[0] for row in rows if row[2]}
+    return [i for i in _order_chain(task_id, {row[0]: row[1] for row in rows}) if i in keep]
+
+
+def complete_cascade(conn: sqlite3.Connection, task_id: str, completed: str) -> list[str]:
+    """Complete task_id and every ancestor left with nothing pending beneath it.
+
+    Returns the ids completed, task first then ancestors nearest first. Logging the
+    mutations, completing and unblocking dependants are three set-based statements.
+    """
+    ids = _path(
+        conn,
+        task_id,
+        """t.completed_at IS NULL AND (
+            t.id = ? OR NOT EXISTS (
+                SELECT 1 FROM below b JOIN tasks d ON d.id = b.id
+                WHERE b.ancestor = t.id AND d.completed_at IS NULL
+                  AND d.id NOT IN (SELECT id FROM path)
+            )
+        )""",
+        (task_id,),
+    )
+    if not ids:
+        return []
+    payload = json.dumps(ids)
+    conn.execute(
+        "INSERT INTO task_mutations (task_id, field, old_value, new_value)"
+        " SELECT value, 'completed_at', NULL, ? FROM json_each(?)",
+        (completed, payload),
+    )
+    conn.execute(
+        "UPDATE tasks SET completed_at = ? WHERE id IN (SELECT value FROM json_each(?))",
+        (completed, payload),
+    )
+    conn.execute(
+        "UPDATE tasks SET blocked_by = NULL WHERE blocked_by IN (SELECT value FROM json_each(?))",
+        (payload,),
+    )
+    return ids
+
+
+def reopen_cascade(conn: sqlite3.Connection, task_id: str) -> list[str]:
+    """Reopen task_id and every completed ancestor; ids reopened, task first."""
+    ids = _path(conn, task_id, "t.completed_at IS NOT NULL")
+    if not ids:
+        return []
+    payload = json.dumps(ids)
+    conn.execute(
+        "INSERT INTO task_mutations (task_id, field, old_value, new_value)"
+        " SELECT id, 'completed_at', completed_at, NULL FROM tasks"
+        " WHERE id IN (SELECT value FROM json_each(?))",
+        (payload,),
+    )
+    conn.execute(
+        "UPDATE tasks SET completed_at = NULL WHERE id IN (SELECT value FROM json_each(?))",
+        (payload,),
+    )
+    return ids
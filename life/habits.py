@@ -1,8 +1,11 @@
 import contextlib
-import dataclasses
+import json
 import sqlite3
 import uuid
-from datetime import datetime
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from fncli import cli
 
@@ -12,10 +15,10 @@ from .lib.ansi import ANSI
 from .lib.converters import row_to_habit
 from .lib.errors import echo, exit_error
 from .lib.format import format_status
-from .lib.fuzzy import find_in_pool, find_in_pool_exact
+from .lib.fuzzy import find_in_table
 from .lib.parsing import validate_content
-from .models import Habit
-from .tags import get_tags_for_habit, load_tags_for_habits
+from .models import Check, Habit, HabitStreak
+from .tags import load_tags_for_habits
 
 __all__ = [
     "add_habit",
@@ -29,7 +32,9 @@ __all__ = [
     "get_habit",
     "get_habits",
     "get_streak",
+    "get_streaks",
     "get_subhabits",
+    "iter_checks",
     "rename_habit",
     "toggle_check",
     "uncheck_habit",
@@ -39,16 +44,28 @@ __all__ = [
 
 # ── domain ───────────────────────────────────────────────────────────────────
 
-def _hydrate_habit(habit: Habit, checks: list[datetime], tags: list[str]) -> Habit:
-    return dataclasses.replace(habit, checks=checks, tags=tags)
-
-
-def _get_habit_checks(conn, habit_id: str) -> list[datetime]:
-    cursor = conn.execute(
-        "SELECT completed_at FROM checks WHERE habit_id = ? ORDER BY completed_at",
-        (habit_id,),
-    )
-    return [datetime.fromisoformat(row[0]) for row in cursor.fetchall()]
+def _load_checks(
+    conn, habit_ids: list[str], since: date | None = None
+) -> dict[str, list[datetime]]:
+    """Checks for all habit_ids in one query; since=None loads full history."""
+    if not habit_ids:
+        return {}
+    since_filter = " AND check_date >= ?" if since else ""
+    params = (json.dumps(habit_ids), since.isoformat()) if since else (json.dumps(habit_ids),)
+    checks: defaultdict[str, list[datetime]] = defaultdict(list)
+    for habit_id, completed_at in conn.execute(
+        f"SELECT habit_id, completed_at FROM checks WHERE habit_id IN (SELECT value FROM json_each(?)){since_filter} ORDER BY habit_id, completed_at",  # noqa: S608
+        params,
+    ):
+        checks[habit_id].append(datetime.fromisoformat(completed_at))
+    return checks
+
+
+def _hydrate_rows(conn, rows: list[Any], since: date | None = None) -> list[Habit]:
+    habit_ids = [row[0] for row in rows]
+    tags_map = load_tags_for_habits(habit_ids, conn=conn)
+    checks_map = _load_checks(conn, habit_ids, since)
+    return [row_to_habit(row, checks_map.get(row[0], []), tags_map.get(row[0], [])) for row in rows]
 
 
 def add_habit(
@@ -77,7 +94,8 @@ def add_habit(
     return habit_id
 
 
-def get_habit(habit_id: str) -> Habit | None:
+@db.cached_read
+def get_habit(habit_id: str, since: date | None = None) -> Habit | None:
     with db.get_db() as conn:
         cursor = conn.execute(
             "SELECT id, content, created, archived_at, parent_id, private FROM habits WHERE id = ?",
@@ -86,11 +104,7 @@ def get_habit(habit_id: str) -> Habit | None:
         row = cursor.fetchone()
         if not row:
             return None
-
-        habit = row_to_habit(row)
-        checks = _get_habit_checks(conn, habit_id)
-        tags = get_tags_for_habit(habit_id)
-        return _hydrate_habit(habit, checks, tags)
+        return _hydrate_rows(conn, [row], since)[0]
 
 
 def update_habit(habit_id: str, content: str | None = None) -> Habit | None:
@@ -114,33 +128,30 @@ def delete_habit(habit_id: str) -> None:
         conn.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
 
 
-def get_habits(habit_ids: list[str] | None = None, include_private: bool = True) -> list[Habit]:
-    if habit_ids is None:
-        private_filter = "" if include_private else " AND private = 0"
-        with db.get_db() as conn:
+@db.cached_read
+def get_habits(
+    habit_ids: list[str] | None = None,
+    include_private: bool = True,
+    since: date | None = None,
+) -> list[Habit]:
+    """Active habits (or habit_ids, in order) with checks from since onward."""
+    with db.get_db() as conn:
+        if habit_ids is None:
+            private_filter = "" if include_private else " AND private = 0"
             cursor = conn.execute(
                 f"SELECT id, content, created, archived_at, parent_id, private FROM habits WHERE archived_at IS NULL{private_filter} ORDER BY created DESC"  # noqa: S608
             )
-            rows = cursor.fetchall()
-            all_habit_ids = [row[0] for row in rows]
-            tags_map = load_tags_for_habits(all_habit_ids, conn=conn)
-            habits = []
-            for row in rows:
-                habit_id = row[0]
-                checks = _get_habit_checks(conn, habit_id)
-                tags = tags_map.get(habit_id, [])
-                habit = row_to_habit(row)
-                habits.append(_hydrate_habit(habit, checks, tags))
-            return habits
-
-    result = []
-    for habit_id in habit_ids:
-        habit = get_habit(habit_id)
-        if habit:
-            result.append(habit)
-    return result
+            return _hydrate_rows(conn, cursor.fetchall(), since)
 
+        cursor = conn.execute(
+            "SELECT id, content, created, archived_at, parent_id, private FROM habits WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(habit_ids),),
+        )
+        by_id = {habit.id: habit for habit in _hydrate_rows(conn, cursor.fetchall(), since)}
+    return [by_id[habit_id] for habit_id in habit_ids if habit_id in by_id]
 
+
+@db.cached_read
 def get_checks(habit_id: str) -> list[datetime]:
     if not habit_id:
         raise ValueError("habit_id cannot be empty")
@@ -153,71 +164,101 @@ def get_checks(habit_id: str) -> list[datetime]:
         return [datetime.fromisoformat(row[0]) for row in cursor.fetchall()]
 
 
+def iter_checks(
+    habit_id: str | None = None,
+    since: date | None = None,
+    batch_size: int = db.FETCH_BATCH,
+) -> Iterator[Check]:
+    """Stream checks oldest first, batch_size rows per fetch; one batch resident at a time."""
+    clauses, params = [], []
+    if habit_id:
+        clauses.append("habit_id = ?")
+        params.append(habit_id)
+    if since:
+        clauses.append("check_date >= ?")
+        params.append(since.isoformat())
+    where = " AND ".join(clauses) or "1"
+    with db.get_db() as conn:
+        cursor = conn.execute(
+            f"SELECT habit_id, check_date, completed_at FROM checks WHERE {where} ORDER BY check_date",  # noqa: S608
+            params,
+        )
+        for batch in db.fetch_batches(cursor, batch_size):
+            for habit, day, completed_at in batch:
+                yield Check(habit, date.fromisoformat(day), datetime.fromisoformat(completed_at))
+
+
+@db.cached_read
+def get_streaks(habit_ids: list[str] | None = None) -> dict[str, HabitStreak]:
+    """Current and longest runs of consecutive check days, for every habit in one query.
+
+    Consecutive days share julianday(check_date) - ROW_NUMBER(), so each run is one group.
+    The current streak is the run ending today; habits without checks are absent.
+    """
+    if habit_ids is not None and not habit_ids:
+        return {}
+    id_filter = (
+        "WHERE habit_id IN (SELECT value FROM json_each(:ids))" if habit_ids is not None else ""
+    )
+    params = {"today": clock.today().isoformat(), "ids": json.dumps(habit_ids or [])}
+    with db.get_db() as conn:
+        rows = conn.execute(
+            f"""
+            WITH islands AS (
+                SELECT habit_id, check_date,
+                       julianday(check_date)
+                         - ROW_NUMBER() OVER (PARTITION BY habit_id ORDER BY check_date) AS run
+                FROM checks
+                {id_filter}
+            ),
+            runs AS (
+                SELECT habit_id, COUNT(*) AS length, MAX(check_date) AS ended
+                FROM islands
+                GROUP BY habit_id, run
+            )
+            SELECT habit_id,
+                   MAX(CASE WHEN ended = :today THEN length ELSE 0 END),
+                   MAX(length),
+                   MAX(ended)
+            FROM runs
+            GROUP BY habit_id
+            """,  # noqa: S608
+            params,
+        ).fetchall()
+    return {
+        habit_id: HabitStreak(habit_id, current, longest, date.fromisoformat(last))
+        for habit_id, current, longest, last in rows
+    }
+
+
 def get_streak(habit_id: str) -> int:
     if not habit_id:
         raise ValueError("habit_id cannot be empty")
+    streak = get_streaks([habit_id]).get(habit_id)
+    return streak.current if streak else 0
 
-    checks = get_checks(habit_id)
-
-    if not checks:
-        return 0
 
-    streak = 1
-    today = clock.today()
-
-    for i in range(len(checks) - 1):
-        current = checks[i].date()
-        next_date = checks[i + 1].date()
-        if (current - next_date).days == 1:
-            streak += 1
-        else:
-            break
-
-    if checks[0].date() != today:
-        return 0
-
-    return streak
-
-
-def get_subhabits(parent_id: str) -> list["Habit"]:
+@db.cached_read
+def get_subhabits(parent_id: str, since: date | None = None) -> list["Habit"]:
     with db.get_db() as conn:
         cursor = conn.execute(
             "SELECT id, content, created, archived_at, parent_id, private FROM habits WHERE parent_id = ? AND archived_at IS NULL ORDER BY created ASC",
             (parent_id,),
         )
-        rows = cursor.fetchall()
-        all_habit_ids = [row[0] for row in rows]
-        tags_map = load_tags_for_habits(all_habit_ids, conn=conn)
-        habits = []
-        for row in rows:
-            habit_id = row[0]
-            checks = _get_habit_checks(conn, habit_id)
-            tags = tags_map.get(habit_id, [])
-            habit = row_to_habit(row)
-            habits.append(_hydrate_habit(habit, checks, tags))
-        return habits
-
-
-def get_archived_habits() -> list[Habit]:
+        return _hydrate_rows(conn, cursor.fetchall(), since)
+
+
+@db.cached_read
+def get_archived_habits(since: date | None = None) -> list[Habit]:
     with db.get_db() as conn:
         cursor = conn.execute(
             "SELECT id, content, created, archived_at, parent_id, private FROM habits WHERE archived_at IS NOT NULL ORDER BY archived_at DESC"
         )
-        rows = cursor.fetchall()
-        all_habit_ids = [row[0] for row in rows]
-        tags_map = load_tags_for_habits(all_habit_ids, conn=conn)
-        habits = []
-        for row in rows:
-            habit_id = row[0]
-            checks = _get_habit_checks(conn, habit_id)
-            tags = tags_map.get(habit_id, [])
-            habit = row_to_habit(row)
-            habits.append(_hydrate_habit(habit, checks, tags))
-        return habits
+        return _hydrate_rows(conn, cursor.fetchall(), since)
 
 
 def archive_habit(habit_id: str) -> Habit | None:
-    habit = get_habit(habit_id)
+    habit = get_habit(habit_id, since=clock.today())
     if not habit:
         return None
     archived_at = datetime.now().isoformat()
@@ -229,16 +270,24 @@ def archive_habit(habit_id: str) -> Habit | None:
     return get_habit(habit_id)
 
 
+def _resolve_habit(ref: str, fuzzy: bool = True) -> Habit | None:
+    with db.get_db() as conn:
+        habit_id = find_in_table(
+            conn, ref, "habits", "archived_at IS NULL", fuzzy=fuzzy, trigram="habits_trigram_fts"
+        )
+    return get_habit(habit_id, since=clock.today()) if habit_id else None
+
+
 def find_habit(ref: str) -> Habit | None:
-    return find_in_pool(ref, get_habits())
+    return _resolve_habit(ref)
 
 
 def find_habit_exact(ref: str) -> Habit | None:
-    return find_in_pool_exact(ref, get_habits())
+    return _resolve_habit(ref, fuzzy=False)
 
 
 def check_habit(habit_id: str) -> Habit | None:
-    habit = get_habit(habit_id)
+    habit = get_habit(habit_id, since=clock.today())
     if not habit:
         return None
     now = datetime.now().isoformat()
@@ -252,7 +301,7 @@ def check_habit(habit_id: str) -> Habit | None:
 
 
 def uncheck_habit(habit_id: str) -> Habit | None:
-    habit = get_habit(habit_id)
+    habit = get_habit(habit_id, since=clock.today())
     if not habit:
         return None
     with db.get_db() as conn:
@@ -264,7 +313,7 @@ def uncheck_habit(habit_id: str) -> Habit | None:
 
 
 def toggle_check(habit_id: str) -> Habit | None:
-    habit = get_habit(habit_id)
+    habit = get_habit(habit_id, since=clock.today())
     if not habit:
         return None
     with db.get_db() as conn:
@@ -303,6 +352,12 @@ def _animate_check(label: str) -> None:
 
 # ── cli ──────────────────────────────────────────────────────────────────────
 
+def _matrix_since() -> date:
+    from .lib.render import HABIT_MATRIX_DAYS
+
+    return clock.today() - timedelta(days=HABIT_MATRIX_DAYS - 1)
+
+
 def habit(
     content: list[str] | None = None,
     tag: list[str] | None = None,
@@ -315,7 +370,7 @@ def habit(
     from .lib.resolve import resolve_habit
 
     if log or not content:
-        echo(render_habit_matrix(get_habits()))
+        echo(render_habit_matrix(get_habits(since=_matrix_since())))
         return
     content_str = " ".join(content) if content else ""
     try:
@@ -339,7 +394,7 @@ def archive(ref: str | None = None, list_archived: bool = False) -> None:
     from .lib.resolve import resolve_habit
 
     if list_archived:
-        archived_habits = get_archived_habits()
+        archived_habits = get_archived_habits(since=clock.today())
         if not archived_habits:
             echo("no archived habits")
             return
@@ -355,8 +410,11 @@ def archive(ref: str | None = None, list_archived: bool = False) -> None:
 
 
 @cli("life")
-def habits() -> None:
-    """Show habits matrix"""
-    from .lib.render import render_habit_matrix
+def habits(streaks: bool = False) -> None:
+    """Show habits matrix, or current and longest streaks (--streaks)"""
+    from .lib.render import render_habit_matrix, render_habit_streaks
 
-    echo(render_habit_matrix(get_habits()))
+    if streaks:
+        echo(render_habit_streaks(get_habits(since=clock.today()), get_streaks()))
+        return
+    echo(render_habit_matrix(get_habits(since=_matrix_since())))
@@ -38,6 +38,13 @@ def _check_fts_integrity(conn: sqlite3.Connection) -> list[str]:
     return corrupted
 
 
+def _check_task_cycles(conn: sqlite3.Connection) -> dict[str, list[list[str]]]:
+    from life.graph import find_cycles
+
+    found = {edge: find_cycles(edge, conn) for edge in ("blocked_by", "parent_id")}
+    return {edge: cycles for edge, cycles in found.items() if cycles}
+
+
 def _expected_schema(migrations_path: Path) -> dict[str, set[str]] | None:
     mem = sqlite3.connect(":memory:")
     try:
@@ -97,6 +104,7 @@ def score() -> dict[str, Any]:
     fk_violations: dict[str, int] = {}
     schema_drift: list[str] = []
     fts_corrupted: list[str] = []
+    task_cycles: dict[str, list[list[str]]] = {}
     table_counts: dict[str, int] = {}
 
     try:
@@ -117,6 +125,10 @@ def score() -> dict[str, Any]:
             if fts_corrupted:
                 issues.append(f"FTS corrupted: {', '.join(fts_corrupted)}")
 
+            task_cycles = _check_task_cycles(conn)
+            if task_cycles:
+                issues.append(f"task cycles: {sum(map(len, task_cycles.values()))}")
+
             for table in _core_tables(conn):
                 table_counts[table] = conn.execute(
                     f'SELECT COUNT(*) FROM "{table}"'  # noqa: S608
@@ -134,6 +146,7 @@ def score() -> dict[str, Any]:
         "fk_violations": fk_violations,
         "schema_drift": schema_drift,
         "fts_corrupted": fts_corrupted,
+        "task_cycles": task_cycles,
         "table_counts": table_counts,
     }
 
@@ -159,6 +172,12 @@ def cli() -> None:
         for item in result["schema_drift"]:
             echo(f"  {item}")
 
+    if result.get("task_cycles"):
+        echo("\nTask cycles:")
+        for edge, cycles in result["task_cycles"].items():
+            for cycle in cycles:
+                echo(f"  {edge}: {' → '.join(i[:8] for i in [*cycle, cycle[0]])}")
+
     if not result["ok"]:
         raise SystemExit(1)
 
@@ -40,15 +40,18 @@ def get_improvements(done: bool = False) -> list[Improvement]:
 
 
 def mark_improvement_done(query: str) -> Improvement | None:
-    improvements = get_improvements()
-    if not improvements:
-        return None
-    q = query.lower()
-    matches = [i for i in improvements if q in i.body.lower()]
-    if not matches:
+    from .search import find_body_id
+
+    improvement_id = find_body_id(
+        "improvements", query, scope="done_at IS NULL", order="logged_at DESC, id DESC"
+    )
+    if improvement_id is None:
         return None
-    target = matches[0]
     with get_db() as conn:
+        row = conn.execute(
+            "SELECT id, body, logged_at, done_at FROM improvements WHERE id = ?", (improvement_id,)
+        ).fetchone()
+        target = Improvement(id=row[0], body=row[1], logged_at=datetime.fromisoformat(row[2]))
         conn.execute(
             "UPDATE improvements SET done_at = STRFTIME('%Y-%m-%dT%H:%M:%S', 'now') WHERE id = ?",
             (target.id,),
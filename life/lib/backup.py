@@ -1,14 +1,48 @@
+"""Content-addressed incremental snapshots of the database under config.BACKUP_DIR.
+
+An online sqlite3 backup is split into fixed CHUNK_SIZE chunks (a multiple of every
+SQLite page size, so a changed page dirties exactly one chunk). Each chunk is stored
+once, zlib-compressed, at chunks/<ab>/<sha256 of the raw bytes>; a snapshot is a
+<timestamp>/manifest.json listing its chunks in order. Unchanged pages cost nothing
+after the first snapshot, and prune() thins old snapshots to hourly/daily/weekly
+buckets before dropping chunks no manifest references.
+
+Snapshots written before this layout (a <timestamp>/life.db full copy) are still
+listed, diffed against and restorable.
+"""
+
 import contextlib
+import fcntl
+import hashlib
+import json
+import os
 import shutil
 import sqlite3
+import zlib
+from collections.abc import Callable, Generator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from life import config
 
+__all__ = ["CHUNK_SIZE", "backup", "list_snapshots", "prune", "restore"]
+
 _SKIP_TABLES = {"_migrations"}
 
+CHUNK_SIZE = 64 * 1024
+
+_STAMP = "%Y%m%d_%H%M%S_%f"
+_MANIFEST = "manifest.json"
+_LEGACY_DB = "life.db"
+
+# Snapshots prune() keeps: the newest KEEP_LAST, plus the newest in each of the most
+# recent KEEP_HOURLY hours, KEEP_DAILY days and KEEP_WEEKLY ISO weeks that have one.
+KEEP_LAST = 5
+KEEP_HOURLY = 24
+KEEP_DAILY = 7
+KEEP_WEEKLY = 8
+
 
 def _is_core_table(name: str) -> bool:
     return name not in _SKIP_TABLES and not ("_fts" in name or name.startswith("fts_"))
@@ -46,49 +80,122 @@ def _row_counts(db_path: Path) -> dict[str, int]:
         return {}
 
 
-def _get_previous_backup(current_path: Path) -> Path | None:
+def _integrity_ok(db_path: Path) -> bool:
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=2)
+        try:
+            return conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        finally:
+            conn.close()
+    except Exception:
+        return False
+
+
+@contextlib.contextmanager
+def _locked() -> Generator[Path, None, None]:
+    """Hold the backup directory lock, so pruning never races a snapshot or restore."""
     backup_dir = config.BACKUP_DIR
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    with (backup_dir / ".lock").open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield backup_dir
+
+
+def _chunk_path(backup_dir: Path, digest: str) -> Path:
+    return backup_dir / "chunks" / digest[:2] / digest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _snapshots(backup_dir: Path) -> list[tuple[datetime, Path]]:
+    """(taken, dir) for every snapshot, oldest first."""
     if not backup_dir.exists():
-        return None
-    snapshots = sorted(backup_dir.iterdir(), reverse=True)
-    for s in snapshots:
-        if s == current_path:
+        return []
+    found = []
+    for path in backup_dir.iterdir():
+        try:
+            taken = datetime.strptime(path.name, _STAMP)
+        except ValueError:
             continue
-        if (s / "life.db").exists():
-            return s / "life.db"
-    return None
+        if (path / _MANIFEST).exists() or (path / _LEGACY_DB).exists():
+            found.append((taken, path))
+    return sorted(found)
+
+
+def _manifest(snapshot: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads((snapshot / _MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _snapshot_rows(snapshot: Path) -> dict[str, int]:
+    manifest = _manifest(snapshot)
+    if manifest is not None:
+        return manifest["rows"]
+    return _row_counts(snapshot / _LEGACY_DB)
 
 
-def backup() -> dict[str, Any]:
-    src = config.DB_PATH
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    backup_path = config.BACKUP_DIR / timestamp
-    backup_path.mkdir(parents=True, exist_ok=True)
+def _store_chunks(backup_dir: Path, db_file: Path) -> tuple[list[str], int, int]:
+    """Chunk db_file into the store; (digests in order, new chunks, bytes written)."""
+    digests: list[str] = []
+    new = written = 0
+    with db_file.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest = hashlib.sha256(chunk).hexdigest()
+            digests.append(digest)
+            path = _chunk_path(backup_dir, digest)
+            if not path.exists():
+                data = zlib.compress(chunk)
+                _write_atomic(path, data)
+                new += 1
+                written += len(data)
+    return digests, new, written
 
-    dst = backup_path / "life.db"
-    _sqlite_backup(src, dst)
 
-    for suffix in ["-shm", "-wal"]:
-        wal = src.parent / f"{src.stem}{suffix}"
-        if wal.exists():
-            shutil.copy2(wal, backup_path / wal.name)
+def backup(prune_after: bool = True) -> dict[str, Any]:
+    """Snapshot the live database; unchanged chunks are shared with earlier snapshots."""
+    with _locked() as backup_dir:
+        result = _backup(backup_dir)
+        result["pruned"] = len(_prune(backup_dir)) if prune_after else 0
+    return result
 
+
+def _backup(backup_dir: Path) -> dict[str, Any]:
+    taken = datetime.now()
+    snapshot = backup_dir / taken.strftime(_STAMP)
+    previous = _snapshots(backup_dir)
+
+    staged = backup_dir / f".staging-{os.getpid()}.db"
     try:
-        conn = sqlite3.connect(str(dst), timeout=2)
-        try:
-            result = conn.execute("PRAGMA integrity_check").fetchone()[0]
-            integrity_ok = result == "ok"
-        finally:
-            conn.close()
-    except Exception:
-        integrity_ok = False
+        _sqlite_backup(config.DB_PATH, staged)
+        integrity_ok = _integrity_ok(staged)
+        current_counts = _row_counts(staged)
+        size = staged.stat().st_size
+        digests, new_chunks, written = _store_chunks(backup_dir, staged)
+    finally:
+        staged.unlink(missing_ok=True)
 
-    current_counts = _row_counts(dst)
-    total = sum(current_counts.values())
+    manifest = {
+        "version": 1,
+        "taken": taken.isoformat(),
+        "size": size,
+        "chunk_size": CHUNK_SIZE,
+        "chunks": digests,
+        "rows": current_counts,
+        "integrity_ok": integrity_ok,
+    }
+    snapshot.mkdir(parents=True)
+    _write_atomic(snapshot / _MANIFEST, json.dumps(manifest).encode())
 
-    previous_db = _get_previous_backup(backup_path)
-    if previous_db and previous_db.exists():
-        prev_counts = _row_counts(previous_db)
+    total = sum(current_counts.values())
+    if previous:
+        prev_counts = _snapshot_rows(previous[-1][1])
         prev_total = sum(prev_counts.values())
         delta_total = total - prev_total
         delta_by_table = {
@@ -101,9 +208,136 @@ def backup() -> dict[str, Any]:
         delta_by_table = {}
 
     return {
-        "path": backup_path,
+        "path": snapshot,
         "integrity_ok": integrity_ok,
         "rows": total,
         "delta_total": delta_total,
         "delta_by_table": delta_by_table,
+        "chunks": len(digests),
+        "new_chunks": new_chunks,
+        "bytes_written": written,
     }
+
+
+def list_snapshots() -> list[Path]:
+    """Snapshot directories, oldest first."""
+    return [path for _, path in _snapshots(config.BACKUP_DIR)]
+
+
+def _retained(
+    taken: list[datetime], keep_last: int, keep_hourly: int, keep_daily: int, keep_weekly: int
+) -> set[datetime]:
+    newest_first = sorted(taken, reverse=True)
+    keep = set(newest_first[:keep_last])
+    buckets: list[tuple[int, Callable[[datetime], object]]] = [
+        (keep_hourly, lambda t: (t.date(), t.hour)),
+        (keep_daily, lambda t: t.date()),
+        (keep_weekly, lambda t: t.isocalendar()[:2]),
+    ]
+    for count, bucket_of in buckets:
+        seen: set[object] = set()
+        for t in newest_first:
+            bucket = bucket_of(t)
+            if bucket in seen:
+                continue
+            if len(seen) == count:
+                break
+            seen.add(bucket)
+            keep.add(t)
+    return keep
+
+
+def prune(
+    keep_last: int = KEEP_LAST,
+    keep_hourly: int = KEEP_HOURLY,
+    keep_daily: int = KEEP_DAILY,
+    keep_weekly: int = KEEP_WEEKLY,
+) -> list[Path]:
+    """Drop snapshots outside the retention buckets, then unreferenced chunks."""
+    with _locked() as backup_dir:
+        return _prune(backup_dir, keep_last, keep_hourly, keep_daily, keep_weekly)
+
+
+def _prune(
+    backup_dir: Path,
+    keep_last: int = KEEP_LAST,
+    keep_hourly: int = KEEP_HOURLY,
+    keep_daily: int = KEEP_DAILY,
+    keep_weekly: int = KEEP_WEEKLY,
+) -> list[Path]:
+    snapshots = _snapshots(backup_dir)
+    keep = _retained(
+        [taken for taken, _ in snapshots], keep_last, keep_hourly, keep_daily, keep_weekly
+    )
+    removed = [path for taken, path in snapshots if taken not in keep]
+    for path in removed:
+        shutil.rmtree(path)
+
+    referenced = set()
+    for taken, path in snapshots:
+        if taken in keep and (manifest := _manifest(path)) is not None:
+            referenced.update(manifest["chunks"])
+    chunks_dir = backup_dir / "chunks"
+    if chunks_dir.exists():
+        for path in chunks_dir.glob("*/*"):
+            if path.name not in referenced:
+                path.unlink()
+    return removed
+
+
+def _resolve(backup_dir: Path, name: str) -> Path:
+    snapshots = [path for _, path in _snapshots(backup_dir)]
+    if not snapshots:
+        raise ValueError("no snapshots yet: run `life db backup`")
+    if name == "latest":
+        return snapshots[-1]
+    matches = [path for path in snapshots if path.name.startswith(name)]
+    if not matches:
+        raise ValueError(f"no snapshot matching '{name}'")
+    if len(matches) > 1:
+        raise ValueError(
+            f"'{name}' matches {len(matches)} snapshots: {matches[0].name} … {matches[-1].name}"
+        )
+    return matches[0]
+
+
+def _assemble(backup_dir: Path, manifest: dict[str, Any], dst: Path) -> None:
+    """Rebuild a snapshot's database file at dst, verifying every chunk on the way."""
+    with dst.open("wb") as out:
+        for digest in manifest["chunks"]:
+            try:
+                chunk = zlib.decompress(_chunk_path(backup_dir, digest).read_bytes())
+            except (OSError, zlib.error) as e:
+                raise ValueError(f"snapshot chunk {digest[:12]} unreadable: {e}") from e
+            if hashlib.sha256(chunk).hexdigest() != digest:
+                raise ValueError(f"snapshot chunk {digest[:12]} is corrupt")
+            out.write(chunk)
+    if dst.stat().st_size != manifest["size"]:
+        raise ValueError("snapshot is truncated")
+
+
+def restore(name: str) -> dict[str, Any]:
+    """Replace the live database with snapshot name ('latest', a name or unique prefix).
+
+    The live database is snapshotted first (reported as "safety"), so a restore can be
+    undone with another restore.
+    """
+    with _locked() as backup_dir:
+        snapshot = _resolve(backup_dir, name)
+        manifest = _manifest(snapshot)
+        staged = backup_dir / f".restore-{os.getpid()}.db"
+        try:
+            if manifest is not None:
+                _assemble(backup_dir, manifest, staged)
+                source = staged
+            else:
+                source = snapshot / _LEGACY_DB
+            if not _integrity_ok(source):
+                raise ValueError(f"snapshot {snapshot.name} fails integrity_check")
+            safety = _backup(backup_dir)["path"] if config.DB_PATH.exists() else None
+            # The backup API writes through SQLite, so the live WAL and any other
+            # connections stay consistent; copying the file over them would not.
+            _sqlite_backup(source, config.DB_PATH)
+        finally:
+            staged.unlink(missing_ok=True)
+    return {"path": snapshot, "rows": sum(_row_counts(config.DB_PATH).values()), "safety": safety}
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 from datetime import date, datetime
 from typing import TypeVar, cast
 
@@ -10,8 +11,12 @@ TaskRow = tuple[object, ...]
 HabitRow = tuple[object, ...]
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_date(val) -> date | None:
-    """Parse a date value that may be str or numeric timestamp."""
+    """Parse a date value that may be str or numeric timestamp.
+
+    Cached: bulk listings share a handful of scheduled dates, so rows share one object.
+    """
     if isinstance(val, str) and val:
         return date.fromisoformat(val.split("T")[0])
     if isinstance(val, (int, float)):
@@ -43,40 +48,47 @@ def _parse_datetime_optional(val) -> datetime | None:
     return None
 
 
-def row_to_task(row: TaskRow) -> Task:
+def row_to_task(row: TaskRow, tags: list[str] | None = None) -> Task:
     """
-    Converts a raw database row from tasks table into a Task object.
+    Converts a raw database row from tasks table into a Task object, tags attached.
     Expected row format: (id, content, focus, scheduled_date, created, completed, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline)
     """
+    n = len(row)
     return Task(
         id=cast(str, row[0]),
         content=cast(str, row[1]),
         focus=bool(row[2]),
-        scheduled_date=_parse_date(row[3]),
+        scheduled_date=_parse_date(row[3]) if row[3] is not None else None,
         created=_parse_datetime(row[4]),
-        completed_at=_parse_datetime_optional(row[5]),
-        parent_id=cast(str, row[6]) if len(row) > 6 and row[6] is not None else None,
-        scheduled_time=cast(str, row[7]) if len(row) > 7 and row[7] is not None else None,
-        blocked_by=cast(str, row[8]) if len(row) > 8 and row[8] is not None else None,
-        description=cast(str, row[9]) if len(row) > 9 and row[9] is not None else None,
-        steward=bool(row[10]) if len(row) > 10 and row[10] is not None else False,
-        source=cast(str, row[11]) if len(row) > 11 and row[11] is not None else None,
-        is_deadline=bool(row[12]) if len(row) > 12 and row[12] is not None else False,
+        completed_at=_parse_datetime_optional(row[5]) if row[5] is not None else None,
+        parent_id=cast(str | None, row[6]) if n > 6 else None,
+        scheduled_time=cast(str | None, row[7]) if n > 7 else None,
+        blocked_by=cast(str | None, row[8]) if n > 8 else None,
+        description=cast(str | None, row[9]) if n > 9 else None,
+        steward=bool(row[10]) if n > 10 else False,
+        source=cast(str | None, row[11]) if n > 11 else None,
+        is_deadline=bool(row[12]) if n > 12 else False,
+        tags=tags if tags is not None else [],
     )
 
 
-def row_to_habit(row: HabitRow) -> Habit:
+def row_to_habit(
+    row: HabitRow, checks: list[datetime] | None = None, tags: list[str] | None = None
+) -> Habit:
     """
-    Converts a raw database row from habits table into a Habit object.
+    Converts a raw database row from habits table into a Habit object, checks and tags attached.
     Expected row format: (id, content, created, archived_at, parent_id, private)
     """
+    n = len(row)
     return Habit(
         id=cast(str, row[0]),
         content=cast(str, row[1]),
         created=_parse_datetime(row[2]),
-        archived_at=_parse_datetime_optional(row[3]) if len(row) > 3 else None,
-        parent_id=cast(str, row[4]) if len(row) > 4 and row[4] is not None else None,
-        private=bool(row[5]) if len(row) > 5 and row[5] is not None else False,
+        archived_at=_parse_datetime_optional(row[3]) if n > 3 else None,
+        parent_id=cast(str | None, row[4]) if n > 4 else None,
+        private=bool(row[5]) if n > 5 else False,
+        checks=checks if checks is not None else [],
+        tags=tags if tags is not None else [],
     )
 
 
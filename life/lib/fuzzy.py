@@ -1,16 +1,21 @@
-from collections.abc import Sequence
+import re
+import sqlite3
+from collections.abc import Mapping, Sequence
 from difflib import get_close_matches
 from typing import TypeVar
 
 from life.lib.errors import exit_error
 from life.models import Habit, Task
 
-__all__ = ["find_in_pool", "find_in_pool_exact"]
+__all__ = ["find_in_pool", "find_in_pool_exact", "find_in_table", "fts_phrase"]
 
 FUZZY_MATCH_CUTOFF = 0.8
+TRIGRAM_MIN_LENGTH = 3
 
 T = TypeVar("T", Task, Habit)
 
+_UUID_REF = re.compile(r"[0-9a-f-]+")
+
 
 def _match_uuid_prefix[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | None:
     ref_lower = ref.lower()
@@ -65,3 +70,95 @@ def find_in_pool_exact[T: (Task, Habit)](ref: str, pool: Sequence[T]) -> T | Non
     if not pool:
         return None
     return _match_uuid_prefix(ref, pool) or _match_substring(ref, pool)
+
+
+def fts_phrase(text: str) -> str:
+    """Quote text as a single FTS5 phrase so user input is never parsed as query syntax."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _select(
+    conn: sqlite3.Connection,
+    table: str,
+    where: str,
+    scope: str,
+    params: Mapping[str, object],
+    limit: int,
+):
+    return conn.execute(
+        f"SELECT id, content FROM {table} WHERE {where} AND ({scope}) LIMIT {limit}",  # noqa: S608
+        params,
+    ).fetchall()
+
+
+def find_in_table(
+    conn: sqlite3.Connection,
+    ref: str,
+    table: str,
+    scope: str = "1",
+    params: Mapping[str, object] | None = None,
+    fuzzy: bool = True,
+    trigram: str | None = None,
+) -> str | None:
+    """Resolve ref to an id in table with the same precedence as find_in_pool.
+
+    UUID prefixes use the primary key. SQLite's lower() only folds ASCII, so content
+    is compared in Python with str.lower(), as find_in_pool does; SQL only narrows the
+    rows: the lower(content) index for an ASCII exact hit, the trigram FTS table (which
+    folds Unicode case) when given and ref is long enough, otherwise every row in scope.
+    Fuzzy scoring only sees rows whose length can reach FUZZY_MATCH_CUTOFF.
+    scope is a trusted SQL filter bound against params.
+    """
+    ref_lower = ref.lower()
+    params = {**(params or {}), "ref": ref_lower}
+
+    if _UUID_REF.fullmatch(ref_lower):
+        exact = _select(conn, table, "id = :ref", scope, params, 1)
+        if exact:
+            return exact[0][0]
+        matches = _select(
+            conn, table, "id GLOB :prefix", scope, {**params, "prefix": f"{ref_lower}*"}, 3
+        )
+        if len(matches) == 1:
+            return matches[0][0]
+        if matches:
+            sample = ", ".join(row[0][:8] for row in matches)
+            exit_error(f"Ambiguous ref '{ref}' matches multiple items: {sample}")
+
+    exact = _select(conn, table, "lower(content) = :ref", scope, params, 1)
+    if exact and exact[0][1].lower() == ref_lower:
+        return exact[0][0]
+    if trigram and len(ref_lower) >= TRIGRAM_MIN_LENGTH:
+        narrow = f"rowid IN (SELECT rowid FROM {trigram} WHERE {trigram} MATCH :phrase)"  # noqa: S608
+        params["phrase"] = fts_phrase(ref_lower)
+    else:
+        narrow = "1"
+    rows = conn.execute(
+        f"SELECT id, content FROM {table} WHERE {narrow} AND ({scope})",  # noqa: S608
+        params,
+    ).fetchall()
+    exact_id = next((item_id for item_id, content in rows if content.lower() == ref_lower), None)
+    if exact_id:
+        return exact_id
+    matches = [(item_id, content) for item_id, content in rows if ref_lower in content.lower()]
+    if len(matches) == 1:
+        return matches[0][0]
+    if matches:
+        sample = ", ".join(f'"{content}"' for _, content in matches[:3])
+        exit_error(f"Ambiguous match for '{ref}': {sample}")
+
+    if not fuzzy:
+        return None
+    # difflib's ratio is 2M/(a+b) with M <= min(a, b), so a match needs min/max >= cutoff/(2-cutoff).
+    bound = FUZZY_MATCH_CUTOFF / (2 - FUZZY_MATCH_CUTOFF)
+    candidates = [
+        (item_id, content.lower())
+        for item_id, content in conn.execute(
+            f"SELECT id, content FROM {table} WHERE length(content) BETWEEN :lo AND :hi AND ({scope})",  # noqa: S608
+            {**params, "lo": int(len(ref_lower) * bound), "hi": int(len(ref_lower) / bound) + 1},
+        )
+    ]
+    best = get_close_matches(ref_lower, [c for _, c in candidates], n=1, cutoff=FUZZY_MATCH_CUTOFF)
+    if best:
+        return next(item_id for item_id, content in candidates if content == best[0])
+    return None
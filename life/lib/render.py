@@ -1,8 +1,10 @@
+import io
 from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date, timedelta
+from typing import TextIO
 
-from life.habits import get_subhabits
-from life.models import Habit, Task, TaskMutation
+from life.models import DashboardSnapshot, Habit, HabitStreak, MomentumBucket, Task, TaskMutation
 from life.tasks import _task_sort_key
 
 from . import clock
@@ -12,14 +14,18 @@ from .format import format_habit, format_task
 __all__ = [
     "render_dashboard",
     "render_habit_matrix",
+    "render_habit_streaks",
     "render_item_list",
     "render_momentum",
+    "render_momentum_history",
     "render_task_detail",
 ]
 
 _R = ANSI.RESET
 _GREY = ANSI.MUTED
 
+HABIT_MATRIX_DAYS = 7
+
 
 def _fmt_time(t: str) -> str:
     return f"{ANSI.SECONDARY}{t}{_R}"
@@ -44,11 +50,11 @@ def _fmt_tags(tags: list[str], tag_colors: dict[str, str]) -> str:
     return " " + " ".join(parts)
 
 
-def _get_direct_tags(task: Task, all_pending: list[Task]) -> list[str]:
+def _get_direct_tags(task: Task, by_id: dict[str, Task]) -> list[str]:
     if not task.parent_id:
         return task.tags
 
-    parent = next((t for t in all_pending if t.id == task.parent_id), None)
+    parent = by_id.get(task.parent_id)
     if not parent:
         return task.tags
 
@@ -61,6 +67,41 @@ def _build_tag_colors(items: Sequence[Task | Habit]) -> dict[str, str]:
     return {tag: ANSI.POOL[i % len(ANSI.POOL)] for i, tag in enumerate(tags)}
 
 
+@dataclass(frozen=True)
+class _Index:
+    """Lookups built once per dashboard render, so no row rescans the pending list."""
+
+    tag_colors: dict[str, str]
+    pending_by_id: dict[str, Task]
+    subtasks: dict[str, list[Task]]  # parent id → pending subtasks, in _task_sort_key order
+    completed_subs: dict[str, list[Task]]  # parent id → subtasks completed today
+    by_date: dict[date, list[Task]]  # scheduled date → pending top-level tasks
+
+
+def _build_index(
+    all_pending: list[Task], today_items: list[Task | Habit], tag_colors: dict[str, str]
+) -> _Index:
+    subtasks: dict[str, list[Task]] = {}
+    for t in sorted(all_pending, key=_task_sort_key):
+        if t.parent_id:
+            subtasks.setdefault(t.parent_id, []).append(t)
+    by_date: dict[date, list[Task]] = {}
+    for t in all_pending:
+        if t.scheduled_date and not t.parent_id:
+            by_date.setdefault(t.scheduled_date, []).append(t)
+    completed_subs: dict[str, list[Task]] = {}
+    for t in today_items:
+        if isinstance(t, Task) and t.parent_id:
+            completed_subs.setdefault(t.parent_id, []).append(t)
+    return _Index(
+        tag_colors=tag_colors,
+        pending_by_id={t.id: t for t in all_pending},
+        subtasks=subtasks,
+        completed_subs=completed_subs,
+        by_date=by_date,
+    )
+
+
 def _get_trend(current: int, previous: int) -> str:
     if previous == 0:
         return "↗" if current > 0 else "→"
@@ -71,41 +112,37 @@ def _get_trend(current: int, previous: int) -> str:
     return "→"
 
 
-def _render_subtask_row(
-    sub: Task,
-    all_pending: list[Task],
-    tag_colors: dict[str, str],
-    indent: str = "    └ ",
-) -> str:
+def _render_subtask_row(sub: Task, index: _Index, indent: str = "    └ ") -> str:
     sub_id_str = f" {_GREY}[{sub.id[:8]}]{_R}"
-    sub_direct_tags = _get_direct_tags(sub, all_pending)
-    sub_tags_str = _fmt_tags(sub_direct_tags, tag_colors)
+    sub_direct_tags = _get_direct_tags(sub, index.pending_by_id)
+    sub_tags_str = _fmt_tags(sub_direct_tags, index.tag_colors)
     sub_time_str = f"{_fmt_time(sub.scheduled_time)} " if sub.scheduled_time else ""
     return f"{indent}{sub_time_str}{sub.content.lower()}{sub_tags_str}{sub_id_str}{_R}"
 
 
 def _render_header(
-    today: date, tasks_done: int, habits_done: int, total_habits: int, added: int, deleted: int
-) -> list[str]:
+    out: TextIO,
+    today: date,
+    tasks_done: int,
+    habits_done: int,
+    total_habits: int,
+    added: int,
+    deleted: int,
+) -> None:
     now = clock.now()
     day_str = f"{today.strftime('%a')} · {today.strftime('%-d %b %Y')} · {now.strftime('%H:%M')}"
-    lines = [f"\n{bold(white(day_str))}"]
-    lines.append(f"{_GREY}done:{_R} {green(str(tasks_done))}")
-    lines.append(f"{_GREY}habits:{_R} {cyan(str(habits_done))}{_GREY}/{total_habits}{_R}")
+    out.write(f"\n{bold(white(day_str))}\n")
+    out.write(f"{_GREY}done:{_R} {green(str(tasks_done))}\n")
+    out.write(f"{_GREY}habits:{_R} {cyan(str(habits_done))}{_GREY}/{total_habits}{_R}\n")
     if added:
-        lines.append(f"{_GREY}added:{_R} {gold(str(added))}")
+        out.write(f"{_GREY}added:{_R} {gold(str(added))}\n")
     if deleted:
-        lines.append(f"{_GREY}deleted:{_R} {red(str(deleted))}")
-    return lines
+        out.write(f"{_GREY}deleted:{_R} {red(str(deleted))}\n")
 
 
-def _render_done(
-    today_items: list[Task | Habit],
-    all_pending: list[Task],
-    tag_colors: dict[str, str],
-) -> list[str]:
+def _render_done(out: TextIO, today_items: list[Task | Habit], index: _Index) -> None:
     if not today_items:
-        return []
+        return
 
     def _sort_key(item):
         if isinstance(item, Task) and item.completed_at:
@@ -115,113 +152,95 @@ def _render_done(
         return item.created
 
     sorted_items = sorted(today_items, key=_sort_key)
-    pending_by_id = {t.id: t for t in all_pending}
+    today = clock.today()
 
-    lines = [bold(green("DONE:"))]
+    out.write(f"\n{bold(green('DONE:'))}\n")
     for item in sorted_items:
-        tags_str = _fmt_tags(item.tags, tag_colors)
+        tags_str = _fmt_tags(item.tags, index.tag_colors)
         content = item.content.lower()
         id_str = f" {_GREY}[{item.id[:8]}]{_R}"
         if isinstance(item, Habit):
             time_str = ""
             if item.checks:
                 latest_check = max(item.checks)
-                if latest_check.date() == clock.today():
+                if latest_check.date() == today:
                     time_str = latest_check.strftime("%H:%M")
-            lines.append(f"  {gray('✓')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}")
+            out.write(f"  {gray('✓')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}\n")
         elif item.completed_at:
             time_str = item.completed_at.strftime("%H:%M")
             parent_str = ""
             if item.parent_id:
-                parent = pending_by_id.get(item.parent_id)
+                parent = index.pending_by_id.get(item.parent_id)
                 if parent and not parent.completed_at:
                     parent_str = f" {dim('→ ' + parent.content.lower())}"
-            lines.append(
-                f"  {green('✓')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}{parent_str}"
+            out.write(
+                f"  {green('✓')} {_GREY}{time_str}{_R} {content}{tags_str}{id_str}{parent_str}\n"
             )
-    return lines
 
 
-def _render_upcoming_dates(today: date) -> list[str]:
+def _render_upcoming_dates(out: TextIO) -> None:
     from life.lib.dates import upcoming_dates
 
     try:
         upcoming = upcoming_dates(within_days=14)
     except Exception:
-        return []
-    if not upcoming:
-        return []
-    lines = []
+        return
     type_emoji = {"birthday": "🎂", "anniversary": "💍", "deadline": "⚠️", "other": "📌"}
     for d in upcoming:
         emoji = type_emoji.get(d["type"], "📌")
         days = d["days_until"]
         days_str = "today!" if days == 0 else f"in {days}d"
-        lines.append(f"{emoji} {d['name']} — {days_str}")
-    return lines
+        out.write(f"{emoji} {d['name']} — {days_str}\n")
 
 
-def _render_today_tasks(
-    due_today: list[Task],
-    tag_colors: dict[str, str],
-    task_id_to_content: dict[str, str],
-    subtasks_by_parent: dict[str, list[Task]],
-    all_pending: list[Task],
-) -> tuple[list[str], set[str]]:
-    lines = [f"\n{bold(white('TODAY:'))}"]
+def _render_today_tasks(out: TextIO, due_today: list[Task], index: _Index) -> set[str]:
+    out.write(f"\n{bold(white('TODAY:'))}\n")
     scheduled_ids: set[str] = set()
 
     if not due_today:
-        lines.append(f"  {gray('nothing scheduled.')}")
-        return lines, scheduled_ids
+        out.write(f"  {gray('nothing scheduled.')}\n")
+        return scheduled_ids
 
     def _sort_key(task: Task):
         if task.scheduled_time:
             return (0, task.scheduled_time, not task.focus)
         return (1, "", not task.focus)
 
-    sorted_today = sorted(due_today, key=_sort_key)
-
-    for task in sorted_today:
+    for task in sorted(due_today, key=_sort_key):
         scheduled_ids.add(task.id)
-        tags_str = _fmt_tags(task.tags, tag_colors)
+        tags_str = _fmt_tags(task.tags, index.tag_colors)
         id_str = f" {_GREY}[{task.id[:8]}]{_R}"
         time_str = f"{_fmt_time(task.scheduled_time)} " if task.scheduled_time else ""
 
         if task.blocked_by:
-            blocker = task_id_to_content.get(task.blocked_by, task.blocked_by[:8])
-            blocked_str = f" {dim('← ' + blocker.lower())}"
-            lines.append(
-                f"  ⊘ {time_str}{_GREY}{task.content.lower()}{_R}{tags_str}{blocked_str}{id_str}"
+            blocker = index.pending_by_id.get(task.blocked_by)
+            blocker_str = blocker.content if blocker else task.blocked_by[:8]
+            blocked_str = f" {dim('← ' + blocker_str.lower())}"
+            out.write(
+                f"  ⊘ {time_str}{_GREY}{task.content.lower()}{_R}{tags_str}{blocked_str}{id_str}\n"
             )
         else:
             fire = f" {ANSI.BOLD}🔥{_R}" if task.focus else ""
-            lines.append(f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{id_str}")
+            out.write(f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{id_str}\n")
 
-        for sub in sorted(subtasks_by_parent.get(task.id, []), key=_task_sort_key):
+        for sub in index.subtasks.get(task.id, []):
             scheduled_ids.add(sub.id)
-            lines.append(_render_subtask_row(sub, all_pending, tag_colors))
+            out.write(_render_subtask_row(sub, index) + "\n")
 
-    return lines, scheduled_ids
+    return scheduled_ids
 
 
-def _render_day_tasks(
-    due_day: list[Task],
-    label: str,
-    tag_colors: dict[str, str],
-    subtasks_by_parent: dict[str, list[Task]],
-    all_pending: list[Task],
-) -> tuple[list[str], set[str]]:
+def _render_day_tasks(out: TextIO, due_day: list[Task], label: str, index: _Index) -> set[str]:
     if not due_day:
-        return [], set()
+        return set()
 
-    lines = [f"\n{bold(white(label + ':'))}"]
+    out.write(f"\n{bold(white(label + ':'))}\n")
     scheduled_ids: set[str] = set()
 
     display_entries: list[tuple[str, Task, Task | None]] = []
     for task in due_day:
         scheduled_ids.add(task.id)
-        subs = subtasks_by_parent.get(task.id, [])
+        subs = index.subtasks.get(task.id, [])
         if subs:
             for sub in subs:
                 scheduled_ids.add(sub.id)
@@ -232,27 +251,31 @@ def _render_day_tasks(
     display_entries.sort(key=lambda x: (x[0], x[1].created))
 
     for _, task, parent in display_entries:
-        tags = _get_direct_tags(task, all_pending) if parent else task.tags
-        tags_str = _fmt_tags(tags, tag_colors)
+        tags = _get_direct_tags(task, index.pending_by_id) if parent else task.tags
+        tags_str = _fmt_tags(tags, index.tag_colors)
         id_str = f" {_GREY}[{task.id[:8]}]{_R}"
         time_str = f"{_fmt_time(task.scheduled_time)} " if task.scheduled_time else ""
         is_focused = task.focus or (parent and parent.focus)
         fire = f" {ANSI.BOLD}🔥{_R}" if is_focused else ""
         if parent:
             parent_hint = f" {dim('~ ' + parent.content.lower())}"
-            lines.append(f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{parent_hint}{id_str}")
+            out.write(
+                f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{parent_hint}{id_str}\n"
+            )
         else:
-            lines.append(f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{id_str}")
+            out.write(f"  □ {time_str}{task.content.lower()}{tags_str}{fire}{id_str}\n")
 
-    return lines, scheduled_ids
+    return scheduled_ids
 
 
 def _render_habit_row(
+    out: TextIO,
     habit: Habit,
     today_habit_ids: set[str],
     tag_colors: dict[str, str],
+    subhabits_by_parent: dict[str, list[Habit]],
     indent: str = "  ",
-) -> list[str]:
+) -> None:
     tags_str = _fmt_tags(habit.tags, tag_colors)
     today = clock.today()
     p1_start = today - timedelta(days=6)
@@ -262,262 +285,151 @@ def _render_habit_row(
     count_p2 = sum(1 for dt in habit.checks if p2_start <= dt.date() <= p2_end)
     trend = "↗" if count_p1 > count_p2 else "↘" if count_p1 < count_p2 else "→"
     id_str = f" {_GREY}[{habit.id[:8]}]{_R}"
-    lines = []
     if habit.id in today_habit_ids:
-        lines.append(
-            f"{indent}{gray('✓ ' + trend + ' ' + habit.content.lower())}{tags_str}{id_str}"
-        )
+        out.write(f"{indent}{gray('✓ ' + trend + ' ' + habit.content.lower())}{tags_str}{id_str}\n")
     else:
-        lines.append(f"{indent}□ {trend} {habit.content.lower()}{tags_str}{id_str}")
-    for sub in get_subhabits(habit.id):
-        lines.extend(_render_habit_row(sub, today_habit_ids, tag_colors, indent="    └ "))
-    return lines
+        out.write(f"{indent}□ {trend} {habit.content.lower()}{tags_str}{id_str}\n")
+    for sub in subhabits_by_parent.get(habit.id, []):
+        _render_habit_row(
+            out, sub, today_habit_ids, tag_colors, subhabits_by_parent, indent="    └ "
+        )
 
 
 def _render_habits(
-    habits: list[Habit], today_habit_ids: set[str], tag_colors: dict[str, str]
-) -> list[str]:
+    out: TextIO, habits: list[Habit], today_habit_ids: set[str], tag_colors: dict[str, str]
+) -> None:
     visible = [h for h in habits if not h.private and not h.parent_id]
     if not visible:
-        return []
+        return
 
     checked_count = sum(1 for h in habits if h.id in today_habit_ids)
     total = len(habits)
-    lines = [f"\n{bold(white(f'HABITS ({checked_count}/{total}):'))}"]
+    subhabits_by_parent: dict[str, list[Habit]] = {}
+    for h in sorted(habits, key=lambda x: x.created):
+        if h.parent_id and h.archived_at is None:
+            subhabits_by_parent.setdefault(h.parent_id, []).append(h)
+    out.write(f"\n{bold(white(f'HABITS ({checked_count}/{total}):'))}\n")
     sorted_habits = sorted(visible, key=lambda x: x.content.lower())
     unchecked = [h for h in sorted_habits if h.id not in today_habit_ids]
     checked = [h for h in sorted_habits if h.id in today_habit_ids]
     for habit in unchecked + checked:
-        lines.extend(_render_habit_row(habit, today_habit_ids, tag_colors))
-
-    return lines
+        _render_habit_row(out, habit, today_habit_ids, tag_colors, subhabits_by_parent)
 
 
-def _render_overdue(
-    overdue: list[Task],
-    today: date,
-    tag_colors: dict[str, str],
-    subtasks_by_parent: dict[str, list[Task]],
-    all_pending: list[Task],
-) -> tuple[list[str], set[str]]:
-    lines = [f"\n{ANSI.BOLD}{ANSI.RED}OVERDUE:{_R}"]
+def _render_overdue(out: TextIO, overdue: list[Task], today: date, index: _Index) -> set[str]:
+    out.write(f"\n{ANSI.BOLD}{ANSI.RED}OVERDUE:{_R}\n")
     scheduled_ids: set[str] = set()
     for task in sorted(overdue, key=_task_sort_key):
         scheduled_ids.add(task.id)
-        tags_str = _fmt_tags(task.tags, tag_colors)
+        tags_str = _fmt_tags(task.tags, index.tag_colors)
         id_str = f" {_GREY}[{task.id[:8]}]{_R}"
         fire = f" {ANSI.BOLD}🔥{_R}" if task.focus else ""
         label = _fmt_rel_date(task.scheduled_date, today, task.scheduled_time, task.is_deadline)
-        lines.append(f"  □ {label} {task.content.lower()}{tags_str}{fire}{id_str}")
-        for sub in sorted(subtasks_by_parent.get(task.id, []), key=_task_sort_key):
+        out.write(f"  □ {label} {task.content.lower()}{tags_str}{fire}{id_str}\n")
+        for sub in index.subtasks.get(task.id, []):
             scheduled_ids.add(sub.id)
-            lines.append(_render_subtask_row(sub, all_pending, tag_colors))
-    return lines, scheduled_ids
+            out.write(_render_subtask_row(sub, index) + "\n")
+    return scheduled_ids
 
 
 def _render_task_row(
+    out: TextIO,
     task: Task,
     today: date,
-    today_str: str,
-    tomorrow_str: str,
-    tag_colors: dict[str, str],
-    task_id_to_content: dict[str, str],
-    subtasks_by_parent: dict[str, list[Task]],
-    completed_subs_by_parent: dict[str, list[Task]],
-    all_pending: list[Task],
+    tomorrow: date,
+    index: _Index,
     indent: str = "  ",
-) -> list[str]:
-    tags_str = _fmt_tags(task.tags, tag_colors)
+) -> None:
+    tags_str = _fmt_tags(task.tags, index.tag_colors)
     id_str = f" {_GREY}[{task.id[:8]}]{_R}"
 
     date_str = ""
-    if task.scheduled_date and task.scheduled_date.isoformat() not in (today_str, tomorrow_str):
+    if task.scheduled_date and task.scheduled_date not in (today, tomorrow):
         label = _fmt_rel_date(task.scheduled_date, today, task.scheduled_time, task.is_deadline)
         date_str = f"{label} "
 
     if task.blocked_by:
-        blocker = task_id_to_content.get(task.blocked_by, task.blocked_by[:8])
-        blocked_str = f" {dim('← ' + blocker.lower())}"
-        row = f"{indent}⊘ {_GREY}{date_str}{task.content.lower()}{tags_str}{_R}{blocked_str}{id_str}"
+        blocker = index.pending_by_id.get(task.blocked_by)
+        blocker_str = blocker.content if blocker else task.blocked_by[:8]
+        blocked_str = f" {dim('← ' + blocker_str.lower())}"
+        out.write(
+            f"{indent}⊘ {_GREY}{date_str}{task.content.lower()}{tags_str}{_R}{blocked_str}{id_str}\n"
+        )
     else:
         indicator = f"{ANSI.BOLD}🔥{_R} " if task.focus else ""
-        row = f"{indent}{indicator}{date_str}{task.content.lower()}{tags_str}{id_str}"
-
-    rows = [row]
-    for sub in sorted(subtasks_by_parent.get(task.id, []), key=_task_sort_key):
-        rows.append(_render_subtask_row(sub, all_pending, tag_colors, indent=f"{indent}  └ "))
-    for sub in completed_subs_by_parent.get(task.id, []):
-        sub_id_str = f" {_GREY}[{sub.id[:8]}]{_R}"
-        sub_direct_tags = _get_direct_tags(sub, all_pending)
-        sub_tags_str = _fmt_tags(sub_direct_tags, tag_colors)
+        out.write(f"{indent}{indicator}{date_str}{task.content.lower()}{tags_str}{id_str}\n")
+
+    out.writelines(
+        _render_subtask_row(sub, index, indent=f"{indent}  └ ") + "\n"
+        for sub in index.subtasks.get(task.id, [])
+    )
+    for sub in index.completed_subs.get(task.id, []):
+        sub_direct_tags = _get_direct_tags(sub, index.pending_by_id)
+        sub_tags_str = _fmt_tags(sub_direct_tags, index.tag_colors)
         sub_time_str = f"{_fmt_time(sub.scheduled_time)} " if sub.scheduled_time else ""
-        rows.append(
-            f"{indent}  {gray('└ ' + sub_time_str + '✓ ' + sub.content.lower())}{sub_tags_str}{id_str}"
+        out.write(
+            f"{indent}  {gray('└ ' + sub_time_str + '✓ ' + sub.content.lower())}{sub_tags_str}{id_str}\n"
         )
-    return rows
 
 
 def _render_tasks(
-    regular_items: list[Task],
-    today: date,
-    today_str: str,
-    tomorrow_str: str,
-    tag_colors: dict[str, str],
-    task_id_to_content: dict[str, str],
-    subtasks_by_parent: dict[str, list[Task]],
-    completed_subs_by_parent: dict[str, list[Task]],
-    all_pending: list[Task],
-) -> list[str]:
+    out: TextIO, regular_items: list[Task], today: date, tomorrow: date, index: _Index
+) -> None:
     if not regular_items:
-        return []
-
-    subtask_ids = {t.id for t in regular_items if t.parent_id}
-    top_level = [t for t in regular_items if t.id not in subtask_ids]
-    lines_out: list[str] = [f"\n{bold(white(f'TASKS ({len(top_level)}):'))}"]
+        return
 
-    lines: list[str] = []
-    seen: set[str] = set()
+    top_level = [t for t in regular_items if not t.parent_id]
+    out.write(f"\n{bold(white(f'TASKS ({len(top_level)}):'))}\n")
     for task in sorted(top_level, key=lambda t: t.content.lower()):
-        if task.id in seen:
-            continue
-        seen.add(task.id)
-        lines.extend(
-            _render_task_row(
-                task,
-                today,
-                today_str,
-                tomorrow_str,
-                tag_colors,
-                task_id_to_content,
-                subtasks_by_parent,
-                completed_subs_by_parent,
-                all_pending,
-            )
-        )
-
-    return lines_out + lines
+        _render_task_row(out, task, today, tomorrow, index)
 
 
-def render_dashboard(
-    items, today_breakdown, momentum, context, today_items=None, profile=None, verbose=False
-):
-    habits_today, tasks_today, added_today, deleted_today = today_breakdown
+def render_dashboard(snapshot: DashboardSnapshot, verbose: bool = False) -> str:
+    """The dashboard as one string; sections stream into a single buffer as they render."""
+    today_items = snapshot.completed_today or []
     today = clock.today()
-    today_str = today.isoformat()
     tomorrow = today + timedelta(days=1)
-    tomorrow_str = tomorrow.isoformat()
 
-    all_pending = [item for item in items if isinstance(item, Task)]
-    all_items = items + (today_items or [])
-    tag_colors = _build_tag_colors(all_items)
+    all_pending = list(snapshot.pending)
+    habits = list(snapshot.habits)
+    tag_colors = _build_tag_colors([*all_pending, *habits, *today_items])
+    index = _build_index(all_pending, today_items, tag_colors)
+    out = io.StringIO()
 
-    lines: list[str] = []
-
-    habits = [item for item in items if isinstance(item, Habit)]
     total_habits = len({h.id for h in habits})
-    lines.extend(
-        _render_header(today, tasks_today, habits_today, total_habits, added_today, deleted_today)
+    _render_header(
+        out,
+        today,
+        snapshot.tasks_today,
+        snapshot.habits_today,
+        total_habits,
+        snapshot.added_today,
+        snapshot.deleted_today,
     )
+    _render_done(out, today_items, index)
+    _render_upcoming_dates(out)
 
-    done_lines = _render_done(today_items or [], all_pending, tag_colors)
-    if done_lines:
-        lines.append("")
-        lines.extend(done_lines)
-
-    lines.extend(_render_upcoming_dates(today))
-
-    all_subtask_ids = {t.id for t in all_pending if t.parent_id}
-    subtasks_by_parent: dict[str, list[Task]] = {}
-    for t in all_pending:
-        if t.parent_id:
-            subtasks_by_parent.setdefault(t.parent_id, []).append(t)
-
-    task_id_to_content = {t.id: t.content for t in all_pending}
-
-    overdue = [
-        t
-        for t in all_pending
-        if t.scheduled_date and t.scheduled_date < today and t.id not in all_subtask_ids
-    ]
     scheduled_ids: set[str] = set()
+    overdue = [t for day, tasks in index.by_date.items() if day < today for t in tasks]
     if overdue:
-        overdue_lines, overdue_ids = _render_overdue(overdue, today, tag_colors, subtasks_by_parent, all_pending)
-        lines.extend(overdue_lines)
-        scheduled_ids.update(overdue_ids)
-
-    due_today = [
-        t
-        for t in all_pending
-        if t.scheduled_date
-        and t.scheduled_date.isoformat() == today_str
-        and t.id not in all_subtask_ids
-    ]
-
-    today_lines, today_scheduled = _render_today_tasks(
-        due_today,
-        tag_colors,
-        task_id_to_content,
-        subtasks_by_parent,
-        all_pending,
-    )
-    scheduled_ids.update(today_scheduled)
-    lines.extend(today_lines)
+        scheduled_ids |= _render_overdue(out, overdue, today, index)
+
+    scheduled_ids |= _render_today_tasks(out, index.by_date.get(today, []), index)
 
     for offset in range(1, 8):
         day = today + timedelta(days=offset)
-        day_str = day.isoformat()
-        if offset == 1:
-            label = "TOMORROW"
-        elif offset <= 7:
-            label = day.strftime("%A").upper()
-        else:
-            label = day_str
-        due_day = [
-            t
-            for t in all_pending
-            if t.scheduled_date
-            and t.scheduled_date.isoformat() == day_str
-            and t.id not in all_subtask_ids
-        ]
-        day_lines, day_scheduled = _render_day_tasks(
-            due_day,
-            label,
-            tag_colors,
-            subtasks_by_parent,
-            all_pending,
-        )
-        scheduled_ids.update(day_scheduled)
-        lines.extend(day_lines)
+        label = "TOMORROW" if offset == 1 else day.strftime("%A").upper()
+        scheduled_ids |= _render_day_tasks(out, index.by_date.get(day, []), label, index)
 
-    today_habit_items = [item for item in (today_items or []) if isinstance(item, Habit)]
+    today_habit_items = [item for item in today_items if isinstance(item, Habit)]
     today_habit_ids = {item.id for item in today_habit_items}
     all_habits = list(set(habits + today_habit_items))
-    lines.extend(_render_habits(all_habits, today_habit_ids, tag_colors))
-
-    regular_items = [
-        item for item in items if isinstance(item, Task) and item.id not in scheduled_ids
-    ]
-    completed_today_tasks = [i for i in (today_items or []) if isinstance(i, Task)]
-    completed_subs_by_parent: dict[str, list[Task]] = {}
-    for t in completed_today_tasks:
-        if t.parent_id:
-            completed_subs_by_parent.setdefault(t.parent_id, []).append(t)
-
-    lines.extend(
-        _render_tasks(
-            regular_items,
-            today,
-            today_str,
-            tomorrow_str,
-            tag_colors,
-            task_id_to_content,
-            subtasks_by_parent,
-            completed_subs_by_parent,
-            all_pending,
-        )
-    )
+    _render_habits(out, all_habits, today_habit_ids, tag_colors)
+
+    regular_items = [t for t in all_pending if t.id not in scheduled_ids]
+    _render_tasks(out, regular_items, today, tomorrow, index)
 
-    return "\n".join(lines) + "\n"
+    return out.getvalue()
 
 
 def render_momentum(momentum) -> str:
@@ -567,14 +479,14 @@ def render_item_list(items: list[Task | Habit]):
 
 def render_habit_matrix(habits: list[Habit]) -> str:
     lines = []
-    lines.append("HABIT TRACKER (last 7 days)\n")
+    lines.append(f"HABIT TRACKER (last {HABIT_MATRIX_DAYS} days)\n")
 
     if not habits:
         return "No habits found."
 
     today = clock.today()
-    day_names = [(today - timedelta(days=i)).strftime("%a").lower() for i in range(6, -1, -1)]
-    dates = [(today - timedelta(days=i)) for i in range(6, -1, -1)]
+    dates = [today - timedelta(days=i) for i in range(HABIT_MATRIX_DAYS - 1, -1, -1)]
+    day_names = [d.strftime("%a").lower() for d in dates]
 
     header = "habit           " + " ".join(day_names) + "   key"
     lines.append(header)
@@ -602,10 +514,45 @@ def render_habit_matrix(habits: list[Habit]) -> str:
     return "\n".join(lines)
 
 
+def _rate(done: int, total: int) -> str:
+    return f"{done}/{total} ({(done / total) * 100 if total else 0:.0f}%)"
+
+
+def render_momentum_history(buckets: list[MomentumBucket]) -> str:
+    lines = [f"\n{bold(white('MOMENTUM:'))}"]
+    peak = max((b.tasks_completed for b in buckets), default=0)
+    for b in reversed(buckets):
+        bar = "▇" * round(12 * b.tasks_completed / peak) if peak else ""
+        lines.append(
+            f"  {b.start.isoformat()}  tasks {_rate(b.tasks_completed, b.tasks_total):<16}"
+            f" habits {_rate(b.habits_completed, b.habits_total):<16} {green(bar)}"
+        )
+    return "\n".join(lines)
+
+
+def render_habit_streaks(habits: list[Habit], streaks: dict[str, HabitStreak]) -> str:
+    if not habits:
+        return "No habits found."
+
+    lines = ["HABIT STREAKS\n", "habit           current  longest  last"]
+    lines.append("-" * len(lines[-1]))
+    rows = [(h, streaks.get(h.id, HabitStreak(habit_id=h.id))) for h in habits]
+    rows.sort(key=lambda r: (-r[1].current, -r[1].longest, r[0].content.lower()))
+    for habit, streak in rows:
+        last = streak.last_check.isoformat() if streak.last_check else "never"
+        current = green(f"{streak.current:>7}") if streak.current else f"{streak.current:>7}"
+        id_str = f"{_GREY}[{habit.id[:8]}]{_R}"
+        lines.append(
+            f"{habit.content.lower():<15} {current}  {streak.longest:>7}  {last}   {id_str}"
+        )
+
+    return "\n".join(lines)
+
+
 def _render_task_block(
     task: Task,
     subtasks: list[Task],
-    all_tasks: list[Task],
+    by_id: dict[str, Task],
     tag_colors: dict[str, str],
     mutations: list[TaskMutation] | None = None,
     indent: str = "",
@@ -635,7 +582,7 @@ def _render_task_block(
     for sub in sorted(subtasks, key=_task_sort_key):
         sub_status = gray("✓") if sub.completed_at else "□"
         sub_id_str = dim(f"[{sub.id[:8]}]")
-        sub_direct_tags = _get_direct_tags(sub, all_tasks)
+        sub_direct_tags = _get_direct_tags(sub, by_id)
         sub_tags_str = _fmt_tags(sub_direct_tags, tag_colors)
         sub_time_str = f"{dim(_fmt_time(sub.scheduled_time))} " if sub.scheduled_time else ""
         lines.append(
@@ -662,10 +609,11 @@ def render_task_detail(
 ) -> str:
     all_tasks = [task, *subtasks, *(parent_subtasks or []), *([parent] if parent else [])]
     tag_colors = _build_tag_colors(all_tasks)
+    by_id = {t.id: t for t in all_tasks}
 
     if parent:
-        lines = _render_task_block(parent, parent_subtasks or [], all_tasks, tag_colors)
+        lines = _render_task_block(parent, parent_subtasks or [], by_id, tag_colors)
     else:
-        lines = _render_task_block(task, subtasks, all_tasks, tag_colors, mutations)
+        lines = _render_task_block(task, subtasks, by_id, tag_colors, mutations)
 
     return "\n".join(lines)
@@ -1,8 +1,8 @@
+import json
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from statistics import median
+from datetime import date, timedelta
 
-from .models import Task
+from . import db
 from .tasks import count_overdue_resets
 
 DISCOMFORT_TAGS = {"finance", "legal", "janice"}
@@ -19,64 +19,70 @@ class FeedbackSnapshot:
     flags: list[str]
 
 
-def _in_window(ts: datetime | None, start: date, end: date) -> bool:
-    if ts is None:
-        return False
-    day = ts.date()
-    return start <= day <= end
-
-
 def _format_ratio(done: int, created: int) -> str:
     if created == 0:
         return "n/a"
     return f"{done / created:.0%}"
 
 
-def build_feedback_snapshot(
-    *,
-    all_tasks: list[Task],
-    pending_tasks: list[Task],
-    today: date,
-    window_days: int = 7,
-) -> FeedbackSnapshot:
+def build_feedback_snapshot(*, today: date, window_days: int = 7) -> FeedbackSnapshot:
+    """Windowed closure/follow-through counts and open discomfort-task ages, in one query.
+
+    Windowed counts read only tasks created or completed in the window; ages read only
+    open tasks. Median is taken over ages ranked with window functions.
+    """
     window_start = today - timedelta(days=window_days - 1)
     overdue_resets = count_overdue_resets(window_start.isoformat(), today.isoformat())
 
-    admin_created = sum(
-        1
-        for t in all_tasks
-        if set(t.tags or []).intersection(DISCOMFORT_TAGS)
-        and window_start <= t.created.date() <= today
-    )
-    admin_closed = sum(
-        1
-        for t in all_tasks
-        if set(t.tags or []).intersection(DISCOMFORT_TAGS)
-        and _in_window(t.completed_at, window_start, today)
-    )
-
-    janice_created = sum(
-        1
-        for t in all_tasks
-        if "janice" in (t.tags or []) and window_start <= t.created.date() <= today
-    )
-    janice_done = sum(
-        1
-        for t in all_tasks
-        if "janice" in (t.tags or []) and _in_window(t.completed_at, window_start, today)
-    )
-
-    discomfort_open_ages = [
-        (today - t.created.date()).days
-        for t in pending_tasks
-        if set(t.tags or []).intersection(DISCOMFORT_TAGS)
-    ]
-    avoidance_half_life_days = int(median(discomfort_open_ages)) if discomfort_open_ages else 0
+    with db.get_db() as conn:
+        row = conn.execute(
+            """
+            WITH windowed AS (
+                SELECT t.created_day BETWEEN :start AND :today AS created_in,
+                       t.completed_day BETWEEN :start AND :today AS closed_in,
+                       EXISTS (SELECT 1 FROM tags g WHERE g.task_id = t.id
+                               AND g.tag IN (SELECT value FROM json_each(:discomfort))) AS admin,
+                       EXISTS (SELECT 1 FROM tags g WHERE g.task_id = t.id
+                               AND g.tag = 'janice') AS janice
+                FROM tasks t
+                WHERE t.steward = 0
+                  AND (t.created_day BETWEEN :start AND :today
+                       OR t.completed_day BETWEEN :start AND :today)
+            ),
+            ages AS (
+                SELECT CAST(julianday(:today) - julianday(t.created_day) AS INTEGER) AS age
+                FROM tasks t
+                WHERE t.completed_at IS NULL AND t.steward = 0
+                  AND EXISTS (SELECT 1 FROM tags g WHERE g.task_id = t.id
+                              AND g.tag IN (SELECT value FROM json_each(:discomfort)))
+            ),
+            ranked AS (
+                SELECT age, ROW_NUMBER() OVER (ORDER BY age) AS rn, COUNT(*) OVER () AS n
+                FROM ages
+            )
+            SELECT
+                (SELECT TOTAL(admin AND closed_in) FROM windowed),
+                (SELECT TOTAL(admin AND created_in) FROM windowed),
+                (SELECT TOTAL(janice AND closed_in) FROM windowed),
+                (SELECT TOTAL(janice AND created_in) FROM windowed),
+                (SELECT CAST(AVG(age) AS INTEGER) FROM ranked
+                 WHERE rn IN ((n + 1) / 2, (n + 2) / 2)),
+                (SELECT MAX(age) FROM ages)
+            """,
+            {
+                "start": window_start.isoformat(),
+                "today": today.isoformat(),
+                "discomfort": json.dumps(sorted(DISCOMFORT_TAGS)),
+            },
+        ).fetchone()
+    admin_closed, admin_created, janice_done, janice_created = (int(n) for n in row[:4])
+    avoidance_half_life_days = row[4] or 0
+    oldest_open_age = row[5]
 
     flags: list[str] = []
     if janice_created and (janice_done / janice_created) < 0.5:
         flags.append("relationship_escalation")
-    if discomfort_open_ages and max(discomfort_open_ages) >= 3:
+    if oldest_open_age is not None and oldest_open_age >= 3:
         flags.append("stuck_task_protocol")
     if admin_created and admin_closed == 0:
         flags.append("admin_closure_risk")
@@ -14,3 +14,116 @@ def migration_023_steward_task_field(conn: sqlite3.Connection) -> None:
 def migration_024_remove_steward_tag(conn: sqlite3.Connection) -> set[str]:
     conn.execute("DELETE FROM tags WHERE tag = 'steward'")
     return {"tags"}
+
+
+# Doc rowids are source rowid * 4 + kind (0 task, 1 habit, 2 observation), so every
+# trigger touches its doc by rowid. Tags are folded into the owning doc.
+_SEARCH_FTS_DOCUMENTS = (
+    """
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    SELECT rowid * 4, 'task', id, content, COALESCE(description, ''),
+           COALESCE((SELECT group_concat(tag, ' ') FROM tags WHERE tags.task_id = tasks.id), '')
+    FROM tasks
+    """,
+    """
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    SELECT rowid * 4 + 1, 'habit', id, content, '',
+           COALESCE((SELECT group_concat(tag, ' ') FROM tags WHERE tags.habit_id = habits.id), '')
+    FROM habits
+    """,
+    """
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    SELECT id * 4 + 2, 'observation', CAST(id AS TEXT), body, '', COALESCE(tag, '')
+    FROM steward_observations
+    """,
+)
+
+_SEARCH_INDEX = """
+CREATE VIRTUAL TABLE search_fts USING fts5(
+    kind UNINDEXED,
+    ref_id UNINDEXED,
+    content,
+    description,
+    tags,
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER search_fts_task_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    VALUES (NEW.rowid * 4, 'task', NEW.id, NEW.content, COALESCE(NEW.description, ''), '');
+END;
+
+CREATE TRIGGER search_fts_task_update AFTER UPDATE OF content, description ON tasks BEGIN
+    UPDATE search_fts SET content = NEW.content, description = COALESCE(NEW.description, '')
+    WHERE rowid = NEW.rowid * 4;
+END;
+
+CREATE TRIGGER search_fts_task_delete AFTER DELETE ON tasks BEGIN
+    DELETE FROM search_fts WHERE rowid = OLD.rowid * 4;
+END;
+
+CREATE TRIGGER search_fts_habit_insert AFTER INSERT ON habits BEGIN
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    VALUES (NEW.rowid * 4 + 1, 'habit', NEW.id, NEW.content, '', '');
+END;
+
+CREATE TRIGGER search_fts_habit_update AFTER UPDATE OF content ON habits BEGIN
+    UPDATE search_fts SET content = NEW.content WHERE rowid = NEW.rowid * 4 + 1;
+END;
+
+CREATE TRIGGER search_fts_habit_delete AFTER DELETE ON habits BEGIN
+    DELETE FROM search_fts WHERE rowid = OLD.rowid * 4 + 1;
+END;
+
+CREATE TRIGGER search_fts_observation_insert AFTER INSERT ON steward_observations BEGIN
+    INSERT INTO search_fts(rowid, kind, ref_id, content, description, tags)
+    VALUES (NEW.id * 4 + 2, 'observation', CAST(NEW.id AS TEXT), NEW.body, '', COALESCE(NEW.tag, ''));
+END;
+
+CREATE TRIGGER search_fts_observation_update AFTER UPDATE OF body, tag ON steward_observations BEGIN
+    UPDATE search_fts SET content = NEW.body, tags = COALESCE(NEW.tag, '')
+    WHERE rowid = NEW.id * 4 + 2;
+END;
+
+CREATE TRIGGER search_fts_observation_delete AFTER DELETE ON steward_observations BEGIN
+    DELETE FROM search_fts WHERE rowid = OLD.id * 4 + 2;
+END;
+
+CREATE TRIGGER search_fts_tag_insert AFTER INSERT ON tags BEGIN
+    UPDATE search_fts
+    SET tags = (SELECT group_concat(tag, ' ') FROM tags WHERE task_id = NEW.task_id)
+    WHERE NEW.task_id IS NOT NULL
+      AND rowid = (SELECT rowid * 4 FROM tasks WHERE id = NEW.task_id);
+    UPDATE search_fts
+    SET tags = (SELECT group_concat(tag, ' ') FROM tags WHERE habit_id = NEW.habit_id)
+    WHERE NEW.habit_id IS NOT NULL
+      AND rowid = (SELECT rowid * 4 + 1 FROM habits WHERE id = NEW.habit_id);
+END;
+
+CREATE TRIGGER search_fts_tag_delete AFTER DELETE ON tags BEGIN
+    UPDATE search_fts
+    SET tags = COALESCE((SELECT group_concat(tag, ' ') FROM tags WHERE task_id = OLD.task_id), '')
+    WHERE OLD.task_id IS NOT NULL
+      AND rowid = (SELECT rowid * 4 FROM tasks WHERE id = OLD.task_id);
+    UPDATE search_fts
+    SET tags = COALESCE((SELECT group_concat(tag, ' ') FROM tags WHERE habit_id = OLD.habit_id), '')
+    WHERE OLD.habit_id IS NOT NULL
+      AND rowid = (SELECT rowid * 4 + 1 FROM habits WHERE id = OLD.habit_id);
+END;
+"""
+
+
+def populate_search_fts(conn: sqlite3.Connection) -> None:
+    """Index every task, habit and observation into an empty search_fts.
+
+    Shared by migration 044 and search.rebuild_indexes().
+    """
+    for sql in _SEARCH_FTS_DOCUMENTS:
+        conn.execute(sql)
+
+
+def migration_044_search_index(conn: sqlite3.Connection) -> None:
+    # One FTS5 index over tasks, habits and steward observations so search can rank
+    # everything with a single bm25 and page in one query.
+    conn.executescript(_SEARCH_INDEX)
+    populate_search_fts(conn)
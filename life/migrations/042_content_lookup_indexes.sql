@@ -0,0 +1,3 @@
+-- Case-insensitive content lookups for ref resolution (lib/fuzzy.find_in_table)
+CREATE INDEX IF NOT EXISTS idx_tasks_content_lower ON tasks(lower(content));
+CREATE INDEX IF NOT EXISTS idx_habits_content_lower ON habits(lower(content));
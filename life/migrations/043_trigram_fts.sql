@@ -0,0 +1,52 @@
+-- 043_trigram_fts.sql
+-- Trigram shadow indexes for substring matching on task and habit content.
+-- porter unicode61 (017) only matches whole tokens, so partial refs like
+-- 'dent' for 'dentist' could not use it.
+
+CREATE VIRTUAL TABLE tasks_trigram_fts USING fts5(
+    content,
+    content='tasks',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO tasks_trigram_fts(tasks_trigram_fts) VALUES ('rebuild');
+
+CREATE TRIGGER tasks_trigram_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_trigram_fts(rowid, content) VALUES (NEW.rowid, NEW.content);
+END;
+
+CREATE TRIGGER tasks_trigram_fts_update AFTER UPDATE OF content ON tasks BEGIN
+    INSERT INTO tasks_trigram_fts(tasks_trigram_fts, rowid, content)
+    VALUES ('delete', OLD.rowid, OLD.content);
+    INSERT INTO tasks_trigram_fts(rowid, content) VALUES (NEW.rowid, NEW.content);
+END;
+
+CREATE TRIGGER tasks_trigram_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_trigram_fts(tasks_trigram_fts, rowid, content)
+    VALUES ('delete', OLD.rowid, OLD.content);
+END;
+
+CREATE VIRTUAL TABLE habits_trigram_fts USING fts5(
+    content,
+    content='habits',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO habits_trigram_fts(habits_trigram_fts) VALUES ('rebuild');
+
+CREATE TRIGGER habits_trigram_fts_insert AFTER INSERT ON habits BEGIN
+    INSERT INTO habits_trigram_fts(rowid, content) VALUES (NEW.rowid, NEW.content);
+END;
+
+CREATE TRIGGER habits_trigram_fts_update AFTER UPDATE OF content ON habits BEGIN
+    INSERT INTO habits_trigram_fts(habits_trigram_fts, rowid, content)
+    VALUES ('delete', OLD.rowid, OLD.content);
+    INSERT INTO habits_trigram_fts(rowid, content) VALUES (NEW.rowid, NEW.content);
+END;
+
+CREATE TRIGGER habits_trigram_fts_delete AFTER DELETE ON habits BEGIN
+    INSERT INTO habits_trigram_fts(habits_trigram_fts, rowid, content)
+    VALUES ('delete', OLD.rowid, OLD.content);
+END;
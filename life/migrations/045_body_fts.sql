@@ -0,0 +1,114 @@
+-- 045_body_fts.sql
+-- Trigram FTS5 indexes over free-text bodies so removal/completion refs and
+-- `life search --in` match substrings through an index instead of Python scans.
+
+CREATE VIRTUAL TABLE patterns_fts USING fts5(
+    body,
+    content='patterns',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO patterns_fts(patterns_fts) VALUES ('rebuild');
+
+CREATE TRIGGER patterns_fts_insert AFTER INSERT ON patterns BEGIN
+    INSERT INTO patterns_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER patterns_fts_update AFTER UPDATE OF body ON patterns BEGIN
+    INSERT INTO patterns_fts(patterns_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+    INSERT INTO patterns_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER patterns_fts_delete AFTER DELETE ON patterns BEGIN
+    INSERT INTO patterns_fts(patterns_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+END;
+
+CREATE VIRTUAL TABLE improvements_fts USING fts5(
+    body,
+    content='improvements',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO improvements_fts(improvements_fts) VALUES ('rebuild');
+
+CREATE TRIGGER improvements_fts_insert AFTER INSERT ON improvements BEGIN
+    INSERT INTO improvements_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER improvements_fts_update AFTER UPDATE OF body ON improvements BEGIN
+    INSERT INTO improvements_fts(improvements_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+    INSERT INTO improvements_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER improvements_fts_delete AFTER DELETE ON improvements BEGIN
+    INSERT INTO improvements_fts(improvements_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+END;
+
+CREATE VIRTUAL TABLE steward_observations_fts USING fts5(
+    body,
+    content='steward_observations',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO steward_observations_fts(steward_observations_fts) VALUES ('rebuild');
+
+CREATE TRIGGER steward_observations_fts_insert AFTER INSERT ON steward_observations BEGIN
+    INSERT INTO steward_observations_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER steward_observations_fts_update AFTER UPDATE OF body ON steward_observations BEGIN
+    INSERT INTO steward_observations_fts(steward_observations_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+    INSERT INTO steward_observations_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER steward_observations_fts_delete AFTER DELETE ON steward_observations BEGIN
+    INSERT INTO steward_observations_fts(steward_observations_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+END;
+
+CREATE VIRTUAL TABLE signal_messages_fts USING fts5(
+    body,
+    content='signal_messages',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO signal_messages_fts(signal_messages_fts) VALUES ('rebuild');
+
+CREATE TRIGGER signal_messages_fts_insert AFTER INSERT ON signal_messages BEGIN
+    INSERT INTO signal_messages_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER signal_messages_fts_update AFTER UPDATE OF body ON signal_messages BEGIN
+    INSERT INTO signal_messages_fts(signal_messages_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+    INSERT INTO signal_messages_fts(rowid, body) VALUES (NEW.rowid, NEW.body);
+END;
+
+CREATE TRIGGER signal_messages_fts_delete AFTER DELETE ON signal_messages BEGIN
+    INSERT INTO signal_messages_fts(signal_messages_fts, rowid, body) VALUES ('delete', OLD.rowid, OLD.body);
+END;
+
+CREATE VIRTUAL TABLE drafts_fts USING fts5(
+    subject,
+    body,
+    content='drafts',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+INSERT INTO drafts_fts(drafts_fts) VALUES ('rebuild');
+
+CREATE TRIGGER drafts_fts_insert AFTER INSERT ON drafts BEGIN
+    INSERT INTO drafts_fts(rowid, subject, body) VALUES (NEW.rowid, NEW.subject, NEW.body);
+END;
+
+CREATE TRIGGER drafts_fts_update AFTER UPDATE OF subject, body ON drafts BEGIN
+    INSERT INTO drafts_fts(drafts_fts, rowid, subject, body) VALUES ('delete', OLD.rowid, OLD.subject, OLD.body);
+    INSERT INTO drafts_fts(rowid, subject, body) VALUES (NEW.rowid, NEW.subject, NEW.body);
+END;
+
+CREATE TRIGGER drafts_fts_delete AFTER DELETE ON drafts BEGIN
+    INSERT INTO drafts_fts(drafts_fts, rowid, subject, body) VALUES ('delete', OLD.rowid, OLD.subject, OLD.body);
+END;
@@ -0,0 +1,32 @@
+-- Day-grained generated columns so date filters and bucketing are plain indexed lookups
+-- instead of date()/substr() over every row. VIRTUAL: computed on read, only the index is stored.
+-- Legacy unix-timestamp created values bucket by their UTC day (localtime is not deterministic).
+ALTER TABLE tasks ADD COLUMN completed_day TEXT
+    GENERATED ALWAYS AS (substr(completed_at, 1, 10)) VIRTUAL;
+ALTER TABLE tasks ADD COLUMN created_day TEXT
+    GENERATED ALWAYS AS (
+        CASE WHEN created LIKE '____-__-__%' THEN substr(created, 1, 10)
+        ELSE date(CAST(created AS REAL), 'unixepoch') END
+    ) VIRTUAL;
+ALTER TABLE habits ADD COLUMN created_day TEXT
+    GENERATED ALWAYS AS (
+        CASE WHEN created LIKE '____-__-__%' THEN substr(created, 1, 10)
+        ELSE date(CAST(created AS REAL), 'unixepoch') END
+    ) VIRTUAL;
+ALTER TABLE deleted_tasks ADD COLUMN deleted_day TEXT
+    GENERATED ALWAYS AS (substr(deleted_at, 1, 10)) VIRTUAL;
+ALTER TABLE task_mutations ADD COLUMN mutated_day TEXT
+    GENERATED ALWAYS AS (substr(mutated_at, 1, 10)) VIRTUAL;
+
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_day ON tasks(completed_day);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_day ON tasks(created_day);
+CREATE INDEX IF NOT EXISTS idx_habits_created_day ON habits(created_day);
+CREATE INDEX IF NOT EXISTS idx_deleted_tasks_day ON deleted_tasks(deleted_day);
+CREATE INDEX IF NOT EXISTS idx_mutations_reason_day ON task_mutations(reason, mutated_day);
+
+-- Digest windows compare the raw timestamps; give them indexes too.
+CREATE INDEX IF NOT EXISTS idx_drafts_created ON drafts(created_at);
+CREATE INDEX IF NOT EXISTS idx_drafts_sent ON drafts(sent_at);
+CREATE INDEX IF NOT EXISTS idx_proposals_approved ON proposals(approved_at);
+CREATE INDEX IF NOT EXISTS idx_proposals_rejected ON proposals(rejected_at);
+CREATE INDEX IF NOT EXISTS idx_proposals_executed ON proposals(executed_at);
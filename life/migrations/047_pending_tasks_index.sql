@@ -0,0 +1,4 @@
+-- Open tasks by age: pending reads and feedback metrics walk this instead of every
+-- task ever created. Partial, so it stays the size of the open list.
+CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks(steward, created_day)
+    WHERE completed_at IS NULL;
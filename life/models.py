@@ -2,7 +2,7 @@ import dataclasses
 from datetime import date, datetime
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Task:
     id: str
     content: str
@@ -20,7 +20,7 @@ class Task:
     tags: list[str] = dataclasses.field(default_factory=list, hash=False)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Habit:
     id: str
     content: str
@@ -56,3 +56,39 @@ class Weekly:
     tasks_total: int = 0
     habits_completed: int = 0
     habits_total: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class MomentumBucket:
+    start: date
+    end: date
+    tasks_completed: int = 0
+    tasks_total: int = 0
+    habits_completed: int = 0
+    habits_total: int = 0
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Check:
+    habit_id: str
+    check_date: date
+    completed_at: datetime
+
+
+@dataclasses.dataclass(frozen=True)
+class HabitStreak:
+    habit_id: str
+    current: int = 0
+    longest: int = 0
+    last_check: date | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class DashboardSnapshot:
+    pending: list[Task]
+    habits: list[Habit]
+    completed_today: list[Task | Habit]
+    habits_today: int = 0
+    tasks_today: int = 0
+    added_today: int = 0
+    deleted_today: int = 0
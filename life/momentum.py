@@ -2,109 +2,122 @@ from datetime import date, timedelta
 
 from . import db
 from .lib import clock
-from .lib.dates import parse_created_date
-from .models import Weekly
-
-__all__ = ["weekly_momentum"]
-
-
-def _calculate_total_possible(active_items_data, week_start_date, week_end_date):
-    total_possible = 0
-    for _item_id, created_val in active_items_data:
-        created_date = parse_created_date(created_val)
-
-        if created_date > week_end_date:
-            continue
-
-        effective_start_date = max(created_date, week_start_date)
-
-        if effective_start_date > week_end_date:
-            continue
-
-        days_active = (week_end_date - effective_start_date).days + 1
-
-        per_day_target = 1
-        total_possible += days_active * per_day_target
-
-    return total_possible
-
-
-def weekly_momentum():
-    """Get weekly totals: this week, last week, prior week"""
-    today = clock.today()
-
-    this_week_start = today - timedelta(days=6)
-    this_week_end = today
-
-    last_week_start = today - timedelta(days=13)
-    last_week_end = today - timedelta(days=7)
-
-    prior_week_start = today - timedelta(days=20)
-    prior_week_end = today - timedelta(days=14)
-
-    weeks = {}
-
+from .models import MomentumBucket, Weekly
+
+__all__ = ["BUCKETS", "momentum", "weekly_momentum"]
+
+BUCKETS = ("day", "week", "month")
+
+# Buckets are counted back from :end (0 = the bucket containing :end).
+_BUCKET_INDEX = {
+    "day": "CAST(julianday(:end) - julianday(day) AS INTEGER)",
+    "week": "CAST((julianday(:end) - julianday(day)) / 7 AS INTEGER)",
+    "month": (
+        "(CAST(strftime('%Y', :end) AS INTEGER) * 12 + CAST(strftime('%m', :end) AS INTEGER))"
+        " - (CAST(strftime('%Y', day) AS INTEGER) * 12 + CAST(strftime('%m', day) AS INTEGER))"
+    ),
+}
+
+
+def _bucket_bounds(start: date, end: date, bucket: str) -> list[tuple[date, date]]:
+    """(start, end) per bucket, most recent first, clipped to [start, end]."""
+    bounds = []
+    hi = end
+    while hi >= start:
+        if bucket == "month":
+            lo = hi.replace(day=1)
+        else:
+            lo = hi - timedelta(days=(7 if bucket == "week" else 1) - 1)
+        bounds.append((max(lo, start), hi))
+        hi = lo - timedelta(days=1)
+    return bounds
+
+
+def momentum(start: date, end: date, bucket: str = "week") -> list[MomentumBucket]:
+    """Completions, checks, task totals and habit possible-days per bucket, oldest first.
+
+    One grouped query over the *_day indexes: rows in range plus a count of everything
+    created before start, so the cost tracks the range, not buckets x habits or history.
+    Week buckets are rolling 7-day windows ending at end; month buckets are calendar months.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of {', '.join(BUCKETS)}")
+    if start > end:
+        raise ValueError("start must not be after end")
+
+    stop = (end + timedelta(days=1)).isoformat()
     with db.get_db() as conn:
-        for week_name, start_date, end_date in [
-            ("this_week", this_week_start, this_week_end),
-            ("last_week", last_week_start, last_week_end),
-            ("prior_week", prior_week_start, prior_week_end),
-        ]:
-            start_str = start_date.isoformat()
-            end_str = end_date.isoformat()
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM tasks
-                WHERE completed_at >= ?
-                AND completed_at <= ?
-                AND completed_at IS NOT NULL""",
-                (start_str, end_str),
-            )
-            tasks = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM checks c
-                WHERE c.check_date >= ?
-                AND c.check_date <= ?""",
-                (start_str, end_str),
-            )
-            habits = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM tasks
-                WHERE (
-                    created <= ?
-                    OR (completed_at >= ? AND completed_at <= ?)
-                )""",
-                (end_str, start_str, end_str),
+        rows = conn.execute(
+            f"""
+            WITH events(kind, day, n) AS (
+                SELECT 'done', completed_day, 1 FROM tasks
+                WHERE completed_day >= :start AND completed_day < :stop
+                UNION ALL
+                SELECT 'check', check_date, 1 FROM checks
+                WHERE check_date >= :start AND check_date < :stop
+                UNION ALL
+                SELECT 'task', created_day, 1 FROM tasks
+                WHERE created_day >= :start AND created_day < :stop
+                UNION ALL
+                SELECT 'task', NULL, COUNT(*) FROM tasks WHERE created_day < :start
+                UNION ALL
+                SELECT 'habit', created_day, 1 FROM habits
+                WHERE created_day >= :start AND created_day < :stop
+                UNION ALL
+                SELECT 'habit', NULL, COUNT(*) FROM habits WHERE created_day < :start
             )
-            tasks_total = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT DISTINCT
-                    h.id,
-                    h.created
-                FROM habits h"""
+            SELECT kind,
+                   CASE WHEN day IS NULL THEN -1 ELSE {_BUCKET_INDEX[bucket]} END AS bucket,
+                   SUM(n),
+                   TOTAL(julianday(day) - 1721424.5)
+            FROM events
+            GROUP BY kind, bucket
+            """,  # noqa: S608
+            {"start": start.isoformat(), "end": end.isoformat(), "stop": stop},
+        ).fetchall()
+
+    # (kind, bucket) -> (rows, sum of date ordinals); julianday - 1721424.5 is the ordinal.
+    counts: dict[tuple[str, int], tuple[int, float]] = {
+        (kind, idx): (count, ordinals) for kind, idx, count, ordinals in rows
+    }
+    tasks_before = counts.get(("task", -1), (0, 0.0))[0]
+    habits_before = counts.get(("habit", -1), (0, 0.0))[0]
+
+    result = []
+    bounds = _bucket_bounds(start, end, bucket)
+    for idx in range(len(bounds) - 1, -1, -1):
+        lo, hi = bounds[idx]
+        new_tasks = counts.get(("task", idx), (0, 0.0))[0]
+        new_habits, created_ordinals = counts.get(("habit", idx), (0, 0.0))
+        # Habits that existed before lo are possible every day; new ones from creation on.
+        habits_total = habits_before * ((hi - lo).days + 1) + round(
+            new_habits * (hi.toordinal() + 1) - created_ordinals
+        )
+        tasks_before += new_tasks
+        result.append(
+            MomentumBucket(
+                start=lo,
+                end=hi,
+                tasks_completed=counts.get(("done", idx), (0, 0.0))[0],
+                tasks_total=tasks_before,
+                habits_completed=counts.get(("check", idx), (0, 0.0))[0],
+                habits_total=habits_total,
             )
-            active_habits_data = cursor.fetchall()
+        )
+        habits_before += new_habits
+    return result
 
-            habits_total_possible = _calculate_total_possible(
-                active_habits_data,
-                date.fromisoformat(start_str),
-                date.fromisoformat(end_str),
-            )
 
-            weeks[week_name] = Weekly(
-                tasks_completed=tasks,
-                tasks_total=tasks_total,
-                habits_completed=habits,
-                habits_total=habits_total_possible,
-            )
-
-    return weeks
+def weekly_momentum() -> dict[str, Weekly]:
+    """Get weekly totals: this week, last week, prior week"""
+    today = clock.today()
+    prior, last, this = momentum(today - timedelta(days=20), today, "week")
+    return {
+        name: Weekly(
+            tasks_completed=b.tasks_completed,
+            tasks_total=b.tasks_total,
+            habits_completed=b.habits_completed,
+            habits_total=b.habits_total,
+        )
+        for name, b in (("this_week", this), ("last_week", last), ("prior_week", prior))
+    }
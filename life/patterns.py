@@ -45,6 +45,20 @@ def get_patterns(limit: int = 20, tag: str | None = None) -> list[Pattern]:
         ]
 
 
+def find_pattern(query: str) -> Pattern | None:
+    """Most recent pattern whose body contains query, via patterns_fts."""
+    from .search import find_body_id
+
+    pattern_id = find_body_id("patterns", query, order="logged_at DESC, id DESC")
+    if pattern_id is None:
+        return None
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT id, body, logged_at, tag FROM patterns WHERE id = ?", (pattern_id,)
+        ).fetchone()
+    return Pattern(id=row[0], body=row[1], logged_at=datetime.fromisoformat(row[2]), tag=row[3])
+
+
 @cli("life pattern", name="log")
 def log(limit: int = 20, tag: str | None = None):
     """Review logged patterns"""
@@ -78,19 +92,16 @@ def add(body: str, tag: str | None = None):
 @cli("life pattern", name="rm")
 def rm(ref: str):
     """Remove a pattern by ID or fuzzy match"""
-    patterns = get_patterns(limit=50)
-    if not patterns:
-        exit_error("no patterns to remove")
-        return
     if ref == "":
+        patterns = get_patterns(limit=1)
+        if not patterns:
+            exit_error("no patterns to remove")
         target = patterns[0]
     else:
-        q = ref.lower()
-        matches = [p for p in patterns if q in p.body.lower()]
-        if not matches:
+        found = find_pattern(ref)
+        if not found:
             exit_error(f"no pattern matching '{ref}'")
-            return
-        target = matches[0]
+        target = found
     deleted = delete_pattern(target.id)
     if deleted:
         echo(f"→ removed: {target.body[:80]}")
@@ -1,10 +1,46 @@
-from dataclasses import dataclass
+import dataclasses
+import json
+import sqlite3
+from dataclasses import dataclass, field
+
+from fncli import cli
 
 from . import db
-from .habits import get_habits
+from .lib.ansi import ANSI
 from .lib.converters import row_to_task
-from .lib.fuzzy import find_in_pool
-from .tasks import get_tasks
+from .lib.errors import echo, exit_error
+from .lib.fuzzy import TRIGRAM_MIN_LENGTH, find_in_table, fts_phrase
+from .migrations import populate_search_fts
+
+__all__ = [
+    "BODY_SOURCES",
+    "SearchResult",
+    "find_body_id",
+    "fts_triggers",
+    "rebuild_indexes",
+    "search",
+    "search_all",
+    "search_bodies",
+    "search_by_tag",
+    "search_fuzzy",
+    "search_habits",
+    "search_index",
+    "search_substring",
+    "search_tags",
+    "search_tasks",
+]
+
+# bm25 column weights for search_fts: kind, ref_id, content, description, tags
+_WEIGHTS = "0.0, 0.0, 10.0, 2.0, 5.0"
+
+# `life search --in` source → (table, trigram fts table, displayed text over alias t)
+BODY_SOURCES: dict[str, tuple[str, str, str]] = {
+    "patterns": ("patterns", "patterns_fts", "t.body"),
+    "improvements": ("improvements", "improvements_fts", "t.body"),
+    "observations": ("steward_observations", "steward_observations_fts", "t.body"),
+    "signal": ("signal_messages", "signal_messages_fts", "t.body"),
+    "drafts": ("drafts", "drafts_fts", "coalesce(t.subject, '') || ' — ' || t.body"),
+}
 
 
 @dataclass(frozen=True)
@@ -15,6 +51,12 @@ class SearchResult:
     rank: float
     task: object = None
     tag: str | None = None
+    score: float = 0.0
+    snippet: str | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+# ── domain ───────────────────────────────────────────────────────────────────
 
 
 def search_tasks(query: str, limit: int = 20) -> list[SearchResult]:
@@ -142,6 +184,54 @@ def search_by_tag(tag: str, limit: int = 20) -> list[SearchResult]:
         return results[:limit]
 
 
+def search_substring(query: str, limit: int = 20) -> list[SearchResult]:
+    """Partial-word matches on task and habit content via the trigram indexes."""
+    query = query.strip() if query else ""
+    if len(query) < TRIGRAM_MIN_LENGTH:
+        return []
+
+    phrase = fts_phrase(query)
+    with db.get_db() as conn:
+        rows = conn.execute(
+            """
+            SELECT t.id, t.content, t.focus, t.scheduled_date, t.created, t.completed_at,
+                   t.parent_id, t.scheduled_time, t.blocked_by, t.description,
+                   t.steward, t.source, t.is_deadline,
+                   fts.rank
+            FROM tasks_trigram_fts fts
+            JOIN tasks t ON fts.rowid = t.rowid
+            WHERE tasks_trigram_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (phrase, limit),
+        ).fetchall()
+        results = [
+            SearchResult(
+                id=row[0], content=row[1], type="task", rank=row[-1], task=row_to_task(row)
+            )
+            for row in rows
+        ]
+
+        habit_rows = conn.execute(
+            """
+            SELECT h.id, h.content, fts.rank
+            FROM habits_trigram_fts fts
+            JOIN habits h ON fts.rowid = h.rowid
+            WHERE habits_trigram_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (phrase, limit),
+        ).fetchall()
+        results.extend(
+            SearchResult(id=row[0], content=row[1], type="habit", rank=row[2]) for row in habit_rows
+        )
+
+    results.sort(key=lambda r: r.rank)
+    return results[:limit]
+
+
 def search_fuzzy(query: str, limit: int = 20) -> list[SearchResult]:
     """Fallback fuzzy search when FTS finds nothing."""
     if not query or not query.strip():
@@ -149,43 +239,238 @@ def search_fuzzy(query: str, limit: int = 20) -> list[SearchResult]:
 
     results: list[SearchResult] = []
 
-    tasks = get_tasks()
-    task_match = find_in_pool(query, tasks)
-    if task_match:
-        results.append(
-            SearchResult(
-                id=task_match.id, content=task_match.content, type="task", rank=0.0, task=task_match
+    with db.get_db() as conn:
+        task_id = find_in_table(conn, query, "tasks", "completed_at IS NULL AND steward = 0")
+        habit_id = find_in_table(conn, query, "habits", "archived_at IS NULL")
+        if task_id:
+            row = conn.execute(
+                "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE id = ?",
+                (task_id,),
+            ).fetchone()
+            task = row_to_task(row)
+            results.append(
+                SearchResult(id=task.id, content=task.content, type="task", rank=0.0, task=task)
             )
-        )
-
-    habits = get_habits()
-    habit_match = find_in_pool(query, habits)
-    if habit_match:
-        results.append(
-            SearchResult(id=habit_match.id, content=habit_match.content, type="habit", rank=0.0)
-        )
+        if habit_id:
+            content = conn.execute(
+                "SELECT content FROM habits WHERE id = ?", (habit_id,)
+            ).fetchone()[0]
+            results.append(SearchResult(id=habit_id, content=content, type="habit", rank=0.0))
 
     return results[:limit]
 
 
-def search_all(query: str, limit: int = 20, fuzzy_fallback: bool = True) -> list[SearchResult]:
-    """Unified search: FTS with fuzzy fallback."""
+def _match_expr(query: str) -> str:
+    """Every term must match; the last one also matches as a prefix."""
+    terms = [fts_phrase(term) for term in query.split()]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_index(
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    highlight: tuple[str, str] = ("[", "]"),
+) -> list[SearchResult]:
+    """Ranked page of tasks, habits and observations from search_fts, in one query.
+
+    score is bm25 scaled so the best match over all hits is 1.0, comparable across kinds.
+    Tags and task rows for the page are joined in the same statement.
+    """
     if not query or not query.strip():
         return []
 
-    tag_prefix = query.strip().startswith("#")
+    with db.get_db() as conn:
+        rows = conn.execute(
+            f"""
+            WITH hits AS (
+                SELECT kind, ref_id, content,
+                       snippet(search_fts, -1, :open, :close, '…', 12) AS snippet,
+                       -bm25(search_fts, {_WEIGHTS}) AS score
+                FROM search_fts
+                WHERE search_fts MATCH :query
+            ),
+            page AS (
+                SELECT *, score / MAX(score) OVER () AS relevance
+                FROM hits
+                ORDER BY score DESC
+                LIMIT :limit OFFSET :offset
+            )
+            SELECT p.kind, p.ref_id, p.content, p.snippet, p.relevance,
+                   CASE p.kind
+                       WHEN 'task' THEN (SELECT json_group_array(tag) FROM tags WHERE task_id = p.ref_id)
+                       WHEN 'habit' THEN (SELECT json_group_array(tag) FROM tags WHERE habit_id = p.ref_id)
+                   END,
+                   t.id, t.content, t.focus, t.scheduled_date, t.created, t.completed_at,
+                   t.parent_id, t.scheduled_time, t.blocked_by, t.description,
+                   t.steward, t.source, t.is_deadline
+            FROM page p
+            LEFT JOIN tasks t ON p.kind = 'task' AND t.id = p.ref_id
+            ORDER BY p.relevance DESC
+            """,  # noqa: S608
+            {
+                "query": _match_expr(query),
+                "open": highlight[0],
+                "close": highlight[1],
+                "limit": limit,
+                "offset": offset,
+            },
+        ).fetchall()
+
+    results = []
+    for kind, ref_id, content, snippet, relevance, tags_json, *task_row in rows:
+        tags = json.loads(tags_json) if tags_json else []
+        task = dataclasses.replace(row_to_task(tuple(task_row)), tags=tags) if task_row[0] else None
+        results.append(
+            SearchResult(
+                id=ref_id,
+                content=content,
+                type=kind,
+                rank=-relevance,
+                task=task,
+                score=relevance,
+                snippet=snippet,
+                tags=tags,
+            )
+        )
+    return results
 
-    if tag_prefix:
-        results = search_by_tag(query, limit)
-    else:
-        results: list[SearchResult] = []
-        results.extend(search_tasks(query, limit))
-        results.extend(search_habits(query, limit))
-        results.extend(search_tags(query, limit))
 
-        results.sort(key=lambda r: r.rank)
+def search_all(
+    query: str, limit: int = 20, offset: int = 0, fuzzy_fallback: bool = True
+) -> list[SearchResult]:
+    """Unified search: ranked index, then trigram substrings, then fuzzy."""
+    if not query or not query.strip():
+        return []
+
+    if query.strip().startswith("#"):
+        return search_by_tag(query, offset + limit)[offset:]
 
+    results = search_index(query, limit, offset)
+    if offset == 0 and len(results) < limit:
+        seen = {r.id for r in results}
+        results.extend(r for r in search_substring(query, limit) if r.id not in seen)
         if not results and fuzzy_fallback:
             results = search_fuzzy(query, limit)
 
     return results[:limit]
+
+
+def _body_match(table: str, fts: str, query: str) -> tuple[str, dict[str, str]]:
+    if len(query) >= TRIGRAM_MIN_LENGTH:
+        where = f"{table}.rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH :phrase)"  # noqa: S608
+        return where, {"phrase": fts_phrase(query)}
+    return f"instr(lower({table}.body), :needle) > 0", {"needle": query.lower()}
+
+
+def find_body_id(
+    source: str, query: str, scope: str = "1", order: str = "rowid DESC"
+) -> int | str | None:
+    """Id of the first row in a BODY_SOURCES table whose body contains query."""
+    table, fts, _ = BODY_SOURCES[source]
+    where, params = _body_match(table, fts, query)
+    with db.get_db() as conn:
+        row = conn.execute(
+            f"SELECT id FROM {table} WHERE {where} AND ({scope}) ORDER BY {order} LIMIT 1",  # noqa: S608
+            params,
+        ).fetchone()
+    return row[0] if row else None
+
+
+def search_bodies(
+    query: str, sources: list[str], limit: int = 20, offset: int = 0
+) -> list[SearchResult]:
+    """Substring search over patterns, improvements, observations, signal and drafts.
+
+    Scores are bm25 scaled per source so the best hit in each is 1.0.
+    """
+    query = query.strip() if query else ""
+    if len(query) < TRIGRAM_MIN_LENGTH:
+        return []
+    unknown = set(sources) - BODY_SOURCES.keys()
+    if unknown:
+        raise ValueError(f"unknown search source: {', '.join(sorted(unknown))}")
+
+    results: list[SearchResult] = []
+    with db.get_db() as conn:
+        for source in sources:
+            table, fts, text = BODY_SOURCES[source]
+            rows = conn.execute(
+                f"""
+                WITH hits AS (
+                    SELECT rowid, -bm25({fts}) AS score FROM {fts} WHERE {fts} MATCH :phrase
+                )
+                SELECT t.id, {text}, h.score / MAX(h.score) OVER () AS relevance
+                FROM hits h
+                JOIN {table} t ON t.rowid = h.rowid
+                ORDER BY relevance DESC
+                LIMIT :limit
+                """,  # noqa: S608
+                {"phrase": fts_phrase(query), "limit": offset + limit},
+            ).fetchall()
+            results.extend(
+                SearchResult(
+                    id=str(row[0]), content=row[1], type=source, rank=-row[2], score=row[2]
+                )
+                for row in rows
+            )
+
+    results.sort(key=lambda r: r.rank)
+    return results[offset : offset + limit]
+
+
+def fts_triggers(conn: sqlite3.Connection) -> list[str]:
+    """Names of the triggers that keep the FTS tables in sync with their sources."""
+    return [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%\\_fts\\_%' ESCAPE '\\'"
+        )
+    ]
+
+
+def rebuild_indexes(conn: sqlite3.Connection) -> None:
+    """Rebuild every FTS table from its source rows, for use after a trigger-less bulk load.
+
+    External-content tables re-read their content table; search_fts stores its own
+    documents, so it is refilled by the same populate_search_fts() migration 044 uses.
+    """
+    external = [
+        name
+        for name, sql in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%USING fts5%'"
+        )
+        if "content=" in sql.replace(" ", "")
+    ]
+    for name in external:
+        conn.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")  # noqa: S608
+
+    conn.execute("DELETE FROM search_fts")
+    populate_search_fts(conn)
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+
+
+@cli("life")
+def search(query: list[str], limit: int = 20, offset: int = 0, in_: str | None = None) -> None:
+    """Search tasks, habits, tags and observations (--in patterns,observations,signal,...)"""
+    text = " ".join(query) if query else ""
+    if not text.strip():
+        exit_error("Usage: life search <query>")
+    if in_:
+        sources = [s.strip() for s in in_.split(",") if s.strip()]
+        try:
+            results = search_bodies(text, sources, limit=limit, offset=offset)
+        except ValueError as e:
+            exit_error(f"Error: {e}. Sources: {', '.join(BODY_SOURCES)}")
+    else:
+        results = search_all(text, limit=limit, offset=offset)
+    if not results:
+        echo("no matches")
+        return
+    for r in results:
+        body = r.snippet or r.content
+        tags = "".join(f" {ANSI.MUTED}#{t}{ANSI.RESET}" for t in r.tags)
+        echo(f"{r.type:<11} {r.score:4.2f}  {body}{tags}  {ANSI.MUTED}[{r.id[:8]}]{ANSI.RESET}")
@@ -0,0 +1,237 @@
+"""`life serve`: a warm daemon that runs forwarded commands over a Unix socket.
+
+One process keeps the command registry imported, the pooled connection (and its
+page cache) open and a read_scope() alive across requests. Requests are handled
+one at a time on the main thread, so the thread-local pool and the single SQLite
+writer need no extra locking. See life.client for the wire protocol.
+"""
+
+import io
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
+from datetime import date
+from pathlib import Path
+from typing import IO
+
+from fncli import cli
+
+from . import config, db
+from .client import recv, send
+from .lib import clock
+from .lib.errors import echo, exit_error
+
+__all__ = ["handle", "serve_forever"]
+
+# Seconds between checks for SIGTERM while idle.
+_POLL_INTERVAL = 0.5
+
+# Characters of unterminated output buffered before a frame is sent anyway.
+_FRAME_SIZE = 64 * 1024
+
+
+class _Output(io.TextIOBase):
+    """Line-buffered text stream that forwards output to the client as frames."""
+
+    def __init__(self, stream: IO[bytes], kind: str, tty: bool) -> None:
+        self._stream, self._kind, self._tty = stream, kind, tty
+        self._buffer: list[str] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, s: str) -> int:
+        self._buffer.append(s)
+        self._size += len(s)
+        if "\n" in s or self._size >= _FRAME_SIZE:
+            self.flush()
+        return len(s)
+
+    def flush(self) -> None:
+        if self._size:
+            send(self._stream, {self._kind: "".join(self._buffer)})
+            self._buffer.clear()
+            self._size = 0
+
+
+class _Input(io.TextIOBase):
+    """The client's stdin, fetched lazily so commands that never read it never wait."""
+
+    def __init__(self, stream: IO[bytes], tty: bool, outputs: list[_Output]) -> None:
+        self._stream, self._tty, self._outputs = stream, tty, outputs
+        self._pending, self._eof = "", False
+
+    def readable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def _fetch(self, mode: str) -> None:
+        for output in self._outputs:
+            output.flush()  # show any prompt before blocking on the client
+        send(self._stream, {"stdin": mode})
+        frame = recv(self._stream) or {}
+        data = frame.get("data", "")
+        self._pending += data
+        self._eof = self._eof or mode == "read" or not data
+
+    def read(self, size: int | None = -1) -> str:
+        if not self._eof:
+            self._fetch("read")
+        if size is None or size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def readline(self, size: int | None = -1) -> str:
+        if "\n" not in self._pending and not self._eof:
+            self._fetch("line")
+        end = self._pending.find("\n") + 1 or len(self._pending)
+        if size is not None and size >= 0:
+            end = min(end, size)
+        line, self._pending = self._pending[:end], self._pending[end:]
+        return line
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._eof:
+            self._fetch("read")  # one round trip, not one per line
+        return iter(self.readline, "")
+
+
+@contextmanager
+def _client_context(cwd: str, env: dict[str, str]) -> Generator[None, None, None]:
+    saved_env, saved_cwd = dict(os.environ), Path.cwd()
+    os.environ.clear()
+    os.environ.update(env)
+    with suppress(OSError):
+        os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def handle(stream: IO[bytes]) -> None:
+    """Serve one request read from stream: run its argv and send the exit code."""
+    from .cli import run
+
+    request = recv(stream)
+    if not request:
+        return
+    stdin_tty, stdout_tty, stderr_tty = request.get("tty", [False, False, False])
+    out, err = _Output(stream, "out", stdout_tty), _Output(stream, "err", stderr_tty)
+    saved_stdin, sys.stdin = sys.stdin, _Input(stream, stdin_tty, [out, err])
+    config.Config().reload()
+    try:
+        with (
+            _client_context(request.get("cwd", "/"), request.get("env", {})),
+            redirect_stdout(out),
+            redirect_stderr(err),
+        ):
+            try:
+                code = run(list(request.get("argv", [])))
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    err.write(f"{e.code}\n")
+                    code = 1
+            except Exception:
+                err.write(traceback.format_exc())
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+    out.flush()
+    err.flush()
+    send(stream, {"exit": code})
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        try:
+            with self.request.makefile("rwb") as stream:
+                handle(stream)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client went away mid-command; its transaction has rolled back
+
+
+class _Server(socketserver.UnixStreamServer):
+    """Serves requests in turn, keeping the read cache only while nothing else wrote."""
+
+    timeout = _POLL_INTERVAL
+    _stamp: tuple[date, int] | None = None
+
+    def process_request(self, request, client_address) -> None:
+        # Cached reads survive between requests until another process commits
+        # (data_version moves) or the day rolls over.
+        with db.get_db() as conn:
+            stamp = (clock.today(), conn.execute("PRAGMA data_version").fetchone()[0])
+        if stamp != self._stamp:
+            db.clear_read_cache()
+            self._stamp = stamp
+        super().process_request(request, client_address)
+
+
+def _is_live(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve_forever(socket_path: Path = config.SOCKET_PATH) -> None:
+    """Listen on socket_path until SIGTERM or Ctrl-C; refuses to start twice."""
+    if socket_path.exists():
+        if _is_live(socket_path):
+            raise RuntimeError(f"already serving on {socket_path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    stopping = False
+
+    def stop(*_: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    umask = os.umask(0o177)
+    try:
+        server = _Server(str(socket_path), _Handler)
+    finally:
+        os.umask(umask)
+    try:
+        with server, db.read_scope():
+            while not stopping:
+                server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        socket_path.unlink(missing_ok=True)
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+
+
+@cli("life")
+def serve() -> None:
+    """Keep life warm on a Unix socket for `life-client` to forward commands to"""
+    echo(f"serving on {config.SOCKET_PATH} (Ctrl-C to stop)", err=True)
+    try:
+        serve_forever()
+    except (OSError, RuntimeError) as e:
+        exit_error(f"serve failed: {e}")
@@ -59,6 +59,27 @@ def get_observations(limit: int = 20, tag: str | None = None) -> list[Observatio
         ]
 
 
+def find_observation(query: str) -> Observation | None:
+    """Most recent observation whose body contains query, via steward_observations_fts."""
+    from ..search import find_body_id
+
+    obs_id = find_body_id("observations", query, order="logged_at DESC, id DESC")
+    if obs_id is None:
+        return None
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT id, body, tag, logged_at, about_date FROM steward_observations WHERE id = ?",
+            (obs_id,),
+        ).fetchone()
+    return Observation(
+        id=row[0],
+        body=row[1],
+        tag=row[2],
+        logged_at=datetime.fromisoformat(row[3]),
+        about_date=date.fromisoformat(row[4]) if row[4] else None,
+    )
+
+
 def delete_observation(obs_id: int) -> bool:
     with get_db() as conn:
         cursor = conn.execute("DELETE FROM steward_observations WHERE id = ?", (obs_id,))
@@ -98,6 +119,7 @@ __all__ = [
     "close",
     "dash",
     "delete_observation",
+    "find_observation",
     "get_observations",
     "get_sessions",
     "improve",
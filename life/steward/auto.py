@@ -163,14 +163,11 @@ def _run_autonomous() -> None:
     from ..lib.providers import glm
     from ..loop import load_loop_state, require_real_world_closure, save_loop_state, update_loop_state
     from ..metrics import build_feedback_snapshot, render_feedback_snapshot
-    from ..tasks import get_all_tasks, get_tasks
+    from ..tasks import completed_among, get_tasks
 
     tasks_before = get_tasks()
-    all_before = get_all_tasks()
     today_date = today()
-    snapshot_before = build_feedback_snapshot(
-        all_tasks=all_before, pending_tasks=tasks_before, today=today_date
-    )
+    snapshot_before = build_feedback_snapshot(today=today_date)
     echo("\n".join(render_feedback_snapshot(snapshot_before)))
 
     state = load_loop_state()
@@ -207,22 +204,8 @@ def _run_autonomous() -> None:
         save_loop_state(state)
         exit_error(f"steward loop failed (exit {rc})")
 
-    all_after = get_all_tasks()
-    tasks_after = get_tasks()
-    snapshot_after = build_feedback_snapshot(
-        all_tasks=all_after, pending_tasks=tasks_after, today=today_date
-    )
-
-    before_map = {t.id: t for t in all_before}
-    after_map = {t.id: t for t in all_after}
-    newly_completed = [
-        tid
-        for tid, before_task in before_map.items()
-        if before_task.completed_at is None
-        and tid in after_map
-        and after_map[tid].completed_at is not None
-    ]
-    shipped_life = bool(newly_completed)
+    snapshot_after = build_feedback_snapshot(today=today_date)
+    shipped_life = bool(completed_among([t.id for t in tasks_before]))
 
     update_loop_state(
         state,
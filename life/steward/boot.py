@@ -17,7 +17,7 @@ def boot():
     from ..improvements import get_improvements
     from ..metrics import build_feedback_snapshot, render_feedback_snapshot
     from ..mood import get_recent_moods
-    from ..tasks import get_all_tasks, get_tasks
+    from ..tasks import get_tasks
     from ..lib.clock import today
 
     age_days = (datetime.now() - STEWARD_BIRTHDAY).days
@@ -25,7 +25,6 @@ def boot():
     echo(f"STEWARD — day {age_days}  |  {now_local.strftime('%a %d %b %Y  %I:%M%p').lower()}\n")
 
     tasks = get_tasks()
-    all_tasks = get_all_tasks()
     steward_tasks = [t for t in get_tasks(include_steward=True) if t.steward]
     if steward_tasks:
         echo("STEWARD TASKS:")
@@ -33,7 +32,7 @@ def boot():
             echo(f"  · {t.content}")
         echo("")
     today_date = today()
-    snapshot = build_feedback_snapshot(all_tasks=all_tasks, pending_tasks=tasks, today=today_date)
+    snapshot = build_feedback_snapshot(today=today_date)
     echo("\n".join(render_feedback_snapshot(snapshot)))
 
     sessions = get_sessions(limit=1)
@@ -1,7 +1,13 @@
 from fncli import cli
 
 from ..lib.errors import echo, exit_error
-from . import add_session, add_observation, delete_observation, get_observations
+from . import (
+    add_observation,
+    add_session,
+    delete_observation,
+    find_observation,
+    get_observations,
+)
 
 
 @cli("life steward")
@@ -37,18 +43,16 @@ def rm(
     query: str | None = None,
 ):
     """Delete an observation — fuzzy match or latest"""
-    observations = get_observations(limit=50)
-    if not observations:
-        exit_error("no observations to remove")
-
     if query is None:
+        observations = get_observations(limit=1)
+        if not observations:
+            exit_error("no observations to remove")
         target = observations[0]
     else:
-        q = query.lower()
-        matches = [o for o in observations if q in o.body.lower()]
-        if not matches:
+        found = find_observation(query)
+        if not found:
             exit_error(f"no observation matching '{query}'")
-        target = matches[0]
+        target = found
 
     deleted = delete_observation(target.id)
     if deleted:
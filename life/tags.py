@@ -1,3 +1,4 @@
+import json
 import sqlite3
 from collections import defaultdict
 from typing import TypeVar
@@ -43,18 +44,21 @@ def add_tag(task_id: str | None, habit_id: str | None, tag: str, conn=None) -> N
         )
 
 
+@db.cached_read
 def get_tags_for_task(task_id: str) -> list[str]:
     with db.get_db() as conn:
         cursor = conn.execute("SELECT tag FROM tags WHERE task_id = ?", (task_id,))
         return [row[0] for row in cursor.fetchall()]
 
 
+@db.cached_read
 def get_tags_for_habit(habit_id: str) -> list[str]:
     with db.get_db() as conn:
         cursor = conn.execute("SELECT tag FROM tags WHERE habit_id = ?", (habit_id,))
         return [row[0] for row in cursor.fetchall()]
 
 
+@db.cached_read
 def get_tasks_by_tag(tag: str) -> list[Task]:
     with db.get_db() as conn:
         cursor = conn.execute(
@@ -67,12 +71,12 @@ def get_tasks_by_tag(tag: str) -> list[Task]:
             """,
             (tag.lower(),),
         )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        return hydrate_tags(tasks, tags_map)
+        rows = cursor.fetchall()
+        tags_map = load_tags_for_tasks([row[0] for row in rows], conn=conn)
+        return [row_to_task(row, tags_map.get(row[0], [])) for row in rows]
 
 
+@db.cached_read
 def get_habits_by_tag(tag: str) -> list[Habit]:
     with db.get_db() as conn:
         cursor = conn.execute(
@@ -84,10 +88,9 @@ def get_habits_by_tag(tag: str) -> list[Habit]:
             """,
             (tag.lower(),),
         )
-        habits = [row_to_habit(row) for row in cursor.fetchall()]
-        habit_ids = [h.id for h in habits]
-        tags_map = load_tags_for_habits(habit_ids, conn=conn)
-        return hydrate_tags(habits, tags_map)
+        rows = cursor.fetchall()
+        tags_map = load_tags_for_habits([row[0] for row in rows], conn=conn)
+        return [row_to_habit(row, tags=tags_map.get(row[0], [])) for row in rows]
 
 
 def remove_tag(task_id: str | None, habit_id: str | None, tag: str) -> None:
@@ -101,6 +104,7 @@ def remove_tag(task_id: str | None, habit_id: str | None, tag: str) -> None:
         )
 
 
+@db.cached_read
 def list_all_tags() -> list[str]:
     with db.get_db() as conn:
         cursor = conn.execute("SELECT DISTINCT tag FROM tags ORDER BY tag ASC")
@@ -117,11 +121,10 @@ def load_tags_for_tasks(
     if not task_ids:
         return {}
 
-    placeholders = ",".join("?" * len(task_ids))
-    query = f"SELECT task_id, tag FROM tags WHERE task_id IN ({placeholders}) ORDER BY tag"  # noqa: S608
+    query = "SELECT task_id, tag FROM tags WHERE task_id IN (SELECT value FROM json_each(?)) ORDER BY tag"
 
     def _run(c: sqlite3.Connection) -> dict[str, list[str]]:
-        cursor = c.execute(query, task_ids)
+        cursor = c.execute(query, (json.dumps(task_ids),))
         tags_map: defaultdict[str, list[str]] = defaultdict(list)
         for task_id, tag in cursor.fetchall():
             tags_map[task_id].append(tag)
@@ -143,11 +146,10 @@ def load_tags_for_habits(
     if not habit_ids:
         return {}
 
-    placeholders = ",".join("?" * len(habit_ids))
-    query = f"SELECT habit_id, tag FROM tags WHERE habit_id IN ({placeholders}) ORDER BY tag"  # noqa: S608
+    query = "SELECT habit_id, tag FROM tags WHERE habit_id IN (SELECT value FROM json_each(?)) ORDER BY tag"
 
     def _run(c: sqlite3.Connection) -> dict[str, list[str]]:
-        cursor = c.execute(query, habit_ids)
+        cursor = c.execute(query, (json.dumps(habit_ids),))
         tags_map: defaultdict[str, list[str]] = defaultdict(list)
         for habit_id, tag in cursor.fetchall():
             tags_map[habit_id].append(tag)
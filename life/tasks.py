@@ -1,10 +1,12 @@
 import contextlib
+import json
 import re
 import sqlite3
 import sys
 import uuid
+from collections.abc import Iterator
 from datetime import date as _date
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fncli import UsageError, cli
 
@@ -14,16 +16,17 @@ from .lib.ansi import ANSI
 from .lib.converters import row_to_task
 from .lib.errors import echo, exit_error
 from .lib.format import format_status
-from .lib.fuzzy import find_in_pool, find_in_pool_exact
+from .lib.fuzzy import find_in_table
 from .lib.parsing import parse_due_and_item, validate_content
 from .models import Task, TaskMutation
-from .tags import add_tag, hydrate_tags, load_tags_for_tasks
+from .tags import add_tag
 
 __all__ = [
     "add_task",
     "cancel_task",
     "check_task",
     "check_task_cmd",
+    "completed_among",
     "count_overdue_resets",
     "defer_task",
     "delete_task",
@@ -36,6 +39,7 @@ __all__ = [
     "get_subtasks",
     "get_task",
     "get_tasks",
+    "iter_tasks",
     "last_completion",
     "rename_task",
     "set_blocked_by",
@@ -120,73 +124,88 @@ def add_task(
     return task_id
 
 
-def get_task(task_id: str) -> Task | None:
+_TASK_COLUMNS = "id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline"
+
+# Tags ride along as one column; the covering (task_id, tag) index yields them in order.
+_TAGS_COLUMN = "(SELECT group_concat(tag, char(31)) FROM (SELECT tag FROM tags WHERE task_id = tasks.id ORDER BY tag))"
+
+
+def _split_tags(joined: str | None) -> list[str]:
+    # Interned: a large listing repeats a few dozen tag names across every row.
+    return [sys.intern(tag) for tag in joined.split("\x1f")] if joined else []
+
+
+def _query_tasks(
+    conn: sqlite3.Connection, where: str, params: tuple[object, ...] = ()
+) -> sqlite3.Cursor:
+    return conn.execute(
+        f"SELECT {_TASK_COLUMNS}, {_TAGS_COLUMN} FROM tasks WHERE {where}",  # noqa: S608
+        params,
+    )
+
+
+def _select_tasks(
+    conn: sqlite3.Connection, where: str, params: tuple[object, ...] = ()
+) -> list[Task]:
+    """Tasks matching where, each built once with its tags attached."""
+    return [row_to_task(row, _split_tags(row[13])) for row in _query_tasks(conn, where, params)]
+
+
+def iter_tasks(
+    *,
+    pending_only: bool = False,
+    include_steward: bool = False,
+    batch_size: int = db.FETCH_BATCH,
+) -> Iterator[Task]:
+    """Stream tasks in insertion order, batch_size rows per fetch, tags attached.
+
+    Memory stays at one batch however large the table; callers that need the
+    dashboard order should use get_tasks()/get_all_tasks() instead.
+    """
+    clauses = []
+    if pending_only:
+        clauses.append("completed_at IS NULL")
+    if not include_steward:
+        clauses.append("steward = 0")
+    where = " AND ".join(clauses) or "1"
     with db.get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE id = ?",
-            (task_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
+        cursor = _query_tasks(conn, f"{where} ORDER BY rowid")
+        for batch in db.fetch_batches(cursor, batch_size):
+            yield from (row_to_task(row, _split_tags(row[13])) for row in batch)
 
-        task = row_to_task(row)
-        tags_map = load_tags_for_tasks([task_id], conn=conn)
-        return hydrate_tags([task], tags_map)[0]
+
+@db.cached_read
+def get_task(task_id: str) -> Task | None:
+    with db.get_db() as conn:
+        tasks = _select_tasks(conn, "id = ?", (task_id,))
+    return tasks[0] if tasks else None
 
 
+@db.cached_read
 def get_tasks(include_steward: bool = False) -> list[Task]:
+    where = "completed_at IS NULL" if include_steward else "completed_at IS NULL AND steward = 0"
     with db.get_db() as conn:
-        if include_steward:
-            cursor = conn.execute(
-                "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE completed_at IS NULL"
-            )
-        else:
-            cursor = conn.execute(
-                "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE completed_at IS NULL AND steward = 0"
-            )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        result = hydrate_tags(tasks, tags_map)
-
-    return sorted(result, key=_task_sort_key)
+        tasks = _select_tasks(conn, where)
+    return sorted(tasks, key=_task_sort_key)
 
 
+@db.cached_read
 def get_all_tasks() -> list[Task]:
     with db.get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE steward = 0"
-        )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        result = hydrate_tags(tasks, tags_map)
-
-    return sorted(result, key=_task_sort_key)
+        tasks = _select_tasks(conn, "steward = 0")
+    return sorted(tasks, key=_task_sort_key)
 
 
+@db.cached_read
 def get_subtasks(parent_id: str) -> list[Task]:
     with db.get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE parent_id = ?",
-            (parent_id,),
-        )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        return hydrate_tags(tasks, tags_map)
+        return _select_tasks(conn, "parent_id = ?", (parent_id,))
 
 
+@db.cached_read
 def get_focus() -> list[Task]:
     with db.get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id, content, focus, scheduled_date, created, completed_at, parent_id, scheduled_time, blocked_by, description, steward, source, is_deadline FROM tasks WHERE focus = 1 AND completed_at IS NULL AND steward = 0"
-        )
-        tasks = [row_to_task(row) for row in cursor.fetchall()]
-        task_ids = [t.id for t in tasks]
-        tags_map = load_tags_for_tasks(task_ids, conn=conn)
-        return hydrate_tags(tasks, tags_map)
+        return _select_tasks(conn, "focus = 1 AND completed_at IS NULL AND steward = 0")
 
 
 _TRACKED_FIELDS = {
@@ -269,6 +288,7 @@ def update_task(
     return get_task(task_id)
 
 
+@db.cached_read
 def get_mutations(task_id: str) -> list[TaskMutation]:
     with db.get_db() as conn:
         rows = conn.execute(
@@ -305,7 +325,7 @@ def defer_task(task_id: str, reason: str) -> Task | None:
 def count_overdue_resets(window_start: str, window_end: str) -> int:
     with db.get_db() as conn:
         row = conn.execute(
-            "SELECT COUNT(*) FROM task_mutations WHERE reason = 'overdue_reset' AND date(mutated_at) >= ? AND date(mutated_at) <= ?",
+            "SELECT COUNT(*) FROM task_mutations WHERE reason = 'overdue_reset' AND mutated_day BETWEEN ? AND ?",
             (window_start, window_end),
         ).fetchone()
     return row[0] if row else 0
@@ -338,50 +358,28 @@ def delete_task(task_id: str) -> None:
 
 
 def check_task(task_id: str) -> tuple[Task | None, Task | None]:
+    """Complete a task; the parent completes too once nothing beneath it is pending."""
+    from .graph import complete_cascade
+
     task = get_task(task_id)
     if not task or task.completed_at:
         return task, None
     completed = clock.now().strftime("%Y-%m-%dT%H:%M:%S")
     with db.get_db() as conn:
-        conn.execute(
-            "UPDATE tasks SET completed_at = ? WHERE id = ?",
-            (completed, task_id),
-        )
-        _record_mutation(conn, task_id, "completed_at", None, completed)
-        conn.execute(
-            "UPDATE tasks SET blocked_by = NULL WHERE blocked_by = ?",
-            (task_id,),
-        )
-    completed_task = get_task(task_id)
-    parent_completed = None
-    if task.parent_id:
-        siblings = get_subtasks(task.parent_id)
-        if all(s.completed_at for s in siblings):
-            parent = get_task(task.parent_id)
-            if parent and not parent.completed_at:
-                with db.get_db() as conn:
-                    conn.execute(
-                        "UPDATE tasks SET completed_at = ? WHERE id = ?",
-                        (completed, task.parent_id),
-                    )
-                    _record_mutation(conn, task.parent_id, "completed_at", None, completed)
-                parent_completed = get_task(task.parent_id)
-    return completed_task, parent_completed
+        done = complete_cascade(conn, task_id, completed)
+    parent_completed = get_task(task.parent_id) if task.parent_id in done else None
+    return get_task(task_id), parent_completed
 
 
 def uncheck_task(task_id: str) -> Task | None:
+    """Reopen a task and any completed ancestors."""
+    from .graph import reopen_cascade
+
     task = get_task(task_id)
     if not task or not task.completed_at:
         return task
     with db.get_db() as conn:
-        conn.execute("UPDATE tasks SET completed_at = NULL WHERE id = ?", (task_id,))
-        _record_mutation(conn, task_id, "completed_at", task.completed_at, None)
-    if task.parent_id:
-        parent = get_task(task.parent_id)
-        if parent and parent.completed_at:
-            with db.get_db() as conn:
-                conn.execute("UPDATE tasks SET completed_at = NULL WHERE id = ?", (task.parent_id,))
-                _record_mutation(conn, task.parent_id, "completed_at", parent.completed_at, None)
+        reopen_cascade(conn, task_id)
     return get_task(task_id)
 
 
@@ -402,27 +400,42 @@ def toggle_focus(task_id: str) -> Task | None:
     return update_task(task_id, focus=not task.focus)
 
 
-def find_task(ref: str) -> Task | None:
-    from .dashboard import _get_completed_today
+_RESOLVABLE_SCOPE = "completed_at IS NULL OR (completed_at >= :today AND completed_at < :tomorrow)"
+
+
+def _resolve_task(
+    ref: str, scope: str, params: dict[str, str] | None = None, fuzzy: bool = True
+) -> Task | None:
+    with db.get_db() as conn:
+        task_id = find_in_table(
+            conn, ref, "tasks", scope, params, fuzzy=fuzzy, trigram="tasks_trigram_fts"
+        )
+    return get_task(task_id) if task_id else None
+
 
-    pending = get_tasks(include_steward=True)
-    completed_today = _get_completed_today()
-    return find_in_pool(ref, pending + completed_today)
+def _today_bounds() -> dict[str, str]:
+    today = clock.today()
+    return {"today": today.isoformat(), "tomorrow": (today + timedelta(days=1)).isoformat()}
+
+
+def find_task(ref: str) -> Task | None:
+    """Pending tasks (steward included) and tasks completed today."""
+    return _resolve_task(ref, _RESOLVABLE_SCOPE, _today_bounds())
 
 
 def find_task_any(ref: str) -> Task | None:
-    return find_in_pool(ref, get_all_tasks())
+    return _resolve_task(ref, "steward = 0")
 
 
 def find_task_exact(ref: str) -> Task | None:
-    from .dashboard import _get_completed_today
-
-    pending = get_tasks(include_steward=True)
-    completed_today = _get_completed_today()
-    return find_in_pool_exact(ref, pending + completed_today)
+    return _resolve_task(ref, _RESOLVABLE_SCOPE, _today_bounds(), fuzzy=False)
 
 
 def set_blocked_by(task_id: str, blocker_id: str | None) -> Task | None:
+    from .graph import would_cycle
+
+    if blocker_id is not None and would_cycle(task_id, blocker_id):
+        raise ValueError("that would make the task block itself")
     with db.get_db() as conn:
         conn.execute(
             "UPDATE tasks SET blocked_by = ? WHERE id = ?",
@@ -431,6 +444,17 @@ def set_blocked_by(task_id: str, blocker_id: str | None) -> Task | None:
     return get_task(task_id)
 
 
+def completed_among(task_ids: list[str]) -> list[str]:
+    """Ids from task_ids that are now completed, in the order given."""
+    with db.get_db() as conn:
+        rows = conn.execute(
+            "SELECT j.value FROM json_each(?) j JOIN tasks t ON t.id = j.value"
+            " WHERE t.completed_at IS NOT NULL ORDER BY j.key",
+            (json.dumps(task_ids),),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
 def last_completion() -> datetime | None:
     with db.get_db() as conn:
         task_row = conn.execute(
@@ -712,7 +736,10 @@ def block(ref: list[str], by: str) -> None:
     blocker = resolve_task(by)
     if blocker.id == t.id:
         exit_error("A task cannot block itself")
-    set_blocked_by(t.id, blocker.id)
+    try:
+        set_blocked_by(t.id, blocker.id)
+    except ValueError:
+        exit_error(f"'{blocker.content}' is already waiting on '{t.content}'")
     echo(f"\u2298 {t.content.lower()}  \u2190  {blocker.content.lower()}")
 
 
@@ -771,14 +798,10 @@ def today(ref: list[str] | None = None) -> None:
     if ref:
         _schedule(["today", *ref])
     else:
-        from .dashboard import get_pending_items, get_today_breakdown, get_today_completed
-        from .habits import get_habits
+        from .dashboard import load_dashboard_snapshot
         from .lib.render import render_dashboard
 
-        items = get_pending_items() + get_habits()
-        today_items = get_today_completed()
-        today_breakdown = get_today_breakdown()
-        echo(render_dashboard(items, today_breakdown, None, None, today_items))
+        echo(render_dashboard(load_dashboard_snapshot()))
 
 
 @cli("life")
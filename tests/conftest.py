@@ -18,9 +18,7 @@ class _Result:
 
 class FnCLIRunner:
     def invoke(self, argv: list[str]) -> _Result:
-        from fncli import dispatch
-
-        import life.cli  # noqa: F401 — registers fncli commands
+        from life.cli import dispatch
         from life.dash import dashboard
 
         out_buf = io.StringIO()
@@ -49,12 +47,21 @@ def tmp_life_dir(monkeypatch, tmp_path):
     monkeypatch.setattr("life.config.CONFIG_PATH", cfg_path)
     monkeypatch.setattr("life.config.BACKUP_DIR", tmp_path / "backups")
 
+    # life.comms opens its own connections from its own config.
+    monkeypatch.setattr("life.comms.config.LIFE_DIR", tmp_path)
+    monkeypatch.setattr("life.comms.config.COMMS_DIR", tmp_path / "comms")
+    monkeypatch.setattr("life.comms.config.DB_PATH", db_path)
+    monkeypatch.setattr("life.comms.config.CONFIG_PATH", tmp_path / "comms" / "config.yaml")
+    monkeypatch.setattr("life.comms.config.RULES_PATH", tmp_path / "comms" / "rules.md")
+    monkeypatch.setattr("life.comms.config.BACKUP_DIR", tmp_path / "backups")
+
     life.config.Config._instance = None
     life.config.Config._data = None
     monkeypatch.setattr("life.config._config", life.config.Config())
 
     db.init(db_path=db_path)
     yield tmp_path
+    db.close_all()
 
 
 @pytest.fixture
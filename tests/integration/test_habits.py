@@ -0,0 +1,20 @@
+from life import db
+from life.habits import add_habit
+from tests.conftest import FnCLIRunner
+
+runner = FnCLIRunner()
+
+
+def test_habits_streaks_cli(tmp_life_dir, fixed_today):
+    habit_id = add_habit("floss")
+    with db.get_db() as conn:
+        conn.execute(
+            "INSERT INTO checks (habit_id, check_date, completed_at) VALUES (?, ?, ?)",
+            (habit_id, "2025-10-30", "2025-10-30T08:00:00"),
+        )
+
+    result = runner.invoke(["habits", "--streaks"])
+
+    assert result.exit_code == 0
+    assert "floss" in result.stdout
+    assert "2025-10-30" in result.stdout
@@ -0,0 +1,20 @@
+from life.tasks import add_task, toggle_completed
+from tests.conftest import FnCLIRunner
+
+runner = FnCLIRunner()
+
+
+def test_momentum_weeks_history(tmp_life_dir):
+    toggle_completed(add_task("ship it"))
+
+    result = runner.invoke(["momentum", "--weeks", "4"])
+
+    assert result.exit_code == 0
+    assert result.stdout.count("tasks ") == 4
+    assert "tasks 1/1 (100%)" in result.stdout
+
+
+def test_momentum_rejects_unknown_bucket(tmp_life_dir):
+    result = runner.invoke(["momentum", "--weeks", "2", "--by", "fortnight"])
+
+    assert result.exit_code != 0
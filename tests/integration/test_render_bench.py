@@ -0,0 +1,53 @@
+import dataclasses
+import re
+from datetime import date
+
+from life.bench import RENDER_PENDING, render_snapshot
+from life.lib.render import render_dashboard
+from life.models import DashboardSnapshot, Task
+
+SMALL = RENDER_PENDING // 10
+
+
+class _CountedTask(Task):
+    """Task that counts its attribute reads: a work measure that doesn't depend on timing."""
+
+    reads = 0
+
+    def __getattribute__(self, name: str):
+        _CountedTask.reads += 1
+        return super().__getattribute__(name)
+
+
+def _task_reads(snapshot: DashboardSnapshot) -> int:
+    pending = [
+        _CountedTask(**{f.name: getattr(t, f.name) for f in dataclasses.fields(t)})
+        for t in snapshot.pending
+    ]
+    _CountedTask.reads = 0
+    render_dashboard(dataclasses.replace(snapshot, pending=pending))
+    return _CountedTask.reads
+
+
+def test_dashboard_render_scales_linearly(tmp_life_dir, fixed_today):
+    large = render_snapshot(RENDER_PENDING, 0, fixed_today)
+    small = render_snapshot(SMALL, 0, fixed_today)
+
+    output = render_dashboard(large)
+    large_reads, small_reads = _task_reads(large), _task_reads(small)
+
+    parents = {t.parent_id for t in large.pending}
+    leaves = {t.id[:8] for t in large.pending if t.id not in parents}
+    assert leaves <= set(re.findall(r"\[([0-9a-f]{8})\]", output))
+    # Ten times the tasks: linear work reads ~10x the fields, a scan per row ~65x.
+    assert large_reads < small_reads * 12, f"{large_reads} task reads vs {small_reads}"
+
+
+def test_render_snapshot_is_deterministic():
+    anchor = date(2025, 10, 30)
+    first = render_snapshot.__wrapped__(200, 3, anchor)
+    second = render_snapshot.__wrapped__(200, 3, anchor)
+
+    assert first == second
+    assert any(t.parent_id for t in first.pending)
+    assert any(t.blocked_by for t in first.pending)
@@ -0,0 +1,46 @@
+from life.tasks import add_task
+from tests.conftest import FnCLIRunner
+
+runner = FnCLIRunner()
+
+
+def test_search_cli(tmp_life_dir):
+    add_task("plan holiday")
+    result = runner.invoke(["search", "holiday"])
+
+    assert result.exit_code == 0
+    assert "[holiday]" in result.stdout
+
+
+def test_search_cli_no_matches(tmp_life_dir):
+    result = runner.invoke(["search", "nothing"])
+
+    assert result.exit_code == 0
+    assert "no matches" in result.stdout
+
+
+def test_search_in_patterns(tmp_life_dir):
+    from life.patterns import add_pattern
+
+    add_pattern("avoids admin when tired")
+    result = runner.invoke(["search", "admin", "--in", "patterns,observations"])
+
+    assert result.exit_code == 0
+    assert "avoids admin when tired" in result.stdout
+
+
+def test_search_in_unknown_source(tmp_life_dir):
+    result = runner.invoke(["search", "admin", "--in", "nope"])
+
+    assert result.exit_code != 0
+
+
+def test_pattern_rm_matches_substring(tmp_life_dir):
+    from life.patterns import add_pattern, get_patterns
+
+    add_pattern("procrastinates on calls")
+    add_pattern("skips lunch on busy days")
+    result = runner.invoke(["pattern", "rm", "lunch"])
+
+    assert result.exit_code == 0
+    assert [p.body for p in get_patterns()] == ["procrastinates on calls"]
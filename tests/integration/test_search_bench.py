@@ -0,0 +1,59 @@
+import random
+import uuid
+
+from life import db
+from life.lib.fuzzy import find_in_pool
+from life.tasks import find_task, get_tasks
+
+ROWS = 10_000
+WORDS = ["call", "email", "book", "pay", "plan", "fix", "water", "buy", "order", "garden"]
+
+
+def _seed(rows: int) -> None:
+    rng = random.Random(rows)  # noqa: S311
+    with db.get_db() as conn:
+        conn.executemany(
+            "INSERT INTO tasks (id, content, created) VALUES (?, ?, '2025-01-01')",
+            [
+                (
+                    str(uuid.UUID(int=rng.getrandbits(128))),
+                    f"{' '.join(rng.choices(WORDS, k=4))} {i}",
+                )
+                for i in range(rows)
+            ],
+        )
+        conn.execute(
+            "INSERT INTO tasks (id, content, created) VALUES (?, 'book dentist appointment', '2025-01-01')",
+            (str(uuid.UUID(int=rng.getrandbits(128))),),
+        )
+
+
+def _statements(fn) -> list[str]:
+    """SQL fn issues on the pooled connection."""
+    statements: list[str] = []
+    with db.get_db() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        fn()
+    finally:
+        with db.get_db() as conn:
+            conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith(("SELECT", "WITH"))]
+
+
+def test_trigram_resolution_uses_index_not_python_scan(tmp_life_dir):
+    _seed(ROWS)
+
+    found = find_task("dentist appoint")
+    statements = _statements(lambda: find_task("dentist appoint"))
+
+    assert found is not None
+    assert found.content == "book dentist appointment"
+    assert found == find_in_pool("dentist appoint", get_tasks())
+    assert any("tasks_trigram_fts" in sql for sql in statements)
+    with db.get_db() as conn:
+        for sql in statements:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            assert not [
+                line for line in plan if line.split()[:2] in (["SCAN", "tasks"], ["SCAN", "t"])
+            ], (sql, plan)
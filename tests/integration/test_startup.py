@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from life.commands import COMMANDS, build_manifest
+
+ROOT = Path(__file__).parent.parent.parent
+
+# Ceiling on summed self-import time, checked only when LIFE_STARTUP_BUDGET is set:
+# wall-clock numbers vary by machine, the module guards below are the hard check.
+COLD_START_BUDGET_US = 250_000
+
+HEAVY_MODULES = (
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "msal",
+    "requests",
+    "yaml",
+    "life.comms",
+    "life.email",
+    "life.signal",
+    "life.steward",
+)
+
+
+def _cold_start(argv: list[str]) -> tuple[set[str], int]:
+    """Loaded module names and summed self-import time (us) for a fresh process."""
+    code = f"import sys, life.cli; life.cli.load_commands({argv!r}); print(*sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            total += int(line.removeprefix("import time:").split("|")[0])
+    return set(result.stdout.split()), total
+
+
+def test_command_manifest_is_current():
+    assert build_manifest() == COMMANDS, "command registry changed: run `python -m life.commands`"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["life", "dashboard"], ["life", "add", "buy milk"], ["life", "check", "milk"]],
+)
+def test_cold_start_skips_heavy_imports(argv):
+    modules, total = _cold_start(argv)
+    heavy = sorted(name for name in modules if any(name.startswith(mod) for mod in HEAVY_MODULES))
+    assert not heavy, f"{' '.join(argv)} imports {heavy}"
+    if os.environ.get("LIFE_STARTUP_BUDGET"):
+        assert total < COLD_START_BUDGET_US, f"{' '.join(argv)} cold start {total}us"
+
+
+def test_namespace_loads_only_its_module():
+    modules, _ = _cold_start(["life", "email", "--help"])
+    assert "life.email" in modules
+    assert "life.signal" not in modules
+
+
+def test_client_skips_cli_and_database_imports():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, life.client; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    loaded = set(result.stdout.split())
+    assert not loaded & {"life.cli", "life.db", "fncli", "sqlite3"}
+
+
+def test_cached_dashboard_skips_database_imports(tmp_path):
+    code = (
+        "import datetime, sys, life.lib.clock as clock; "
+        "clock.today = lambda: datetime.date(2025, 10, 30); "
+        "clock.now = lambda: datetime.datetime(2025, 10, 30, 9, 30); "
+        "sys.argv = ['life']; "
+        "import life.cli; life.cli.main(); "
+        "print(*sys.modules, file=sys.stderr)"
+    )
+    env = {**os.environ, "HOME": str(tmp_path)}
+    # The first run creates the database, so its checkpoint on exit moves the key;
+    # the second renders against the settled file and the third is a hit.
+    runs = [
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+            env=env,
+        )
+        for _ in range(3)
+    ]
+
+    assert runs[2].stdout == runs[1].stdout == runs[0].stdout
+    assert "life.db" in runs[1].stderr.split()
+    loaded = set(runs[2].stderr.split())
+    assert not loaded & {"life.db", "life.dashboard", "life.tasks", "fncli", "sqlite3"}
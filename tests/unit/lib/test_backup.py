@@ -1,4 +1,24 @@
-from life.lib.backup import backup
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from life import config
+from life.lib.backup import backup, list_snapshots, prune, restore
+from life.tasks import add_task, get_tasks
+
+
+def _contents() -> list[str]:
+    return sorted(t.content for t in get_tasks())
+
+
+def _chunk_files() -> set[str]:
+    return {p.name for p in (config.BACKUP_DIR / "chunks").glob("*/*")}
+
+
+def _age(snapshot, taken: datetime) -> None:
+    snapshot.rename(snapshot.with_name(taken.strftime("%Y%m%d_%H%M%S_%f")))
 
 
 def test_backup_creates_dir(tmp_life_dir):
@@ -7,9 +27,11 @@ def test_backup_creates_dir(tmp_life_dir):
     assert result["path"].is_dir()
 
 
-def test_backup_contains_db(tmp_life_dir):
+def test_backup_writes_manifest_not_db_copy(tmp_life_dir):
     result = backup()
-    assert (result["path"] / "life.db").exists()
+    manifest = json.loads((result["path"] / "manifest.json").read_text())
+    assert len(manifest["chunks"]) == result["chunks"] > 0
+    assert sorted(p.name for p in result["path"].iterdir()) == ["manifest.json"]
 
 
 def test_backup_timestamp_format(tmp_life_dir):
@@ -52,3 +74,75 @@ def test_backup_second_has_delta(tmp_life_dir):
     backup()
     result = backup()
     assert result["delta_total"] is not None
+
+
+def test_unchanged_database_adds_almost_no_chunks(tmp_life_dir):
+    add_task("buy milk")
+    first = backup()
+    second = backup()
+
+    assert first["new_chunks"] == first["chunks"] > 1
+    assert second["new_chunks"] <= 1
+    assert len(_chunk_files()) <= first["chunks"] + 1
+
+
+def test_restore_round_trips_and_saves_current_state(tmp_life_dir):
+    add_task("buy milk")
+    snapshot = backup()["path"]
+    add_task("walk dog")
+
+    result = restore(snapshot.name[:15])
+
+    assert result["path"] == snapshot
+    assert _contents() == ["buy milk"]
+    restore(result["safety"].name)
+    assert _contents() == ["buy milk", "walk dog"]
+
+
+def test_restore_refuses_unknown_and_corrupt_snapshots(tmp_life_dir):
+    with pytest.raises(ValueError, match="no snapshots"):
+        restore("latest")
+    snapshot = backup()["path"]
+    with pytest.raises(ValueError, match="no snapshot matching"):
+        restore("1999")
+
+    digest = json.loads((snapshot / "manifest.json").read_text())["chunks"][0]
+    (config.BACKUP_DIR / "chunks" / digest[:2] / digest).write_bytes(b"junk")
+    with pytest.raises(ValueError, match="unreadable"):
+        restore("latest")
+
+
+def test_restore_reads_legacy_full_copy_snapshots(tmp_life_dir):
+    add_task("buy milk")
+    legacy = config.BACKUP_DIR / "20240101_090000_000000"
+    legacy.mkdir(parents=True)
+    with sqlite3.connect(config.DB_PATH) as src, sqlite3.connect(legacy / "life.db") as dst:
+        src.backup(dst)
+    add_task("walk dog")
+
+    restore("20240101")
+
+    assert _contents() == ["buy milk"]
+
+
+def test_prune_keeps_retention_buckets_and_drops_orphan_chunks(tmp_life_dir):
+    anchor = datetime(2025, 10, 30, 12, 0)
+    for i in range(6):
+        add_task(f"task {i}")
+        _age(backup(prune_after=False)["path"], anchor - timedelta(days=30 * (i + 1)))
+    for minutes in (90, 30):
+        _age(backup(prune_after=False)["path"], anchor - timedelta(minutes=minutes))
+    before = _chunk_files()
+
+    removed = prune(keep_last=1, keep_hourly=2, keep_daily=0, keep_weekly=2)
+
+    kept = [datetime.strptime(p.name, "%Y%m%d_%H%M%S_%f") for p in list_snapshots()]
+    assert len(removed) == 5
+    assert kept == [
+        anchor - timedelta(days=30),
+        anchor - timedelta(minutes=90),
+        anchor - timedelta(minutes=30),
+    ]
+    assert _chunk_files() < before
+    restore(kept[0].strftime("%Y%m%d_%H%M%S"))
+    assert len(_contents()) == 1
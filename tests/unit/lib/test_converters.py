@@ -98,6 +98,14 @@ def test_row_to_task_complete():
     assert task.completed_at is not None
 
 
+def test_row_to_task_attaches_tags_without_copy():
+    tags = ["home"]
+    task = row_to_task(("task-3", "Water plants", 0, None, "2025-10-30T10:00:00", None), tags)
+    assert task.tags is tags
+    assert task.parent_id is None
+    assert task.steward is False
+
+
 def test_row_to_task_no_focus():
     row = (
         "task-2",
@@ -0,0 +1,84 @@
+import pytest
+
+from life import db
+from life.batch import parse_commands, run_batch
+
+
+def _contents() -> list[str]:
+    with db.get_db() as conn:
+        return [r[0] for r in conn.execute("SELECT content FROM tasks ORDER BY rowid")]
+
+
+def test_parse_commands_accepts_lines_and_json():
+    text = '# setup\nlife add "buy milk"\n\n["add", "call mum"]\nhabit stretch\n'
+
+    assert parse_commands(text) == [["add", "buy milk"], ["add", "call mum"], ["habit", "stretch"]]
+    assert parse_commands('[["add", "a b"], "add \'c d\'"]') == [["add", "a b"], ["add", "c d"]]
+    assert parse_commands('["add", "one"]') == [["add", "one"]]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ('add "unterminated', "line 1"),
+        ("[1, 2]\n", "array of strings"),
+        ("add a\nbatch --from x\n", "line 2: `life batch` cannot run inside a batch"),
+    ],
+)
+def test_parse_commands_rejects_bad_input(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_commands(text)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["serve"],
+        ["signal", "send", "+61400000000", "hi"],
+        ["email", "archive", "t1"],
+        ["bench"],
+        ["db", "restore", "latest"],
+        ["db", "backup"],
+    ],
+)
+def test_run_batch_rejects_commands_outside_the_transaction(tmp_life_dir, argv):
+    with pytest.raises(ValueError, match=r"command 2: `life \w+.*` cannot run inside a batch"):
+        run_batch([["add", "one"], argv])
+
+    assert _contents() == []
+
+
+def test_run_batch_commits_every_command(tmp_life_dir):
+    results = run_batch([["add", "buy milk"], ["add", "call mum"]])
+
+    assert [r.status for r in results] == ["ok", "ok"]
+    assert "buy milk" in results[0].stdout
+    assert _contents() == ["buy milk", "call mum"]
+
+
+def test_run_batch_rolls_back_everything_on_first_failure(tmp_life_dir):
+    results = run_batch([["add", "one"], ["done", "nosuchthing"], ["add", "two"]])
+
+    assert [(r.status, r.code) for r in results] == [
+        ("rolled back", 0),
+        ("failed", 1),
+        ("skipped", None),
+    ]
+    assert "nosuchthing" in results[1].stderr
+    assert _contents() == []
+
+
+def test_run_batch_keep_going_undoes_only_failures(tmp_life_dir):
+    results = run_batch([["add", "one"], ["done", "nosuchthing"], ["add", "two"]], keep_going=True)
+
+    assert [r.status for r in results] == ["ok", "failed", "ok"]
+    assert _contents() == ["one", "two"]
+
+
+def test_run_batch_uses_one_connection(tmp_life_dir):
+    before = db.connection_stats()["opened"]
+
+    run_batch([["add", f"task {i}"] for i in range(5)])
+
+    assert db.connection_stats()["opened"] == before
+    assert len(_contents()) == 5
@@ -0,0 +1,86 @@
+import hashlib
+import sqlite3
+from datetime import date
+
+import pytest
+
+from life import bench
+
+ANCHOR = date(2025, 10, 30)
+
+
+def _digest(db_path) -> str:
+    conn = sqlite3.connect(db_path)
+    try:
+        h = hashlib.sha256()
+        for table, order in (
+            ("tasks", "id"),
+            ("tags", "rowid"),
+            ("checks", "habit_id, check_date"),
+        ):
+            for row in conn.execute(f"SELECT * FROM {table} ORDER BY {order}"):  # noqa: S608
+                h.update(repr(row).encode())
+        return h.hexdigest()
+    finally:
+        conn.close()
+
+
+def test_generate_is_deterministic(tmp_life_dir):
+    first, second = tmp_life_dir / "a.db", tmp_life_dir / "b.db"
+    counts = bench.generate(first, scale=0.002, seed=7, anchor=ANCHOR)
+    bench.generate(second, scale=0.002, seed=7, anchor=ANCHOR)
+
+    assert counts["tasks"] == 200
+    assert counts["checks"] > 0
+    assert counts["tags"] > counts["tasks"]
+    assert _digest(first) == _digest(second)
+
+
+def test_generate_indexes_tags_for_search(tmp_life_dir):
+    path = tmp_life_dir / "bench.db"
+    bench.generate(path, scale=0.002, anchor=ANCHOR)
+
+    conn = sqlite3.connect(path)
+    try:
+        tagged = conn.execute(
+            "SELECT COUNT(DISTINCT COALESCE(task_id, habit_id)) FROM tags WHERE tag = 'finance'"
+        ).fetchone()[0]
+        indexed = conn.execute(
+            "SELECT COUNT(*) FROM search_fts WHERE search_fts MATCH 'tags:finance'"
+        ).fetchone()[0]
+        triggers = {
+            r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+    finally:
+        conn.close()
+    assert indexed == tagged > 0
+    assert {"tags_fts_insert", "search_fts_tag_insert"} <= triggers
+
+
+def test_run_bench_reports_every_scenario(tmp_life_dir):
+    path = tmp_life_dir / "bench.db"
+    bench.generate(path, scale=0.001)
+
+    result = bench.run_bench(path, runs=2)
+
+    assert set(result["scenarios"]) == set(bench.SCENARIOS)
+    for stats in result["scenarios"].values():
+        assert stats["p95_ms"] >= stats["p50_ms"] > 0
+        assert stats["peak_kb"] > 0
+
+
+def test_run_bench_rejects_unknown_scenario(tmp_life_dir):
+    with pytest.raises(ValueError, match="unknown scenarios"):
+        bench.run_bench(tmp_life_dir / "bench.db", scenarios=["nope"])
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"scenarios": {"status": {"p50_ms": 10.0, "peak_kb": 100.0}}}
+    current = {"scenarios": {"status": {"p50_ms": 13.0, "peak_kb": 110.0}, "new": {"p50_ms": 1.0}}}
+
+    rows = bench.compare(current, baseline, tolerance=0.25)
+
+    assert rows == [
+        ("status", "p50_ms", 10.0, 13.0, True),
+        ("status", "peak_kb", 100.0, 110.0, False),
+    ]
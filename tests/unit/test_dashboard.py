@@ -5,6 +5,7 @@ from life.dashboard import (
     get_pending_items,
     get_today_breakdown,
     get_today_completed,
+    load_dashboard_snapshot,
 )
 from life.habits import add_habit, toggle_check
 from life.tasks import add_task, toggle_completed
@@ -142,3 +143,76 @@ def test_pending_items_all_returned(tmp_life_dir):
     assert len(items_asc) == 3
     assert len(items_desc) == 3
     assert len(items_asc) == len(items_desc)
+
+
+def test_snapshot_matches_dashboard_readers(tmp_life_dir):
+    done_id = add_task("done today")
+    add_task("pending", focus=True)
+    add_task("later", scheduled_date="2025-11-05")
+    toggle_completed(done_id)
+    habit_id = add_habit("meditate")
+    add_habit("stretch")
+    toggle_check(habit_id)
+
+    snapshot = load_dashboard_snapshot()
+
+    assert [t.id for t in snapshot.pending] == [t.id for t in get_pending_items()]
+    assert {i.id for i in snapshot.completed_today} == {i.id for i in get_today_completed()}
+    breakdown = (
+        snapshot.habits_today,
+        snapshot.tasks_today,
+        snapshot.added_today,
+        snapshot.deleted_today,
+    )
+    assert breakdown == get_today_breakdown()
+    assert {h.content for h in snapshot.habits} == {"meditate", "stretch"}
+
+
+def test_snapshot_query_count_is_constant(tmp_life_dir):
+    def count_queries() -> int:
+        statements: list[str] = []
+        with db.get_db() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                load_dashboard_snapshot()
+            finally:
+                conn.set_trace_callback(None)
+        return sum(1 for s in statements if s.lstrip().upper().startswith("SELECT"))
+
+    add_task("one", tags=["a"])
+    add_habit("one habit", tags=["b"])
+    baseline = count_queries()
+
+    for i in range(20):
+        add_task(f"task {i}", tags=["x"])
+        toggle_check(add_habit(f"habit {i}", tags=["y"]))
+
+    assert count_queries() == baseline
+
+
+def test_day_columns_track_timestamps(tmp_life_dir):
+    task_id = add_task("task")
+    with db.get_db() as conn:
+        conn.execute(
+            "UPDATE tasks SET created = ?, completed_at = ? WHERE id = ?",
+            ("1735732800", "2025-10-30T23:59:59", task_id),
+        )
+        created_day, completed_day = conn.execute(
+            "SELECT created_day, completed_day FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+
+    assert created_day == "2025-01-01"
+    assert completed_day == "2025-10-30"
+
+
+def test_breakdown_filters_use_day_indexes(tmp_life_dir):
+    queries = {
+        "idx_tasks_completed_day": "SELECT id FROM tasks WHERE completed_day = ?",
+        "idx_tasks_created_day": "SELECT COUNT(*) FROM tasks WHERE created_day = ?",
+        "idx_habits_created_day": "SELECT COUNT(*) FROM habits WHERE created_day = ?",
+        "idx_deleted_tasks_day": "SELECT COUNT(*) FROM deleted_tasks WHERE deleted_day = ?",
+    }
+    with db.get_db() as conn:
+        for index, sql in queries.items():
+            plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", ("x",)))
+            assert index in plan, plan
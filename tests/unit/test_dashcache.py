@@ -0,0 +1,79 @@
+import stat
+import sys
+
+from life import config, dash, dashcache
+from life.bench import run_bench
+from life.cli import main
+from life.tasks import add_task
+
+
+def test_cache_key_moves_with_commits_verbose_and_date(tmp_life_dir, fixed_today, monkeypatch):
+    key = dashcache.cache_key(False)
+
+    assert dashcache.cache_key(False) == key
+    assert dashcache.cache_key(True) != key
+    add_task("buy milk")
+    moved = dashcache.cache_key(False)
+    assert moved != key
+    monkeypatch.setattr("life.lib.clock.today", lambda: fixed_today.replace(day=31))
+    assert dashcache.cache_key(False) != moved
+
+
+def test_cache_key_is_none_without_database(tmp_life_dir):
+    assert dashcache.cache_key(False, tmp_life_dir / "missing.db") is None
+
+
+def test_load_returns_output_stored_under_same_key(tmp_life_dir):
+    dashcache.store("k1", "dashboard\n")
+
+    assert dashcache.load("k1") == "dashboard\n"
+    assert dashcache.load("k2") is None
+    mode = (config.LIFE_DIR / "dashboard.cache").stat().st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_cache_key_names_the_database(tmp_life_dir, fixed_today):
+    other = tmp_life_dir / "other.db"
+    other.write_bytes(config.DB_PATH.read_bytes())
+
+    assert dashcache.cache_key(False, other) != dashcache.cache_key(False)
+
+
+def test_main_serves_dashboard_from_cache_until_a_commit(
+    tmp_life_dir, fixed_today, monkeypatch, capsys
+):
+    add_task("buy milk")
+    renders = []
+    real = dash.render
+    monkeypatch.setattr(dash, "render", lambda verbose: (renders.append(verbose), real(verbose))[1])
+    monkeypatch.setattr(sys, "argv", ["life"])
+
+    main()
+    first = capsys.readouterr().out
+    main()
+    assert capsys.readouterr().out == first
+    assert dashcache.lookup([]) == first
+    assert dashcache.lookup(["add", "x"]) is None
+
+    add_task("walk dog")
+    main()
+
+    assert "walk dog" in capsys.readouterr().out
+    assert len(renders) == 2
+
+
+def test_dashboard_command_and_bench_bypass_cache(tmp_life_dir, fixed_today, monkeypatch, capsys):
+    renders = []
+    real = dash.render
+    monkeypatch.setattr(dash, "render", lambda verbose: (renders.append(verbose), real(verbose))[1])
+
+    dash.dashboard(verbose=False)
+    dash.dashboard(verbose=False)
+    assert len(renders) == 2
+    capsys.readouterr()
+
+    run_bench(tmp_life_dir / "bench.db", runs=2, scenarios=["dashboard"])
+
+    # Warm-up, two timed runs and the tracemalloc pass all render.
+    assert len(renders) == 6
+    assert not (tmp_life_dir / "dashboard.cache").exists()
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from life import db
+from life import db, habits, tasks
 from life.db import load_migrations
 from life.models import Habit, Task, TaskMutation
 
@@ -140,7 +140,7 @@ def test_no_phantom_table_references():
         "order",
         "limit",
     }
-    known_virtual = {"_migrations", "sqlite_master"}
+    known_virtual = {"_migrations", "sqlite_master", "json_each"}
 
     src_dir = Path(__file__).parent.parent.parent / "life"
     phantoms = []
@@ -172,3 +172,136 @@ def test_no_phantom_table_references():
     assert not phantoms, "SQL references tables not in schema:\n" + "\n".join(
         f"  {f}: {ctx}" for f, ctx in phantoms
     )
+
+
+def test_get_db_reuses_connection(tmp_life_dir):
+    before = db.connection_stats()["opened"]
+    with db.get_db() as first:
+        pass
+    with db.get_db() as second:
+        pass
+    assert first is second
+    assert db.connection_stats()["opened"] == before
+
+
+def test_get_db_nested_joins_outer_transaction(tmp_life_dir):
+    with pytest.raises(RuntimeError):
+        with db.get_db() as outer:
+            outer.execute("INSERT INTO habits (id, content) VALUES ('h1', 'outer')")
+            with db.get_db() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO habits (id, content) VALUES ('h2', 'inner')")
+            raise RuntimeError
+
+    with db.get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM habits").fetchone()[0] == 0
+
+
+def test_get_db_nested_failure_rolls_back_to_savepoint(tmp_life_dir):
+    with db.get_db() as outer:
+        outer.execute("INSERT INTO habits (id, content) VALUES ('h1', 'outer')")
+        with pytest.raises(sqlite3.IntegrityError), db.get_db() as inner:
+            inner.execute("INSERT INTO habits (id, content) VALUES ('h2', 'inner')")
+            inner.execute("INSERT INTO habits (id, content) VALUES ('h1', 'dupe')")
+
+    with db.get_db() as conn:
+        ids = [r[0] for r in conn.execute("SELECT id FROM habits").fetchall()]
+    assert ids == ["h1"]
+
+
+def test_get_db_nested_system_exit_rolls_back_to_savepoint(tmp_life_dir):
+    with db.get_db() as outer:
+        outer.execute("INSERT INTO habits (id, content) VALUES ('h1', 'outer')")
+        with pytest.raises(SystemExit), db.get_db() as inner:
+            inner.execute("INSERT INTO habits (id, content) VALUES ('h2', 'inner')")
+            raise SystemExit(1)
+
+    with db.get_db() as conn:
+        ids = [r[0] for r in conn.execute("SELECT id FROM habits").fetchall()]
+    assert ids == ["h1"]
+
+
+def _reads_delta(before: dict[str, int]) -> tuple[int, int]:
+    after = db.read_cache_stats()
+    return after["hits"] - before["hits"], after["misses"] - before["misses"]
+
+
+def test_read_scope_memoizes_repeat_reads(tmp_life_dir):
+    tasks.add_task("water plants", tags=["home"])
+    before = db.read_cache_stats()
+    with db.read_scope():
+        first = tasks.get_tasks()
+        first.clear()
+        second = tasks.get_tasks()
+        tasks.get_tasks(include_steward=True)
+    assert [t.content for t in second] == ["water plants"]
+    assert _reads_delta(before) == (1, 2)
+
+
+def test_read_scope_invalidates_on_write(tmp_life_dir):
+    habit_id = habits.add_habit("stretch", tags=["health"])
+    with db.read_scope():
+        assert habits.get_habit(habit_id).checks == []
+        habits.check_habit(habit_id)
+        assert len(habits.get_habit(habit_id).checks) == 1
+        tasks.add_task("new task", tags=["misc"])
+        assert [t.content for t in tasks.get_tasks()] == ["new task"]
+
+
+def test_read_scope_clears_on_rollback(tmp_life_dir):
+    with db.read_scope():
+        with pytest.raises(RuntimeError), db.get_db() as conn:
+            conn.execute("INSERT INTO habits (id, content) VALUES ('h1', 'doomed')")
+            assert len(habits.get_habits()) == 1
+            raise RuntimeError
+        assert habits.get_habits() == []
+
+
+def test_reads_outside_scope_are_not_cached(tmp_life_dir):
+    before = db.read_cache_stats()
+    tasks.get_tasks()
+    tasks.get_tasks()
+    assert _reads_delta(before) == (0, 0)
+
+
+def test_migrations_fingerprint_is_current():
+    assert db.migrations_fingerprint(load_migrations()) == db.MIGRATIONS_FINGERPRINT, (
+        "migration set changed: update MIGRATIONS_FINGERPRINT in life/db.py"
+    )
+
+
+def test_init_stamps_schema_version(tmp_life_dir):
+    with db.get_db() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert version == db.MIGRATIONS_FINGERPRINT
+
+
+def test_init_skips_migration_scan_when_stamped(tmp_life_dir, monkeypatch):
+    def _fail():
+        raise AssertionError("load_migrations should not run on a stamped database")
+
+    monkeypatch.setattr(db, "load_migrations", _fail)
+    db.init()
+
+
+def test_init_rescans_when_stamp_is_stale(tmp_life_dir):
+    with db.get_db() as conn:
+        conn.execute("PRAGMA user_version = 1")
+    db.init()
+    with db.get_db() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert version == db.MIGRATIONS_FINGERPRINT
+
+
+def test_db_restore_refuses_inside_a_transaction(tmp_life_dir, capsys):
+    from life.lib.backup import backup
+
+    backup()
+    tasks.add_task("after the snapshot")
+
+    with pytest.raises(SystemExit), db.get_db() as conn:
+        conn.execute("BEGIN")
+        db.db_restore("latest")
+
+    assert "outside an open transaction" in capsys.readouterr().err
+    assert [t.content for t in tasks.get_tasks()] == ["after the snapshot"]
@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+
+from life import db, export
+from life.habits import add_habit, check_habit
+from life.search import search_all, search_substring
+from life.tasks import add_task, delete_task, get_all_tasks
+
+
+def _dump() -> str:
+    out = io.StringIO()
+    export.export_rows(out, batch_size=2)
+    return out.getvalue()
+
+
+def _seed() -> tuple[str, str]:
+    parent = add_task("plan garden", tags=["home"])
+    add_task("buy seeds", tags=["home", "errand"], parent_id=parent)
+    habit = add_habit("stretching", tags=["health"])
+    check_habit(habit)
+    return parent, habit
+
+
+def test_export_writes_header_then_tables(tmp_life_dir):
+    _seed()
+
+    lines = _dump().splitlines()
+    header = json.loads(lines[0])
+    tables = {json.loads(line)["table"] for line in lines[1:] if line.startswith("{")}
+
+    assert header["format"] == export.FORMAT
+    assert {"tasks", "habits", "tags", "checks"} <= tables
+    assert not any(name.endswith("_fts") or "_fts_" in name for name in tables)
+
+
+def test_round_trip_into_fresh_db(tmp_life_dir, monkeypatch):
+    parent, habit = _seed()
+    dump = _dump()
+    before = sorted((t.id, t.content, t.parent_id, tuple(t.tags)) for t in get_all_tasks())
+
+    fresh = tmp_life_dir / "fresh.db"
+    db.close_all()
+    monkeypatch.setattr("life.config.DB_PATH", fresh)
+    db.init(db_path=fresh)
+
+    counts = export.import_rows(io.StringIO(dump))
+
+    assert counts["tasks"] == 2
+    assert counts["checks"] == 1
+    assert sorted((t.id, t.content, t.parent_id, tuple(t.tags)) for t in get_all_tasks()) == before
+    assert [r.id for r in search_substring("garde")] == [parent]
+    assert [r.id for r in search_all("stretch")] == [habit]
+    with db.get_db() as conn:
+        triggers = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%fts%'"
+        ).fetchone()[0]
+        conn.execute("INSERT INTO tasks_trigram_fts(tasks_trigram_fts) VALUES ('integrity-check')")
+    assert triggers > 0
+
+
+def test_import_refuses_non_empty_tables_without_replace(tmp_life_dir):
+    _seed()
+    dump = _dump()
+    add_task("after export")
+
+    with pytest.raises(ValueError, match="--replace"):
+        export.import_rows(io.StringIO(dump))
+
+    assert len(get_all_tasks()) == 3
+
+
+def test_import_replace_restores_snapshot(tmp_life_dir):
+    parent, _ = _seed()
+    dump = _dump()
+    delete_task(parent)
+    add_task("after export")
+
+    export.import_rows(io.StringIO(dump), replace=True)
+
+    assert {t.content for t in get_all_tasks()} == {"plan garden", "buy seeds"}
+    assert [r.id for r in search_substring("garde")] == [parent]
+    assert search_substring("after exp") == []
+
+
+def test_import_rejects_orphans_and_rolls_back(tmp_life_dir):
+    lines = [
+        json.dumps({"format": export.FORMAT, "version": export.VERSION}),
+        json.dumps({"table": "tags", "columns": ["id", "task_id", "tag"]}),
+        json.dumps([1, "missing-task", "home"]),
+    ]
+
+    with pytest.raises(ValueError, match="missing tasks row"):
+        export.import_rows(lines)
+
+    with db.get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 0
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+@pytest.mark.parametrize(
+    ("lines", "message"),
+    [
+        (['{"format": "csv"}'], "not a life-ndjson stream"),
+        (['{"format": "life-ndjson", "version": 99}'], "unsupported"),
+        (
+            ['{"format": "life-ndjson", "version": 1}', '{"table": "nope", "columns": []}'],
+            "unknown table",
+        ),
+        (
+            ['{"format": "life-ndjson", "version": 1}', '{"table": "tasks", "columns": ["bogus"]}'],
+            "no column",
+        ),
+    ],
+)
+def test_import_rejects_bad_streams(tmp_life_dir, lines, message):
+    with pytest.raises(ValueError, match=message):
+        export.import_rows(lines)
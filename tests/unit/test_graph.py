@@ -0,0 +1,131 @@
+import pytest
+
+from life import db, graph, health
+from life.tasks import (
+    add_task,
+    check_task,
+    get_mutations,
+    get_task,
+    set_blocked_by,
+    uncheck_task,
+    update_task,
+)
+
+
+def _ids(tasks) -> list[str]:
+    return [t.id for t in tasks]
+
+
+def _tree() -> tuple[str, str, str, str]:
+    root = add_task("plan trip")
+    flights = add_task("book flights", parent_id=root)
+    hotel = add_task("book hotel", parent_id=root)
+    deposit = add_task("pay deposit")
+    update_task(deposit, parent_id=hotel)
+    return root, flights, hotel, deposit
+
+
+def test_subtree_walks_every_level(tmp_life_dir):
+    root, flights, hotel, deposit = _tree()
+    add_task("unrelated")
+
+    tasks = graph.subtree(root)
+
+    assert tasks[0].id == root
+    assert set(_ids(tasks[1:])) == {flights, hotel, deposit}
+    assert _ids(graph.subtree(hotel)) == [hotel, deposit]
+
+
+def test_blockers_follow_chain_nearest_first(tmp_life_dir):
+    a, b, c = add_task("a"), add_task("b"), add_task("c")
+    set_blocked_by(a, b)
+    set_blocked_by(b, c)
+
+    assert _ids(graph.blockers(a)) == [b, c]
+    assert graph.blockers(c) == []
+
+
+def test_set_blocked_by_refuses_cycles(tmp_life_dir):
+    a, b, c = add_task("a"), add_task("b"), add_task("c")
+    set_blocked_by(a, b)
+    set_blocked_by(b, c)
+
+    assert graph.would_cycle(c, a)
+    assert not graph.would_cycle(a, c)
+    with pytest.raises(ValueError, match="block itself"):
+        set_blocked_by(c, a)
+    assert get_task(c).blocked_by is None
+
+
+def test_find_cycles_reports_loops_and_walks_terminate(tmp_life_dir):
+    a, b, c, tail = add_task("a"), add_task("b"), add_task("c"), add_task("tail")
+    with db.get_db() as conn:
+        conn.execute("UPDATE tasks SET blocked_by = ? WHERE id = ?", (b, a))
+        conn.execute("UPDATE tasks SET blocked_by = ? WHERE id = ?", (c, b))
+        conn.execute("UPDATE tasks SET blocked_by = ? WHERE id = ?", (a, c))
+        conn.execute("UPDATE tasks SET blocked_by = ? WHERE id = ?", (a, tail))
+        conn.execute("UPDATE tasks SET parent_id = ? WHERE id = ?", (b, a))
+        conn.execute("UPDATE tasks SET parent_id = ? WHERE id = ?", (a, b))
+
+    cycles = graph.find_cycles()
+    assert len(cycles) == 1
+    assert sorted(cycles[0]) == sorted([a, b, c])
+    assert sorted(map(sorted, graph.find_cycles("parent_id"))) == [sorted([a, b])]
+    assert set(_ids(graph.blockers(tail))) == {a, b, c}
+    assert set(_ids(graph.subtree(a))) == {a, b}
+    assert "task cycles: 2" in health.score()["detail"]
+
+
+def test_find_cycles_rejects_unknown_edge(tmp_life_dir):
+    with pytest.raises(ValueError, match="edge must be one of"):
+        graph.find_cycles("content")
+
+
+def test_unblocked_leaves(tmp_life_dir):
+    _, flights, hotel, deposit = _tree()
+    blocked = add_task("pack bags")
+    set_blocked_by(blocked, flights)
+
+    assert set(_ids(graph.unblocked_leaves())) == {flights, deposit}
+    assert _ids(graph.unblocked_leaves(root_id=hotel)) == [deposit]
+
+    check_task(flights)
+    assert set(_ids(graph.unblocked_leaves())) == {deposit, blocked}
+
+
+def test_check_task_cascades_up_every_level(tmp_life_dir):
+    root, flights, hotel, deposit = _tree()
+    check_task(flights)
+
+    task, parent = check_task(deposit)
+
+    assert task.completed_at is not None
+    assert parent.id == hotel
+    assert get_task(root).completed_at == task.completed_at
+    assert [m.field for m in get_mutations(root)] == ["completed_at"]
+
+
+def test_check_task_leaves_parent_open_while_siblings_pending(tmp_life_dir):
+    root, flights, _, _ = _tree()
+    dependant = add_task("pack bags")
+    set_blocked_by(dependant, flights)
+
+    _, parent = check_task(flights)
+
+    assert parent is None
+    assert get_task(root).completed_at is None
+    assert get_task(dependant).blocked_by is None
+
+
+def test_uncheck_task_reopens_completed_ancestors(tmp_life_dir):
+    root, flights, hotel, deposit = _tree()
+    check_task(flights)
+    check_task(deposit)
+
+    uncheck_task(deposit)
+
+    assert [get_task(i).completed_at for i in (deposit, hotel, root)] == [None, None, None]
+    assert get_task(flights).completed_at is not None
+    mutations = get_mutations(root)
+    (completed,) = {m.new_value for m in mutations if m.new_value}
+    assert {(m.old_value, m.new_value) for m in mutations} == {(None, completed), (completed, None)}
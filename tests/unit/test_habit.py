@@ -1,7 +1,14 @@
+from datetime import date
+
+from life import db
 from life.habits import (
     add_habit,
+    find_habit,
     get_checks,
     get_habits,
+    get_streak,
+    get_streaks,
+    iter_checks,
     toggle_check,
 )
 
@@ -43,3 +50,76 @@ def test_check_to_completion(tmp_life_dir):
     habits = get_habits()
     assert len(habits) == 1
     assert habits[0].id == iid
+
+
+def _insert_check(habit_id: str, day: str) -> None:
+    with db.get_db() as conn:
+        conn.execute(
+            "INSERT INTO checks (habit_id, check_date, completed_at) VALUES (?, ?, ?)",
+            (habit_id, day, f"{day}T09:00:00"),
+        )
+
+
+def test_get_habits_since_limits_checks(tmp_life_dir):
+    habit_id = add_habit("read")
+    for day in ("2024-01-01", "2025-10-20", "2025-10-29"):
+        _insert_check(habit_id, day)
+
+    full = get_habits()[0]
+    recent = get_habits(since=date(2025, 10, 24))[0]
+
+    assert len(full.checks) == 3
+    assert [c.date() for c in recent.checks] == [date(2025, 10, 29)]
+
+
+def test_iter_checks_streams_in_date_order(tmp_life_dir):
+    read, run = add_habit("read"), add_habit("run")
+    for habit_id, day in ((read, "2025-10-29"), (run, "2025-10-01"), (read, "2025-10-20")):
+        _insert_check(habit_id, day)
+
+    every = list(iter_checks(batch_size=1))
+    recent = list(iter_checks(read, since=date(2025, 10, 24)))
+
+    assert [(c.habit_id, c.check_date) for c in every] == [
+        (run, date(2025, 10, 1)),
+        (read, date(2025, 10, 20)),
+        (read, date(2025, 10, 29)),
+    ]
+    assert [c.check_date for c in recent] == [date(2025, 10, 29)]
+
+
+def test_get_habits_by_ids_preserves_order(tmp_life_dir):
+    first = add_habit("first")
+    second = add_habit("second")
+
+    habits = get_habits([second, "missing", first])
+
+    assert [h.id for h in habits] == [second, first]
+
+
+def test_get_streaks_current_longest_and_last(tmp_life_dir, fixed_today):
+    steady = add_habit("steady")
+    lapsed = add_habit("lapsed")
+    for day in ("2025-10-20", "2025-10-21", "2025-10-22", "2025-10-28", "2025-10-29", "2025-10-30"):
+        _insert_check(steady, day)
+    for day in ("2025-10-01", "2025-10-02", "2025-10-29"):
+        _insert_check(lapsed, day)
+
+    streaks = get_streaks()
+
+    assert streaks[steady].current == 3
+    assert streaks[steady].longest == 3
+    assert streaks[steady].last_check == date(2025, 10, 30)
+    assert streaks[lapsed].current == 0
+    assert streaks[lapsed].longest == 2
+    assert get_streak(steady) == 3
+    assert get_streaks([lapsed]).keys() == {lapsed}
+    assert get_streaks([]) == {}
+
+
+def test_find_habit_folds_non_ascii_case_like_python(tmp_life_dir):
+    upper = add_habit("ÉTIREMENTS matin")
+    add_habit("étirements matin et soir")
+
+    assert find_habit("étirements matin").id == upper
+    assert find_habit("ÉTIREMENTS MATIN ET").content == "étirements matin et soir"
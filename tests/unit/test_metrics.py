@@ -0,0 +1,78 @@
+import random
+from datetime import timedelta
+from statistics import median
+
+import pytest
+
+from life import db
+from life.metrics import DISCOMFORT_TAGS, build_feedback_snapshot
+from life.tasks import get_all_tasks, get_tasks
+
+
+def _reference(today, window_days=7):
+    """The in-Python loop build_feedback_snapshot() replaced: (counts, median, max age)."""
+    start = today - timedelta(days=window_days - 1)
+
+    def in_window(ts):
+        return ts is not None and start <= ts.date() <= today
+
+    everything, pending = get_all_tasks(), get_tasks()
+    admin = [t for t in everything if set(t.tags).intersection(DISCOMFORT_TAGS)]
+    janice = [t for t in everything if "janice" in t.tags]
+    ages = [
+        (today - t.created.date()).days
+        for t in pending
+        if set(t.tags).intersection(DISCOMFORT_TAGS)
+    ]
+    counts = (
+        sum(in_window(t.completed_at) for t in admin),
+        sum(in_window(t.created) for t in admin),
+        sum(in_window(t.completed_at) for t in janice),
+        sum(in_window(t.created) for t in janice),
+    )
+    return counts, int(median(ages)) if ages else 0, max(ages, default=None)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_snapshot_matches_python_reference(tmp_life_dir, fixed_today, seed):
+    rng = random.Random(seed)  # noqa: S311
+    with db.get_db() as conn:
+        for i in range(120 + seed):
+            created = fixed_today - timedelta(days=rng.randint(0, 20), hours=rng.randint(0, 20))
+            completed = None
+            if rng.random() < 0.5:
+                completed = (created + timedelta(days=rng.randint(0, 10))).isoformat()
+            conn.execute(
+                "INSERT INTO tasks (id, content, created, completed_at, steward) VALUES (?, ?, ?, ?, ?)",
+                (f"t{i}", f"task {i}", created.isoformat(), completed, int(rng.random() < 0.1)),
+            )
+            for tag in rng.sample(["finance", "legal", "janice", "home", "health"], 2):
+                conn.execute("INSERT INTO tags (task_id, tag) VALUES (?, ?)", (f"t{i}", tag))
+
+    snapshot = build_feedback_snapshot(today=fixed_today)
+    counts, half_life, oldest = _reference(fixed_today)
+
+    assert (
+        snapshot.admin_closed,
+        snapshot.admin_created,
+        snapshot.janice_done,
+        snapshot.janice_created,
+    ) == counts
+    assert snapshot.avoidance_half_life_days == half_life
+    assert ("stuck_task_protocol" in snapshot.flags) == (oldest is not None and oldest >= 3)
+
+
+def test_half_life_truncates_even_median(tmp_life_dir, fixed_today):
+    with db.get_db() as conn:
+        for i, age in enumerate([1, 4]):
+            created = fixed_today - timedelta(days=age)
+            conn.execute(
+                "INSERT INTO tasks (id, content, created) VALUES (?, ?, ?)",
+                (f"t{i}", f"task {i}", f"{created.isoformat()}T10:00:00"),
+            )
+            conn.execute("INSERT INTO tags (task_id, tag) VALUES (?, 'legal')", (f"t{i}",))
+
+    snapshot = build_feedback_snapshot(today=fixed_today)
+
+    assert snapshot.avoidance_half_life_days == 2
+    assert snapshot.flags == ["stuck_task_protocol", "admin_closure_risk"]
@@ -1,7 +1,10 @@
-from datetime import datetime, time, timedelta
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
 
 from life import db
-from life.momentum import weekly_momentum
+from life.momentum import momentum, weekly_momentum
 
 
 def test_rolling_7day_window(tmp_life_dir, fixed_today):
@@ -77,3 +80,70 @@ def test_count_one_per_day(tmp_life_dir, fixed_today):
 
     this_week = momentum_data["this_week"]
     assert this_week.habits_total == 7
+
+
+def _reference_bucket(conn, start, end):
+    """The per-week algorithm momentum() replaced, with half-open completion ranges."""
+    stop = (end + timedelta(days=1)).isoformat()
+    done = conn.execute(
+        "SELECT COUNT(*) FROM tasks WHERE completed_at >= ? AND completed_at < ?",
+        (start.isoformat(), stop),
+    ).fetchone()[0]
+    checks = conn.execute(
+        "SELECT COUNT(*) FROM checks WHERE check_date >= ? AND check_date < ?",
+        (start.isoformat(), stop),
+    ).fetchone()[0]
+    total = conn.execute("SELECT COUNT(*) FROM tasks WHERE created < ?", (stop,)).fetchone()[0]
+    possible = 0
+    for (created,) in conn.execute("SELECT created FROM habits"):
+        created_day = date.fromisoformat(created[:10])
+        if created_day <= end:
+            possible += (end - max(created_day, start)).days + 1
+    return (done, total, checks, possible)
+
+
+@pytest.mark.parametrize("bucket", ["day", "week", "month"])
+def test_momentum_matches_per_bucket_reference(tmp_life_dir, fixed_today, bucket):
+    rng = random.Random(7)  # noqa: S311
+    with db.get_db() as conn:
+        for i in range(30):
+            created = fixed_today - timedelta(days=rng.randint(0, 120))
+            conn.execute(
+                "INSERT INTO habits (id, content, created) VALUES (?, ?, ?)",
+                (f"h{i}", f"habit {i}", f"{created.isoformat()}T08:00:00"),
+            )
+            for _ in range(20):
+                day = created + timedelta(days=rng.randint(0, 120))
+                if day <= fixed_today:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO checks (habit_id, check_date, completed_at) VALUES (?, ?, ?)",
+                        (f"h{i}", day.isoformat(), f"{day.isoformat()}T09:00:00"),
+                    )
+        for i in range(200):
+            created = fixed_today - timedelta(days=rng.randint(0, 150))
+            completed = created + timedelta(days=rng.randint(0, 30))
+            conn.execute(
+                "INSERT INTO tasks (id, content, created, completed_at) VALUES (?, ?, ?, ?)",
+                (
+                    f"t{i}",
+                    f"task {i}",
+                    created.isoformat(),
+                    f"{completed.isoformat()}T17:30:00" if completed <= fixed_today else None,
+                ),
+            )
+
+    start = fixed_today - timedelta(days=90)
+    buckets = momentum(start, fixed_today, bucket)
+
+    assert buckets[0].start == start
+    assert buckets[-1].end == fixed_today
+    with db.get_db() as conn:
+        for b in buckets:
+            expected = _reference_bucket(conn, b.start, b.end)
+            actual = (b.tasks_completed, b.tasks_total, b.habits_completed, b.habits_total)
+            assert actual == expected, (b.start, b.end)
+
+
+def test_momentum_rejects_unknown_bucket(tmp_life_dir):
+    with pytest.raises(ValueError):
+        momentum(date(2025, 1, 1), date(2025, 2, 1), "fortnight")
@@ -0,0 +1,281 @@
+"""EXPLAIN QUERY PLAN regression suite.
+
+Every statement the domain modules issue is captured with a trace callback, normalized
+(literals -> ?), and explained against the migrated, seeded database. query_plans.json
+records, per module, whether each statement is expected to use an index or may scan.
+A statement expected to use an index that reports SCAN fails the suite, as does a
+statement missing from the manifest or a manifest entry no longer issued.
+
+After an intentional query change, regenerate and review the diff:
+
+    LIFE_UPDATE_QUERY_PLANS=1 pytest tests/unit/test_query_plans.py
+"""
+
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Callable
+from datetime import date
+from pathlib import Path
+
+from life import dashboard, db, graph, habits, metrics, momentum, search, tags, tasks
+from life import steward as steward_module
+from life.comms import digest, proposals, senders
+
+MANIFEST = Path(__file__).with_name("query_plans.json")
+
+_EXPLAINED = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_IN_LIST = re.compile(r"\bIN \(\?(?:\s*,\s*\?)*\)", re.IGNORECASE)
+_SCAN = re.compile(r"^SCAN (\S+)")
+_SUBQUERY = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (\S+)")
+# FTS5 reads its shadow tables with schema-qualified statements; domain SQL never does.
+_INTERNAL = re.compile(r"'main'\.")
+
+
+def normalize(sql: str) -> str:
+    """Statement shape: literals collapse to ?, IN lists to (...), whitespace to one space."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return " ".join(sql.split())
+
+
+def scanned_tables(plan: list[str]) -> list[str]:
+    """Tables (or aliases) read by a full scan; CTEs, subqueries and virtual tables excluded."""
+    derived = {m.group(1) for line in plan if (m := _SUBQUERY.match(line))}
+    scans = []
+    for line in plan:
+        m = _SCAN.match(line)
+        if not m or "VIRTUAL TABLE" in line or line == "SCAN CONSTANT ROW":
+            continue
+        name = m.group(1)
+        if name in derived or name.startswith("("):
+            continue
+        scans.append(name)
+    return scans
+
+
+def _seed() -> dict[str, str]:
+    parent = tasks.add_task("plan the garden", tags=["home"], focus=True)
+    child = tasks.add_task("buy seeds", tags=["home"], parent_id=parent)
+    blocker = tasks.add_task("call the bank", tags=["finance"], scheduled_date="2025-11-02")
+    done = tasks.add_task("file taxes", tags=["finance"])
+    tasks.toggle_completed(done)
+    tasks.set_blocked_by(child, blocker)
+    tasks.defer_task(blocker, "overdue_reset")
+    tasks.delete_task(tasks.add_task("throwaway", tags=["misc"]))
+
+    habit = habits.add_habit("meditate", tags=["health"])
+    habits.add_habit("stretch", tags=["health"], parent_id=habit)
+    habits.toggle_check(habit)
+
+    steward_module.add_observation("slept badly before the bank call", tag="sleep")
+    steward_module.add_session("weekly review")
+
+    senders.record_received("alice@example.com")
+    senders.record_action("alice@example.com", "reply", response_hours=2.0)
+    proposal_id, _, _ = proposals.create_proposal(
+        "thread", "t1", "archive", agent_reasoning="newsletter", skip_validation=True
+    )
+    return {"parent": parent, "child": child, "done": done, "habit": habit, "proposal": proposal_id}
+
+
+def _tasks_scenario(ids: dict[str, str]) -> None:
+    tasks.get_task(ids["parent"])
+    tasks.get_tasks()
+    tasks.get_all_tasks()
+    tasks.get_subtasks(ids["parent"])
+    tasks.get_focus()
+    tasks.get_mutations(ids["parent"])
+    tasks.count_overdue_resets("2025-10-24", "2025-10-30")
+    tasks.find_task("garden")
+    tasks.find_task(ids["parent"][:8])
+    tasks.find_task_exact("buy seeds")
+    tasks.find_task_any("file taxes")
+    tasks.last_completion()
+    tasks.completed_among([ids["done"], ids["parent"]])
+    list(tasks.iter_tasks(pending_only=True))
+    tasks.toggle_focus(ids["child"])
+
+
+def _graph_scenario(ids: dict[str, str]) -> None:
+    graph.subtree(ids["parent"])
+    graph.blockers(ids["child"])
+    graph.would_cycle(ids["parent"], ids["child"])
+    graph.unblocked_leaves()
+    graph.unblocked_leaves(root_id=ids["parent"])
+    graph.find_cycles()
+    graph.find_cycles("parent_id")
+    tasks.check_task(ids["child"])
+    tasks.uncheck_task(ids["child"])
+
+
+def _habits_scenario(ids: dict[str, str]) -> None:
+    habits.get_habit(ids["habit"])
+    habits.get_habits()
+    habits.get_checks(ids["habit"])
+    list(habits.iter_checks(ids["habit"], since=date(2025, 10, 1)))
+    habits.get_streaks()
+    habits.get_subhabits(ids["habit"])
+    habits.get_archived_habits()
+    habits.find_habit("medit")
+    habits.toggle_check(ids["habit"])
+    habits.toggle_check(ids["habit"])
+
+
+def _tags_scenario(ids: dict[str, str]) -> None:
+    tags.get_tags_for_task(ids["parent"])
+    tags.get_tags_for_habit(ids["habit"])
+    tags.get_tasks_by_tag("home")
+    tags.get_habits_by_tag("health")
+    tags.list_all_tags()
+    tags.add_tag(ids["child"], None, "garden")
+    tags.remove_tag(ids["child"], None, "garden")
+
+
+def _dashboard_scenario(ids: dict[str, str]) -> None:
+    dashboard.load_dashboard_snapshot()
+    dashboard.get_today_completed()
+    dashboard.get_today_breakdown()
+    dashboard.get_pending_items()
+    metrics.build_feedback_snapshot(today=date(2025, 10, 30))
+
+
+def _momentum_scenario(ids: dict[str, str]) -> None:
+    momentum.weekly_momentum()
+    for bucket in momentum.BUCKETS:
+        momentum.momentum(date(2025, 8, 1), date(2025, 10, 30), bucket)
+
+
+def _search_scenario(ids: dict[str, str]) -> None:
+    search.search_all("garden")
+    search.search_index("bank", offset=1)
+    search.search_substring("eed")
+    search.search_fuzzy("gardn")
+    search.search_by_tag("home")
+    search.search_bodies("bank", ["observations", "patterns", "improvements"])
+
+
+def _comms_scenario(ids: dict[str, str]) -> None:
+    senders.get_sender_stat("alice@example.com")
+    senders.get_top_senders()
+    proposals.get_proposal(ids["proposal"])
+    proposals.list_proposals()
+    proposals.list_proposals(status="pending")
+    proposals.get_approved_proposals()
+    digest.get_digest(7)
+
+
+def _steward_scenario(ids: dict[str, str]) -> None:
+    steward_module.get_observations()
+    steward_module.get_observations(tag="sleep")
+    steward_module.get_sessions()
+    steward_module.find_observation("bank")
+
+
+SCENARIOS: dict[str, Callable[[dict[str, str]], None]] = {
+    "tasks": _tasks_scenario,
+    "graph": _graph_scenario,
+    "habits": _habits_scenario,
+    "tags": _tags_scenario,
+    "dashboard": _dashboard_scenario,
+    "momentum": _momentum_scenario,
+    "search": _search_scenario,
+    "comms": _comms_scenario,
+    "steward": _steward_scenario,
+}
+
+
+def _capture(ids: dict[str, str], monkeypatch) -> dict[str, dict[str, str]]:
+    """module -> normalized statement -> one concrete statement to explain."""
+    captured: dict[str, dict[str, str]] = {}
+    statements: list[str] = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        # life.comms opens a connection per call rather than using the pool.
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", traced_connect)
+    with db.get_db() as conn:
+        for module, scenario in SCENARIOS.items():
+            statements.clear()
+            conn.set_trace_callback(statements.append)
+            try:
+                scenario(ids)
+            finally:
+                conn.set_trace_callback(None)
+            shapes = captured.setdefault(module, {})
+            for sql in statements:
+                stripped = sql.lstrip()
+                if stripped.startswith("--") or _INTERNAL.search(stripped):
+                    continue
+                if not stripped.upper().startswith(_EXPLAINED):
+                    continue
+                shapes.setdefault(normalize(stripped), stripped)
+    return captured
+
+
+def _observed_plans(monkeypatch) -> dict[str, dict[str, list[str]]]:
+    captured = _capture(_seed(), monkeypatch)
+    plans: dict[str, dict[str, list[str]]] = {}
+    with db.get_db() as conn:
+        for module, shapes in captured.items():
+            for shape, sql in shapes.items():
+                plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+                if plan:
+                    plans.setdefault(module, {})[shape] = plan
+    return plans
+
+
+def test_normalize_collapses_literals():
+    assert normalize("SELECT * FROM t WHERE a = 'x''y' AND b IN (1, 2.5, -3)\n  LIMIT 20") == (
+        "SELECT * FROM t WHERE a = ? AND b IN (...) LIMIT ?"
+    )
+    assert normalize("SELECT substr(created_day, 1, 10) FROM h1") == (
+        "SELECT substr(created_day, ?, ?) FROM h1"
+    )
+
+
+def test_scanned_tables_ignores_ctes_and_virtual_tables():
+    plan = [
+        "CO-ROUTINE hits",
+        "SCAN search_fts VIRTUAL TABLE INDEX 0:M5",
+        "SCAN hits",
+        "SCAN json_each VIRTUAL TABLE INDEX 1:",
+        "SCAN CONSTANT ROW",
+        "SEARCH t USING INDEX sqlite_autoindex_tasks_1 (id=?)",
+        "SCAN h",
+    ]
+    assert scanned_tables(plan) == ["h"]
+
+
+def test_query_plans_match_manifest(tmp_life_dir, fixed_today, monkeypatch):
+    plans = _observed_plans(monkeypatch)
+    observed = {
+        module: {
+            shape: "scan" if scanned_tables(plan) else "index" for shape, plan in shapes.items()
+        }
+        for module, shapes in plans.items()
+    }
+
+    if os.environ.get("LIFE_UPDATE_QUERY_PLANS"):
+        MANIFEST.write_text(json.dumps(observed, indent=2, sort_keys=True) + "\n")
+
+    manifest: dict[str, dict[str, str]] = json.loads(MANIFEST.read_text())
+    failures = []
+    for module in sorted(set(observed) | set(manifest)):
+        seen, expected = observed.get(module, {}), manifest.get(module, {})
+        failures += [f"[{module}] not in manifest: {s}" for s in sorted(set(seen) - set(expected))]
+        failures += [f"[{module}] no longer issued: {s}" for s in sorted(set(expected) - set(seen))]
+        for shape in sorted(set(seen) & set(expected)):
+            if expected[shape] == "index" and seen[shape] == "scan":
+                plan = "; ".join(plans[module][shape])
+                failures.append(f"[{module}] expected index, got SCAN: {shape}\n    {plan}")
+
+    assert not failures, "\n".join(failures)
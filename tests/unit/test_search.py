@@ -0,0 +1,124 @@
+from life import db
+from life.habits import add_habit
+from life.search import search_all, search_bodies, search_index, search_substring
+from life.steward import add_observation
+from life.tasks import add_task, delete_task, find_task, update_task
+
+
+def test_find_task_partial_word_uses_trigram_index(tmp_life_dir):
+    task_id = add_task("book dentist appointment")
+    add_task("water plants")
+
+    assert find_task("dent").id == task_id
+    assert find_task("ist app").id == task_id
+
+
+def test_trigram_index_follows_updates_and_deletes(tmp_life_dir):
+    task_id = add_task("renew passport")
+    update_task(task_id, content="renew licence")
+
+    assert [r.id for r in search_substring("licen")] == [task_id]
+    assert search_substring("passp") == []
+
+    delete_task(task_id)
+    assert search_substring("licen") == []
+
+
+def test_search_all_finds_partial_words(tmp_life_dir):
+    task_id = add_task("call plumber")
+    habit_id = add_habit("stretching")
+
+    assert [r.id for r in search_all("plumb")] == [task_id]
+    assert [r.id for r in search_all("stretch")] == [habit_id]
+
+
+def test_search_substring_ignores_fts_syntax(tmp_life_dir):
+    task_id = add_task('fix "quoted" OR thing')
+
+    assert [r.id for r in search_substring('"quoted" OR')] == [task_id]
+
+
+def test_trigram_tables_are_consistent(tmp_life_dir):
+    add_task("one")
+    add_habit("two")
+    with db.get_db() as conn:
+        conn.execute("INSERT INTO tasks_trigram_fts(tasks_trigram_fts) VALUES ('integrity-check')")
+        conn.execute(
+            "INSERT INTO habits_trigram_fts(habits_trigram_fts) VALUES ('integrity-check')"
+        )
+
+
+def test_search_index_ranks_across_kinds_with_tags(tmp_life_dir):
+    task_id = add_task("garden tidy", tags=["outdoors"], description="rake the garden leaves")
+    habit_id = add_habit("garden walk")
+    add_observation("garden makes them calm")
+
+    results = search_index("garden")
+
+    assert {r.type for r in results} == {"task", "habit", "observation"}
+    assert results[0].score == 1.0
+    assert all(0 < r.score <= 1.0 for r in results)
+    task_hit = next(r for r in results if r.id == task_id)
+    assert task_hit.tags == ["outdoors"]
+    assert task_hit.task.tags == ["outdoors"]
+    assert "[garden]" in task_hit.snippet
+    assert any(r.id == habit_id for r in results)
+
+
+def test_search_index_matches_tags_and_pages(tmp_life_dir):
+    ids = [add_task(f"errand {i}", tags=["town"]) for i in range(5)]
+
+    first = search_index("town", limit=2)
+    rest = search_index("town", limit=10, offset=2)
+
+    assert len(first) == 2
+    assert {r.id for r in first + rest} == set(ids)
+    assert search_index("tow")[0].type == "task"
+
+
+def test_search_index_follows_tag_removal(tmp_life_dir):
+    task_id = add_task("pay rent", tags=["finance"])
+    with db.get_db() as conn:
+        conn.execute("DELETE FROM tags WHERE task_id = ?", (task_id,))
+
+    assert search_index("finance") == []
+
+
+def test_mark_improvement_done_resolves_through_index(tmp_life_dir):
+    from life.improvements import add_improvement, get_improvements, mark_improvement_done
+
+    other_id = add_improvement("cache the dashboard render")
+    target_id = add_improvement("batch habit check loading")
+
+    done = mark_improvement_done("habit che")
+
+    assert done.id == target_id
+    assert [i.id for i in get_improvements()] == [other_id]
+    completed = {i.id: i for i in get_improvements(done=True)}
+    assert completed.keys() == {other_id, target_id}
+    assert completed[target_id].done_at is not None
+    assert completed[other_id].done_at is None
+    assert completed[other_id].body == "cache the dashboard render"
+    assert mark_improvement_done("habit che") is None
+
+
+def test_find_observation_prefers_latest_match(tmp_life_dir):
+    from life.steward import find_observation
+
+    add_observation("sleeps badly after late coffee")
+    latest = add_observation("coffee after 3pm again")
+
+    assert find_observation("coffee").id == latest
+    assert find_observation("xyz-nothing") is None
+
+
+def test_search_bodies_covers_signal_messages(tmp_life_dir):
+    with db.get_db() as conn:
+        conn.execute(
+            "INSERT INTO signal_messages (id, account_phone, sender_phone, body, timestamp, received_at) VALUES ('m1', '+1', '+2', 'dinner on friday?', 0, '2025-10-30')"
+        )
+
+    results = search_bodies("dinner", ["signal", "patterns"])
+
+    assert [(r.type, r.id) for r in results] == [("signal", "m1")]
+    assert results[0].score == 1.0
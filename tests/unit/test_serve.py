@@ -0,0 +1,91 @@
+import io
+import signal
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from life import config, db
+from life.client import forward
+
+ROOT = Path(__file__).parent.parent.parent
+
+_SERVER = """
+import sys
+from pathlib import Path
+from life import config, db
+from life.serve import serve_forever
+config.DB_PATH = Path(sys.argv[1])
+db.init()
+serve_forever(Path(sys.argv[2]))
+"""
+
+
+@pytest.fixture
+def server(tmp_life_dir):
+    path = tmp_life_dir / "serve.sock"
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _SERVER, str(config.DB_PATH), str(path)], cwd=ROOT
+    )
+    deadline = time.monotonic() + 10
+    while not path.exists():
+        assert proc.poll() is None, "server exited on start-up"
+        assert time.monotonic() < deadline, "server never bound its socket"
+        time.sleep(0.02)
+    yield path, proc
+    if proc.poll() is None:
+        proc.kill()
+        proc.wait()
+
+
+def _tasks() -> list[str]:
+    with db.get_db() as conn:
+        return [r[0] for r in conn.execute("SELECT content FROM tasks ORDER BY rowid")]
+
+
+def test_forward_returns_none_without_server(tmp_life_dir):
+    assert forward(["add", "x"], tmp_life_dir / "missing.sock") is None
+
+
+def test_forward_runs_commands_on_server(server, capsys):
+    path, _ = server
+
+    assert forward(["add", "buy milk"], path) == 0
+    assert "buy milk" in capsys.readouterr().out
+    assert forward(["done", "nosuchthing"], path) == 1
+    assert "nosuchthing" in capsys.readouterr().err
+    assert _tasks() == ["buy milk"]
+
+
+def test_forward_relays_stdin_on_demand(server, capsys, monkeypatch):
+    path, _ = server
+    monkeypatch.setattr("sys.stdin", io.StringIO("add one\nadd two\n"))
+
+    assert forward(["batch"], path) == 0
+
+    assert "2 committed" in capsys.readouterr().out
+    assert _tasks() == ["one", "two"]
+
+
+def test_server_drops_cached_reads_after_external_commit(server, capsys):
+    path, _ = server
+
+    assert forward(["habits"], path) == 0
+    assert "stretching" not in capsys.readouterr().out
+    with sqlite3.connect(config.DB_PATH) as conn:
+        conn.execute("INSERT INTO habits (id, content) VALUES ('ext', 'stretching')")
+    assert forward(["habits"], path) == 0
+
+    assert "stretching" in capsys.readouterr().out
+
+
+def test_server_stops_on_sigterm_and_removes_socket(server):
+    path, proc = server
+
+    proc.send_signal(signal.SIGTERM)
+
+    assert proc.wait(timeout=10) == 0
+    assert not path.exists()
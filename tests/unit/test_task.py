@@ -1,9 +1,16 @@
+import pytest
+
+from life import db
 from life.tasks import (
     add_task,
     delete_task,
+    find_task,
+    find_task_any,
+    find_task_exact,
     get_focus,
     get_task,
     get_tasks,
+    iter_tasks,
     toggle_completed,
     update_task,
 )
@@ -36,6 +43,33 @@ def test_add_task_with_tags(tmp_life_dir):
     assert "work" in task.tags
 
 
+def test_bulk_reads_attach_sorted_shared_tags(tmp_life_dir):
+    first = add_task("first", tags=["work", "admin"], scheduled_date="2025-12-31")
+    add_task("second", tags=["work"], scheduled_date="2025-12-31")
+
+    tasks = {t.content: t for t in get_tasks()}
+
+    assert get_task(first).tags == ["admin", "work"]
+    assert tasks["first"].tags == ["admin", "work"]
+    assert tasks["first"].tags[1] is tasks["second"].tags[0]
+    assert tasks["first"].scheduled_date is tasks["second"].scheduled_date
+    assert not hasattr(tasks["first"], "__dict__")
+
+
+def test_iter_tasks_streams_in_batches(tmp_life_dir):
+    ids = [add_task(f"task {i}", tags=["work"]) for i in range(5)]
+    toggle_completed(ids[1])
+    with db.get_db() as conn:
+        conn.execute("UPDATE tasks SET steward = 1 WHERE id = ?", (ids[2],))
+
+    streamed = list(iter_tasks(batch_size=2))
+    pending = list(iter_tasks(pending_only=True, include_steward=True, batch_size=2))
+
+    assert [t.id for t in streamed] == [ids[0], ids[1], ids[3], ids[4]]
+    assert all(t.tags == ["work"] for t in streamed)
+    assert [t.id for t in pending] == [ids[0], ids[2], ids[3], ids[4]]
+
+
 def test_pending_tasks_sort_order(tmp_life_dir):
     add_task("task 1")
     add_task("task 2")
@@ -105,3 +139,43 @@ def test_focus_priority_over_due(tmp_life_dir):
     add_task("focused later", focus=True, scheduled_date="2025-12-31")
     tasks = get_tasks()
     assert tasks[0].focus is True
+
+
+def test_find_task_by_uuid_prefix_substring_and_fuzzy(tmp_life_dir):
+    task_id = add_task("book dentist appointment")
+    add_task("water plants")
+
+    assert find_task(task_id[:6]).id == task_id
+    assert find_task(task_id).id == task_id
+    assert find_task("DENTIST").id == task_id
+    assert find_task("book dentist appointmnt").id == task_id
+    assert find_task_exact("book dentist appointmnt") is None
+
+
+def test_find_task_scope_excludes_old_completions(tmp_life_dir):
+    task_id = add_task("file taxes")
+    with db.get_db() as conn:
+        conn.execute(
+            "UPDATE tasks SET completed_at = '2020-01-01T10:00:00' WHERE id = ?", (task_id,)
+        )
+
+    assert find_task("file taxes") is None
+    assert find_task_any("file taxes").id == task_id
+
+
+def test_find_task_folds_non_ascii_case_like_python(tmp_life_dir):
+    upper = add_task("ÉCOLE pickup")
+    add_task("école pickup later")
+
+    assert find_task_exact("ÉCOLE pickup").id == upper
+    assert find_task("école pickup").id == upper
+    with pytest.raises(SystemExit):
+        find_task("éc")
+
+
+def test_find_task_ambiguous_substring_exits(tmp_life_dir):
+    add_task("call mum")
+    add_task("call dad")
+
+    with pytest.raises(SystemExit):
+        find_task("call")